@@ -0,0 +1,124 @@
+"""
+Concurrent browser benchmark for SauceDemo automation.
+Runs the same login -> products -> cart flow on N threads, once with N full
+Chrome sessions and once with N isolated contexts of one shared Chrome, and
+compares start-up time, wall time and memory.
+
+    python -m src.benchmarks.browser_contexts --concurrency 4 --flows 5
+"""
+
+import argparse
+import functools
+import logging
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.drivers.browser_contexts import ContextPool, process_tree_rss
+from src.drivers.driver_factory import create_chrome_driver
+from src.drivers.driver_pool import DriverPool
+from src.drivers.driver_resolver import resolve_chromedriver
+from src.local_app.server import LocalSauceDemo
+from src.pages.cart_page import CartPage
+from src.pages.login_page import LoginPage
+from src.pages.products_page import ProductsPage
+
+
+def cart_flow(driver, base_url):
+    """Log in, add two items and read them back from the cart page."""
+    login_page = LoginPage(driver, base_url=base_url)
+    login_page.load()
+    login_page.login("standard_user", "secret_sauce")
+    products_page = ProductsPage(driver, base_url=base_url)
+    assert products_page.wait_until_ready()
+    products_page.add_items(["Sauce Labs Backpack", "Sauce Labs Onesie"])
+    products_page.go_to_cart()
+    assert len(CartPage(driver, base_url=base_url).get_cart_items()) == 2
+
+
+def browsers_rss(drivers):
+    """Resident memory of every Chrome behind drivers (one process tree each)."""
+    sizes = [process_tree_rss(driver.service.process.pid) for driver in drivers]
+    return None if None in sizes else sum(sizes)
+
+
+def run_concurrent(pool, base_url, concurrency, flows, measure):
+    """
+    Run concurrency threads of flows cart flows each on pool, sampling
+    measure(drivers in use) after every flow.
+    Returns (median session start-up seconds, wall seconds, peak memory bytes).
+    """
+    drivers = []
+    peak = [None]
+
+    def worker():
+        started = time.perf_counter()
+        driver = pool.acquire()
+        startup = time.perf_counter() - started
+        drivers.append(driver)
+        try:
+            for _ in range(flows):
+                cart_flow(driver, base_url)
+                rss = measure(list(drivers))
+                if rss is not None:
+                    peak[0] = max(peak[0] or 0, rss)
+        finally:
+            pool.release(driver)
+        return startup
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as threads:
+        startups = list(threads.map(lambda _: worker(), range(concurrency)))
+    return statistics.median(startups), time.perf_counter() - started, peak[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare N browsers with N contexts")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--flows", type=int, default=5)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    factory = functools.partial(
+        create_chrome_driver,
+        headless=not args.headed,
+        driver_path=resolve_chromedriver(),
+    )
+    with LocalSauceDemo() as app:
+        browsers = DriverPool(factory, size=args.concurrency)
+        try:
+            browser_run = run_concurrent(
+                browsers, app.base_url, args.concurrency, args.flows, browsers_rss
+            )
+        finally:
+            browsers.close()
+        contexts = ContextPool(factory, size=args.concurrency)
+        try:
+            context_run = run_concurrent(
+                contexts,
+                app.base_url,
+                args.concurrency,
+                args.flows,
+                lambda drivers: process_tree_rss(contexts.host.service.process.pid),
+            )
+            summary = contexts.summary()
+        finally:
+            contexts.close()
+
+    print(f"{args.concurrency} concurrent sessions x {args.flows} cart flows")
+    print(f"{'mode':<12} {'start-up':>10} {'wall':>10} {'memory':>12}")
+    for name, (startup, wall, rss) in (
+        ("browsers", browser_run),
+        ("contexts", context_run),
+    ):
+        memory = f"{rss / 2**20:.0f} MiB" if rss else "n/a"
+        print(f"{name:<12} {startup * 1000:>7.0f} ms {wall:>8.1f} s {memory:>12}")
+    if summary["js_heap_median"] is not None:
+        print(
+            f"per context: JS heap {summary['js_heap_median'] / 2**20:.1f} MiB, "
+            f"{summary['dom_nodes_median']:.0f} DOM nodes"
+        )
+
+
+if __name__ == "__main__":
+    main()
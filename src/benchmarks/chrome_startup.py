@@ -0,0 +1,71 @@
+"""
+Chrome startup benchmark for SauceDemo automation.
+Compares session launch times for an empty profile with the default flags,
+an empty profile with FAST_START_ARGS, and clones of a pre-warmed template.
+
+    python -m src.benchmarks.chrome_startup --launches 10
+"""
+
+import argparse
+import functools
+import logging
+import statistics
+import time
+from src.benchmarks.page_ops import percentile
+from src.drivers.driver_factory import create_chrome_driver
+from src.drivers.driver_resolver import resolve_chromedriver
+from src.drivers.profile_template import FAST_START_ARGS, ProfileTemplate
+
+
+def time_launches(factory, launches):
+    """Start and quit launches sessions; return each start-up time in seconds."""
+    timings = []
+    for _ in range(launches):
+        started = time.perf_counter()
+        driver = factory()
+        driver.get("about:blank")
+        timings.append(time.perf_counter() - started)
+        driver.quit()
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare Chrome startup times")
+    parser.add_argument("--launches", type=int, default=8)
+    parser.add_argument("--warm-url", default=None)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    base = functools.partial(
+        create_chrome_driver,
+        headless=not args.headed,
+        driver_path=resolve_chromedriver(),
+    )
+    template = ProfileTemplate(base, warm_url=args.warm_url)
+    template.build()
+    configs = {
+        "empty profile": base,
+        "empty profile + fast flags": functools.partial(
+            base, extra_args=FAST_START_ARGS
+        ),
+        "template clone": template,
+    }
+    try:
+        print(f"template build: {template.build_time * 1000:.0f} ms")
+        print(f"{'configuration':<28} {'median':>10} {'p95':>10}")
+        for name, factory in configs.items():
+            timings = time_launches(factory, args.launches)
+            print(
+                f"{name:<28} {statistics.median(timings) * 1000:>7.0f} ms "
+                f"{percentile(timings, 95) * 1000:>7.0f} ms"
+            )
+        if template.clone_times:
+            clone_ms = statistics.median(template.clone_times) * 1000
+            print(f"(template clone copy median: {clone_ms:.1f} ms)")
+    finally:
+        template.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Page-object benchmarks for SauceDemo automation.
+Times the core page-object operations against the local stand-in, reports
+median/p95 latency and remote-command counts, and fails on regressions
+against an on-disk baseline.
+
+    python -m src.benchmarks.page_ops --iterations 30
+    python -m src.benchmarks.page_ops --update-baseline
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import statistics
+import sys
+import time
+from src.drivers.driver_factory import create_chrome_driver
+from src.drivers.instrumentation import CommandRecorder
+from src.local_app.server import LocalSauceDemo
+from src.pages.cart_page import CartPage
+from src.pages.login_page import LoginPage
+from src.pages.products_page import ProductsPage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = os.path.join(".benchmarks", "page_ops.json")
+DEFAULT_THRESHOLD = 0.25
+USERNAME = "standard_user"
+PASSWORD = "secret_sauce"
+ITEM = "Sauce Labs Backpack"
+CART_ITEMS = ("Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Onesie")
+CLEAR_CART_SCRIPT = "window.localStorage.removeItem('cart-contents');"
+
+
+class PageOpsBench:
+    """One logged-in browser session plus the setup/run pairs being timed."""
+
+    def __init__(self, driver, base_url, cache_elements=False):
+        self.driver = driver
+        pages = {"base_url": base_url, "cache_elements": cache_elements}
+        self.login_page = LoginPage(driver, **pages)
+        self.products_page = ProductsPage(driver, **pages)
+        self.cart_page = CartPage(driver, **pages)
+
+    def operations(self):
+        """Return {name: (setup, run)}; only run is timed."""
+        return {
+            "LoginPage.login": (self._logged_out, self._login),
+            "ProductsPage.add_item_by_name": (
+                self._empty_inventory,
+                lambda: self.products_page.add_item_by_name(ITEM),
+            ),
+            "ProductsPage.get_cart_count": (
+                self._filled_inventory,
+                self.products_page.get_cart_count,
+            ),
+            "CartPage.get_cart_items": (
+                self._filled_cart,
+                self.cart_page.get_cart_items,
+            ),
+            "CartPage.remove_item_by_name": (
+                self._filled_cart,
+                lambda: self.cart_page.remove_item_by_name(ITEM),
+            ),
+        }
+
+    def _login(self):
+        self.login_page.login(USERNAME, PASSWORD)
+
+    def _logged_out(self):
+        self.driver.delete_all_cookies()
+        self.login_page.load()
+
+    def _logged_in(self):
+        if self.driver.get_cookie("session-username") is not None:
+            return
+        self._logged_out()
+        self._login()
+        self.products_page.wait_for_cart_count(0)
+
+    def _empty_inventory(self):
+        self._logged_in()
+        self.driver.execute_script(CLEAR_CART_SCRIPT)
+        self.products_page.load()
+
+    def _filled_inventory(self):
+        self._empty_inventory()
+        self.products_page.add_items(CART_ITEMS)
+
+    def _filled_cart(self):
+        self._filled_inventory()
+        self.products_page.go_to_cart()
+        self.cart_page.get_cart_snapshot()
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of samples (pct in 0..100)."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def run_benchmarks(
+    driver, base_url, iterations=20, warmup=2, only=None, cache_elements=False
+):
+    """
+    Time each operation and return {name: {median, p95, commands, samples}}.
+    :param driver: A fresh WebDriver session (it is instrumented while running)
+    :param base_url: Root URL of the app under test
+    :param iterations: Timed runs per operation
+    :param warmup: Untimed runs per operation before timing
+    :param only: Optional iterable of operation names to run
+    :param cache_elements: Run the page objects with element handle caching
+    """
+    bench = PageOpsBench(driver, base_url, cache_elements)
+    recorder = CommandRecorder().attach(driver)
+    results = {}
+    try:
+        for name, (setup, run) in bench.operations().items():
+            if only and name not in only:
+                continue
+            timings, commands = [], []
+            for i in range(warmup + iterations):
+                setup()
+                before = len(recorder.records)
+                started = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - started
+                if i >= warmup:
+                    timings.append(elapsed)
+                    commands.append(len(recorder.records) - before)
+            results[name] = {
+                "median": round(statistics.median(timings), 6),
+                "p95": round(percentile(timings, 95), 6),
+                "commands": max(commands),
+                "samples": len(timings),
+            }
+            logger.info(
+                f"[Bench] {name}: median {results[name]['median'] * 1000:.1f} ms, "
+                f"p95 {results[name]['p95'] * 1000:.1f} ms, "
+                f"{results[name]['commands']} commands"
+            )
+    finally:
+        recorder.detach()
+    return results
+
+
+def load_baseline(path):
+    """Return the stored {name: result} baseline, or {} if there is none."""
+    try:
+        with open(path) as f:
+            return json.load(f).get("operations", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(path, results):
+    """Write results as the new baseline (atomic replace)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"operations": results}, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Return (timing, command) lists of regression messages. An operation
+    regresses when its median is more than threshold slower than the
+    baseline, or when it sends more remote commands than the baseline did.
+    """
+    slower, commands = [], []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        limit = base["median"] * (1 + threshold)
+        if result["median"] > limit:
+            slower.append(
+                f"{name}: median {result['median'] * 1000:.1f} ms exceeds "
+                f"baseline {base['median'] * 1000:.1f} ms by more than {threshold:.0%}"
+            )
+        if result["commands"] > base["commands"]:
+            commands.append(
+                f"{name}: {result['commands']} remote commands, "
+                f"baseline {base['commands']}"
+            )
+    return slower, commands
+
+
+def format_table(results, baseline):
+    """Render results (and baseline medians, where known) as a text table."""
+    lines = [
+        f"{'operation':<32} {'median':>10} {'p95':>10} {'cmds':>5} {'baseline':>10}"
+    ]
+    for name, r in results.items():
+        base = baseline.get(name)
+        base_median = f"{base['median'] * 1000:.1f} ms" if base else "-"
+        lines.append(
+            f"{name:<32} {r['median'] * 1000:>7.1f} ms {r['p95'] * 1000:>7.1f} ms "
+            f"{r['commands']:>5} {base_median:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark page-object operations")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed median slowdown as a fraction (default: 0.25)",
+    )
+    parser.add_argument(
+        "--commands-only",
+        action="store_true",
+        help="Only fail on command-count regressions; report slower timings",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the baseline instead of comparing against it",
+    )
+    parser.add_argument(
+        "--operation",
+        action="append",
+        dest="only",
+        help="Only run this operation (repeatable), e.g. LoginPage.login",
+    )
+    parser.add_argument(
+        "--cache-elements",
+        action="store_true",
+        help="Enable the page objects' element handle cache",
+    )
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    with LocalSauceDemo() as app:
+        driver = create_chrome_driver(headless=not args.headed)
+        try:
+            results = run_benchmarks(
+                driver,
+                app.base_url,
+                args.iterations,
+                args.warmup,
+                args.only,
+                args.cache_elements,
+            )
+        finally:
+            driver.quit()
+
+    baseline = load_baseline(args.baseline)
+    print(format_table(results, baseline))
+    if args.update_baseline or not baseline:
+        save_baseline(args.baseline, dict(baseline, **results))
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    slower, commands = compare(results, baseline, args.threshold)
+    regressions = commands if args.commands_only else slower + commands
+    for message in slower + commands:
+        print(f"{'REGRESSION' if message in regressions else 'SLOWER'} {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""
+Isolated browser contexts for SauceDemo automation.
+One Chrome process hosts many browser contexts (each with its own cookies,
+storage and cache) created over CDP. Each context is driven by a lightweight
+WebDriver session attached to the shared browser, so N concurrent tests cost
+N tabs instead of N browsers. Under xdist the controller launches that
+Chrome and every worker's pool attaches to it through its browser_address().
+"""
+
+import logging
+import os
+import queue
+import statistics
+import threading
+import time
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from .driver_factory import RemoteChrome
+from .network_blocking import forget_network_state
+
+logger = logging.getLogger(__name__)
+
+# Performance.getMetrics entries kept as the context's memory footprint.
+MEMORY_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "Documents")
+
+
+class ContextDriver(RemoteChrome):
+    """WebDriver session attached to a shared Chrome; quitting leaves it running."""
+
+    def __init__(self, executor_url, debugger_address, page_load_strategy=None):
+        options = Options()
+        options.debugger_address = debugger_address
+        if page_load_strategy:
+            options.page_load_strategy = page_load_strategy
+        super().__init__(executor_url, options)
+        self.browser_context_id = None
+
+
+def browser_address(host):
+    """
+    Return what another process needs to attach to host's Chrome, as plain
+    JSON-serialisable values: {executor_url, debugger_address,
+    page_load_strategy, pid}, where pid is chromedriver's (Chrome is its child).
+    """
+    return {
+        "executor_url": host.service.service_url,
+        "debugger_address": host.caps["goog:chromeOptions"]["debuggerAddress"],
+        "page_load_strategy": host.caps.get("pageLoadStrategy"),
+        "pid": host.service.process.pid,
+    }
+
+
+def process_tree_rss(pid):
+    """Resident memory in bytes of pid and all its descendants (Linux only)."""
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces; fields resume after ')'.
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, ()))
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
+
+
+class ContextPool:
+    """DriverPool-compatible pool handing out a fresh browser context per acquire."""
+
+    def __init__(self, factory, size=4, switch_timeout=5, address=None):
+        """
+        Initialize the pool (Chrome starts on first acquire).
+        :param factory: Callable returning the WebDriver session that owns Chrome
+        :param size: Maximum number of contexts in use at once
+        :param switch_timeout: Seconds to wait for a new tab to become a window handle
+        :param address: browser_address() of a Chrome another process owns; the
+            pool attaches to it instead of calling factory, and never quits it
+        """
+        self._factory = factory
+        self.size = size
+        self.switch_timeout = switch_timeout
+        self.address = address
+        self._host = None
+        self._host_lock = threading.Lock()
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._sessions = []
+        self._creating = 0
+        self._in_use = 0
+        self.peak_in_use = 0
+        self.contexts_created = 0
+        self.context_setup_times = []
+        self.footprints = []
+        self.browser_rss = None
+        self.browser_rss_contexts = None
+
+    @property
+    def host(self):
+        """The session issuing CDP commands to the shared Chrome, started on first use."""
+        return self._start()
+
+    def acquire(self, timeout=None):
+        """Return a session switched to a new, empty browser context."""
+        session = self._take(timeout)
+        started = time.perf_counter()
+        context_id = None
+        try:
+            context_id = self._host_cdp(
+                "Target.createBrowserContext", {"disposeOnDetach": False}
+            )["browserContextId"]
+            target_id = self._host_cdp(
+                "Target.createTarget",
+                {"url": "about:blank", "browserContextId": context_id},
+            )["targetId"]
+            self._switch(session, target_id)
+            session.browser_context_id = context_id
+            session.execute_cdp_cmd("Performance.enable", {})
+        except Exception:
+            session.browser_context_id = None
+            if context_id is not None:
+                self._dispose(context_id)
+            self._idle.put(session)
+            raise
+        with self._lock:
+            self._in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self._in_use)
+            self.contexts_created += 1
+            self.context_setup_times.append(time.perf_counter() - started)
+        return session
+
+    def release(self, driver):
+        """Record the context's memory footprint, dispose of it and reuse the session."""
+        context_id = driver.browser_context_id
+        if context_id is None:
+            return
+        footprint = self.footprint(driver)
+        if footprint is not None:
+            self.footprints.append(footprint)
+        with self._lock:
+            at_peak = self._in_use == self.peak_in_use
+            self._in_use -= 1
+        if at_peak:
+            # Sampled while the other contexts (of every attached pool) are open.
+            self._sample_rss()
+        driver.browser_context_id = None
+        forget_network_state(driver)
+        self._dispose(context_id)
+        self._idle.put(driver)
+
+    def footprint(self, driver):
+        """Return the current tab's MEMORY_METRICS, or None if unavailable."""
+        try:
+            metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        except WebDriverException:
+            return None
+        values = {metric["name"]: metric["value"] for metric in metrics}
+        return {name: values[name] for name in MEMORY_METRICS if name in values}
+
+    def summary(self):
+        """Return context counts, setup latency and memory per context."""
+        heap = [f["JSHeapUsedSize"] for f in self.footprints if "JSHeapUsedSize" in f]
+        nodes = [f["Nodes"] for f in self.footprints if "Nodes" in f]
+        return {
+            "contexts": self.contexts_created,
+            "peak_concurrent": self.peak_in_use,
+            "setup_median": (
+                statistics.median(self.context_setup_times)
+                if self.context_setup_times
+                else None
+            ),
+            "js_heap_median": statistics.median(heap) if heap else None,
+            "dom_nodes_median": statistics.median(nodes) if nodes else None,
+            "browser_rss": self.browser_rss,
+            "browser_rss_per_context": (
+                self.browser_rss / self.browser_rss_contexts
+                if self.browser_rss and self.browser_rss_contexts
+                else None
+            ),
+        }
+
+    def close(self):
+        """Detach every session and quit the shared Chrome if this pool launched it."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            forget_network_state(session)
+            try:
+                session.quit()
+            except WebDriverException:
+                pass
+        with self._host_lock:
+            host, self._host = self._host, None
+        if host is not None:
+            host.quit()
+
+    def _start(self):
+        with self._host_lock:
+            if self._host is None:
+                if self.address is None:
+                    self._host = self._factory()
+                    self.address = browser_address(self._host)
+                else:
+                    self._host = self._attach()
+            return self._host
+
+    def _attach(self):
+        return ContextDriver(
+            self.address["executor_url"],
+            self.address["debugger_address"],
+            self.address["page_load_strategy"],
+        )
+
+    def _sample_rss(self):
+        rss = process_tree_rss(self.address["pid"])
+        if rss is None or rss <= (self.browser_rss or 0):
+            return
+        try:
+            contexts = self._host_cdp("Target.getBrowserContexts", {})
+        except WebDriverException:
+            return
+        self.browser_rss = rss
+        self.browser_rss_contexts = len(contexts["browserContextIds"])
+
+    def _dispose(self, context_id):
+        try:
+            self._host_cdp(
+                "Target.disposeBrowserContext", {"browserContextId": context_id}
+            )
+        except WebDriverException as e:
+            logger.warning(f"[ContextPool] Could not dispose context {context_id}: {e}")
+
+    def _host_cdp(self, cmd, params):
+        host = self.host
+        with self._host_lock:
+            return host.execute_cdp_cmd(cmd, params)
+
+    def _switch(self, session, target_id):
+        # The new tab shows up as a window handle once chromedriver sees it.
+        deadline = time.monotonic() + self.switch_timeout
+        while True:
+            try:
+                session.switch_to.window(target_id)
+                return
+            except NoSuchWindowException:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def _take(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            launch = len(self._sessions) + self._creating < self.size
+            if launch:
+                self._creating += 1
+        if not launch:
+            return self._idle.get(timeout=timeout)
+        try:
+            self._start()
+            session = self._attach()
+        finally:
+            with self._lock:
+                self._creating -= 1
+        with self._lock:
+            self._sessions.append(session)
+        return session
@@ -0,0 +1,264 @@
+"""
+Warm-browser daemon for SauceDemo automation.
+A long-lived process keeps a DriverPool of logged-out Chrome sessions and
+lends them over a local Unix socket, so a single local test run skips
+chromedriver resolution and browser startup.
+
+    python -m src.drivers.browser_daemon serve --size 2
+    pytest tests/01-login/test_login.py::test_login_valid --browser-daemon
+    python -m src.drivers.browser_daemon stop
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from .driver_factory import PAGE_LOAD_STRATEGY, RemoteChrome, create_chrome_driver
+from .driver_pool import DriverPool, app_origin, clear_origin_storage
+from .driver_resolver import resolve_chromedriver
+from .network_blocking import forget_network_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = os.getenv(
+    "BROWSER_DAEMON_SOCKET",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "saucedemo-automation", "browser-daemon.sock"
+    ),
+)
+# Seconds a client waits for a free browser before the daemon gives up.
+ACQUIRE_TIMEOUT = 60
+
+
+class AttachedDriver(RemoteChrome):
+    """WebDriver client for a session owned by the daemon (never quit it)."""
+
+    def __init__(self, executor_url, session_id, capabilities):
+        self._attach_to = (session_id, capabilities)
+        super().__init__(executor_url, Options())
+
+    def start_session(self, capabilities):
+        # Adopt the daemon's session instead of creating a new one.
+        self.session_id, self.caps = self._attach_to
+
+
+def _send(sock_file, message):
+    sock_file.write(json.dumps(message).encode() + b"\n")
+    sock_file.flush()
+
+
+def _receive(sock_file):
+    line = sock_file.readline()
+    if not line:
+        raise ConnectionError("Browser daemon closed the connection")
+    return json.loads(line)
+
+
+class _LeaseHandler(socketserver.StreamRequestHandler):
+    """One client connection; a browser it leased is returned when it closes."""
+
+    def handle(self):
+        daemon = self.server.browser_daemon
+        leased = None
+        try:
+            for line in self.rfile:
+                request = json.loads(line)
+                op = request.get("op")
+                if op == "acquire" and leased is None:
+                    leased = daemon.pool.acquire(timeout=ACQUIRE_TIMEOUT)
+                    _send(
+                        self.wfile,
+                        {
+                            "ok": True,
+                            "executor_url": leased.service.service_url,
+                            "session_id": leased.session_id,
+                            "capabilities": leased.caps,
+                        },
+                    )
+                elif op == "release" and leased is not None:
+                    # Reply first: the reset runs while the client moves on.
+                    _send(self.wfile, {"ok": True})
+                    daemon.pool.release(leased)
+                    leased = None
+                elif op == "status":
+                    _send(self.wfile, dict(daemon.status(), ok=True))
+                elif op == "shutdown":
+                    _send(self.wfile, {"ok": True})
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                else:
+                    _send(self.wfile, {"ok": False, "error": f"Unexpected {op!r}"})
+        except Exception as e:
+            logger.warning(f"[BrowserDaemon] Client error: {e}")
+            try:
+                _send(self.wfile, {"ok": False, "error": str(e)})
+            except OSError:
+                pass
+        finally:
+            if leased is not None:
+                daemon.pool.release(leased)
+
+
+class BrowserDaemon:
+    """Serves a DriverPool's sessions on a Unix socket."""
+
+    def __init__(self, pool, path=DEFAULT_SOCKET):
+        """
+        Initialize the daemon (not started).
+        :param pool: DriverPool owning the browsers
+        :param path: Unix socket path clients connect to
+        """
+        self.pool = pool
+        self.path = path
+        self._server = None
+
+    def status(self):
+        return {"size": self.pool.size, "socket": self.path}
+
+    def prewarm(self):
+        """Launch every browser up front so the first client does not wait."""
+        drivers = [self.pool.acquire() for _ in range(self.pool.size)]
+        for driver in drivers:
+            self.pool.release(driver)
+
+    def serve_forever(self):
+        """Listen until a client sends 'shutdown', then quit every browser."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if os.path.exists(self.path):
+            if is_running(self.path):
+                raise RuntimeError(
+                    f"A browser daemon is already running at {self.path}"
+                )
+            os.remove(self.path)
+        self._server = socketserver.ThreadingUnixStreamServer(self.path, _LeaseHandler)
+        self._server.daemon_threads = True
+        self._server.browser_daemon = self
+        logger.info(f"[BrowserDaemon] Serving {self.pool.size} browsers on {self.path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.pool.close()
+
+
+def request(path, op):
+    """Send one op to the daemon at path and return its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock_file = sock.makefile("rwb")
+        _send(sock_file, {"op": op})
+        return _receive(sock_file)
+
+
+def is_running(path=DEFAULT_SOCKET):
+    """Return True if a daemon answers on path."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return False
+    try:
+        return request(path, "status").get("ok", False)
+    except (OSError, ValueError):
+        return False
+
+
+class DaemonPool:
+    """DriverPool-compatible client that borrows browsers from the daemon."""
+
+    def __init__(self, path=DEFAULT_SOCKET, origins=()):
+        """
+        :param path: The daemon's Unix socket
+        :param origins: App URLs whose storage is cleared before a lease ends
+            (only this client knows which app its tests used)
+        """
+        self.path = path
+        self.origins = tuple(app_origin(origin) for origin in origins)
+        self._leases = {}
+
+    def acquire(self, timeout=None):
+        """Lease a warm browser; the connection stays open for the lease."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout or ACQUIRE_TIMEOUT + 5)
+        sock.connect(self.path)
+        sock_file = sock.makefile("rwb")
+        _send(sock_file, {"op": "acquire"})
+        reply = _receive(sock_file)
+        if not reply.get("ok"):
+            sock.close()
+            raise RuntimeError(f"Browser daemon refused: {reply.get('error')}")
+        driver = AttachedDriver(
+            reply["executor_url"], reply["session_id"], reply["capabilities"]
+        )
+        self._leases[id(driver)] = (sock, sock_file)
+        return driver
+
+    def release(self, driver):
+        """Hand the browser back; the daemon resets it to a clean state."""
+        forget_network_state(driver)
+        sock, sock_file = self._leases.pop(id(driver))
+        try:
+            clear_origin_storage(driver, self.origins)
+        except WebDriverException as e:
+            logger.warning(f"[DaemonPool] Could not clear app storage: {e}")
+        try:
+            _send(sock_file, {"op": "release"})
+            _receive(sock_file)
+        except (OSError, ConnectionError):
+            pass
+        finally:
+            sock.close()
+
+    def close(self):
+        """Return any browsers still leased (closing the socket releases them)."""
+        for sock, _ in self._leases.values():
+            sock.close()
+        self._leases.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm-browser daemon")
+    parser.add_argument("command", choices=("serve", "status", "stop"))
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    parser.add_argument("--size", type=int, default=2)
+    parser.add_argument("--max-uses", type=int, default=200)
+    parser.add_argument(
+        "--page-load-strategy",
+        choices=("normal", "eager", "none"),
+        default=PAGE_LOAD_STRATEGY,
+    )
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == "status":
+        if not is_running(args.socket):
+            print(f"No browser daemon at {args.socket}")
+            return 1
+        print(request(args.socket, "status"))
+        return 0
+    if args.command == "stop":
+        if is_running(args.socket):
+            request(args.socket, "shutdown")
+        return 0
+
+    factory = functools.partial(
+        create_chrome_driver,
+        headless=not args.headed,
+        driver_path=resolve_chromedriver(),
+        page_load_strategy=args.page_load_strategy,
+    )
+    pool = DriverPool(factory, size=args.size, max_uses=args.max_uses)
+    daemon = BrowserDaemon(pool, args.socket)
+    daemon.prewarm()
+    daemon.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
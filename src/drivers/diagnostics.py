@@ -0,0 +1,129 @@
+"""
+Failure diagnostics for SauceDemo automation.
+Captures what a browser is showing (screenshot, DOM, console, cookies and
+storage) and writes it compressed on background threads within a size cap.
+"""
+
+import concurrent.futures
+import gzip
+import json
+import logging
+import os
+import threading
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+STORAGE_SCRIPT = """
+function dump(name) {
+    var data = {};
+    try {
+        var storage = window[name];
+        for (var i = 0; i < storage.length; i++) {
+            var key = storage.key(i);
+            data[key] = storage.getItem(key);
+        }
+    } catch (e) {}
+    return data;
+}
+return {
+    url: location.href,
+    localStorage: dump("localStorage"),
+    sessionStorage: dump("sessionStorage")
+};
+"""
+
+# Already compressed; written as captured.
+UNCOMPRESSED_SUFFIXES = (".png",)
+
+
+def _json(value):
+    return json.dumps(value, indent=1, sort_keys=True, default=str).encode()
+
+
+def capture(driver):
+    """
+    Read the browser's diagnostics. Returns {filename: bytes}, smallest and most
+    useful first; anything the browser cannot provide is left out.
+    """
+    readers = (
+        (
+            "state.json",
+            lambda: _json(
+                dict(
+                    driver.execute_script(STORAGE_SCRIPT), cookies=driver.get_cookies()
+                )
+            ),
+        ),
+        ("console.json", lambda: _json(driver.get_log("browser"))),
+        ("screenshot.png", driver.get_screenshot_as_png),
+        ("page_source.html", lambda: driver.page_source.encode()),
+    )
+    artifacts = {}
+    for filename, read in readers:
+        try:
+            artifacts[filename] = read()
+        except WebDriverException as e:
+            logger.warning(f"[capture] Could not read {filename}: {e.msg}")
+    return artifacts
+
+
+class ArtifactWriter:
+    """Compresses and writes artifacts on a thread pool, up to max_bytes in total."""
+
+    def __init__(self, root, max_bytes, workers=2):
+        """
+        Initialize the writer.
+        :param root: Directory the artifacts are written under
+        :param max_bytes: Total size budget; artifacts that do not fit are dropped
+        :param workers: Background threads compressing and writing
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.reserved = 0
+        self.written = 0
+        self.files = 0
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="diagnostics"
+        )
+
+    def submit(self, name, artifacts):
+        """
+        Queue artifacts ({filename: bytes}) for writing under root/name and
+        return {filename: path} for those that fit the budget. A file's raw
+        size is reserved until it is compressed, so the cap always holds.
+        """
+        accepted = {}
+        queued = []
+        with self._lock:
+            for filename, data in artifacts.items():
+                if self.reserved + len(data) > self.max_bytes:
+                    continue
+                self.reserved += len(data)
+                if not filename.endswith(UNCOMPRESSED_SUFFIXES):
+                    filename += ".gz"
+                accepted[filename] = os.path.join(self.root, name, filename)
+                queued.append((accepted[filename], data))
+        for path, data in queued:
+            self._executor.submit(self._write, path, data)
+        return accepted
+
+    def _write(self, path, data):
+        output = data if path.endswith(UNCOMPRESSED_SUFFIXES) else gzip.compress(data)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(output)
+        except OSError as e:
+            logger.warning(f"[ArtifactWriter] Could not write {path}: {e}")
+            output = b""
+        with self._lock:
+            self.reserved -= max(len(data) - len(output), 0)
+            if output:
+                self.written += len(output)
+                self.files += 1
+
+    def close(self):
+        """Wait for pending writes to finish."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,120 @@
+"""
+WebDriver factory for SauceDemo automation.
+Builds configured Chrome sessions, local or on a remote end, for the test
+fixtures and driver pools.
+"""
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.command import Command
+from .driver_resolver import resolve_chromedriver
+
+# Page objects wait explicitly; an implicit wait would stack on every lookup
+# that is expected to miss (is_present, the ignored misses inside a WebDriverWait).
+IMPLICIT_WAIT = 0
+# Return from get() once the DOM is parsed; page objects wait for their own
+# readiness predicate instead of every image and font.
+PAGE_LOAD_STRATEGY = "eager"
+
+
+def chrome_options(
+    headless=True,
+    network_log=False,
+    page_load_strategy=PAGE_LOAD_STRATEGY,
+    user_data_dir=None,
+    extra_args=(),
+):
+    """Return the Chrome options shared by every session."""
+    options = Options()
+    options.page_load_strategy = page_load_strategy
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+    for arg in extra_args:
+        options.add_argument(arg)
+    if network_log:
+        # Network events only, read back through driver.get_log("performance").
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option(
+            "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+        )
+    return options
+
+
+def create_chrome_driver(
+    headless=True,
+    driver_path=None,
+    network_log=False,
+    page_load_strategy=PAGE_LOAD_STRATEGY,
+    user_data_dir=None,
+    extra_args=(),
+):
+    """
+    Launch a new Chrome session.
+    :param headless: Run Chrome without a visible window
+    :param driver_path: Path to a chromedriver binary (resolved if omitted)
+    :param network_log: Record network events in the performance log
+    :param page_load_strategy: 'normal', 'eager' or 'none'
+    :param user_data_dir: Profile directory to run on (a fresh temp one if omitted)
+    :param extra_args: Additional Chrome command-line flags
+    """
+    service = ChromeService(driver_path or resolve_chromedriver())
+    options = chrome_options(
+        headless, network_log, page_load_strategy, user_data_dir, extra_args
+    )
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    return driver
+
+
+class RemoteChrome(webdriver.Remote):
+    """
+    Chrome session behind a remote end (Selenium Grid, a standalone server or
+    a shared chromedriver) over a keep-alive connection, with the CDP and log
+    commands local Chrome sessions have.
+    """
+
+    def __init__(self, command_executor, options):
+        executor = ChromiumRemoteConnection(
+            command_executor,
+            vendor_prefix="goog",
+            browser_name="chrome",
+            keep_alive=True,
+        )
+        super().__init__(command_executor=executor, options=options)
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        """Send a CDP command to the session's current tab."""
+        response = self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})
+        return response["value"]
+
+    def get_log(self, log_type):
+        return self.execute(Command.GET_LOG, {"type": log_type})["value"]
+
+
+def create_remote_driver(
+    url,
+    headless=True,
+    network_log=False,
+    page_load_strategy=PAGE_LOAD_STRATEGY,
+    extra_args=(),
+):
+    """
+    Start a Chrome session on a Selenium Grid or standalone server.
+    :param url: Remote end URL, e.g. 'http://localhost:4444'
+    :param headless: Run Chrome without a visible window
+    :param network_log: Record network events in the performance log
+    :param page_load_strategy: 'normal', 'eager' or 'none'
+    :param extra_args: Additional Chrome command-line flags
+    """
+    options = chrome_options(
+        headless, network_log, page_load_strategy, extra_args=extra_args
+    )
+    driver = RemoteChrome(url, options)
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    return driver
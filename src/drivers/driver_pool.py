@@ -0,0 +1,214 @@
+"""
+Warm WebDriver pool for SauceDemo automation.
+Hands out recycled browser sessions and resets them cheaply between tests.
+"""
+
+import functools
+import logging
+import queue
+import threading
+import time
+from urllib.parse import urlsplit
+from .network_blocking import forget_network_state
+
+logger = logging.getLogger(__name__)
+
+RESET_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+STORAGE_TYPES = "local_storage,session_storage"
+
+
+def app_origin(url):
+    """Return the scheme://host[:port] origin of url."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def clear_origin_storage(driver, origins):
+    """
+    Clear web storage for each origin, whatever document driver is showing.
+    RESET_SCRIPT alone only reaches the current document's origin, so a test
+    ending elsewhere (or on about:blank) would leave the app's cart behind.
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        for origin in origins:
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": STORAGE_TYPES},
+            )
+        return
+    for origin in origins:
+        driver.get(origin + "/")
+        driver.execute_script(RESET_SCRIPT)
+
+
+def call_with_timeout(fn, timeout):
+    """
+    Run fn in a daemon thread and return its result.
+    Raises TimeoutError if fn does not finish in time (e.g. a wedged session).
+    """
+    result = {}
+
+    def target():
+        try:
+            result["value"] = fn()
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"Call did not complete within {timeout}s")
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+
+class DriverPool:
+    """Pool of warm WebDriver sessions, reset and health checked on release."""
+
+    def __init__(
+        self,
+        factory,
+        size=1,
+        max_uses=50,
+        health_timeout=5,
+        idle_check=60,
+        origins=(),
+    ):
+        """
+        Initialize the pool.
+        :param factory: Callable returning a new WebDriver session
+        :param size: Maximum number of live sessions
+        :param max_uses: Recycle a session after this many tests
+        :param health_timeout: Seconds before a reset/health check counts as wedged
+        :param idle_check: Health check sessions idle for longer than this on acquire
+        :param origins: App URLs (or origins) whose storage is cleared on reset
+        """
+        self._factory = factory
+        self.origins = tuple(app_origin(origin) for origin in origins)
+        self.size = size
+        self.max_uses = max_uses
+        self.health_timeout = health_timeout
+        self.idle_check = idle_check
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._drivers = {}
+        self._closed = False
+
+    def acquire(self, timeout=None):
+        """Return a clean, healthy driver, launching one if the pool has room."""
+        while True:
+            driver = self._take(timeout)
+            stats = self._drivers.get(id(driver))
+            idle_for = time.monotonic() - stats["released_at"] if stats else 0
+            if idle_for < self.idle_check or self._is_healthy(driver):
+                return driver
+            logger.warning("[DriverPool] Idle session failed health check, replacing")
+            self._discard(driver)
+
+    def release(self, driver):
+        """Reset a driver and return it to the pool, or replace it if unusable."""
+        stats = self._drivers.get(id(driver))
+        if stats is None:
+            return
+        stats["uses"] += 1
+        if self._closed or stats["uses"] >= self.max_uses:
+            self._discard(driver)
+            return
+        try:
+            call_with_timeout(
+                functools.partial(self.reset, driver), self.health_timeout
+            )
+        except Exception as e:
+            logger.warning(f"[DriverPool] Reset failed, replacing session: {e}")
+            self._discard(driver)
+            return
+        stats["released_at"] = time.monotonic()
+        self._idle.put(driver)
+
+    def reset(self, driver):
+        """
+        Clear cookies, storage (of the current document and of every origin in
+        origins) and any blocked-URL list, close extra windows and go to
+        about:blank.
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        if len(handles) > 1:
+            driver.switch_to.window(handles[0])
+        driver.execute_script(RESET_SCRIPT)
+        clear_origin_storage(driver, self.origins)
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            # Blocking outlives the client that set it (daemon sessions are
+            # reused by later runs), so the next user starts unblocked.
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            forget_network_state(driver)
+        else:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def close(self):
+        """Quit every session owned by the pool."""
+        self._closed = True
+        with self._lock:
+            drivers = [entry["driver"] for entry in self._drivers.values() if entry]
+            self._drivers.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    def _take(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            launch = len(self._drivers) < self.size
+            if launch:
+                placeholder = object()
+                self._drivers[id(placeholder)] = None
+        if not launch:
+            return self._idle.get(timeout=timeout)
+        driver = None
+        try:
+            driver = self._factory()
+        finally:
+            with self._lock:
+                del self._drivers[id(placeholder)]
+                if driver is not None:
+                    self._drivers[id(driver)] = {
+                        "driver": driver,
+                        "uses": 0,
+                        "released_at": time.monotonic(),
+                    }
+        return driver
+
+    def _is_healthy(self, driver):
+        try:
+            probe = functools.partial(driver.execute_script, "return 1")
+            return call_with_timeout(probe, self.health_timeout) == 1
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        with self._lock:
+            self._drivers.pop(id(driver), None)
+        self._quit(driver)
+
+    def _quit(self, driver):
+        forget_network_state(driver)
+        try:
+            call_with_timeout(driver.quit, self.health_timeout)
+        except Exception as e:
+            logger.warning(f"[DriverPool] Error while quitting session: {e}")
+        # Factories holding per-session resources (e.g. ProfileTemplate's
+        # profile clones) free them here rather than when driver is collected.
+        release = getattr(self._factory, "release", None)
+        if release is not None:
+            release(driver)
@@ -0,0 +1,134 @@
+"""
+Chromedriver binary resolution for SauceDemo automation.
+Resolves a chromedriver matching the installed Chrome once, pins it in an
+on-disk cache keyed by Chrome version and works offline once populated.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "saucedemo-automation", "chromedriver.json"
+)
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+
+def find_chrome_binary():
+    """Return the path of the installed Chrome/Chromium binary, or None."""
+    candidates = [os.getenv("CHROME_BINARY")] + CHROME_BINARIES
+    for candidate in filter(None, candidates):
+        path = shutil.which(candidate) or (
+            candidate if os.path.isfile(candidate) else None
+        )
+        if path:
+            return path
+    return None
+
+
+def detect_chrome_version(binary=None):
+    """Return the installed Chrome version string (e.g. '126.0.6478.126'), or None."""
+    binary = binary or find_chrome_binary()
+    if not binary:
+        return None
+    try:
+        output = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"(\d+)\.(\d+)\.(\d+)\.(\d+)", output)
+    return match.group(0) if match else None
+
+
+class DriverCache:
+    """On-disk map of Chrome version to chromedriver path."""
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv("CHROMEDRIVER_CACHE", CACHE_FILE)
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, chrome_version):
+        """Return a cached driver path for the exact or same-major Chrome version."""
+        entries = self.load()
+        keys = [chrome_version, _major(chrome_version)]
+        for key in filter(None, keys):
+            path = entries.get(key)
+            if path and os.access(path, os.X_OK):
+                return path
+        return None
+
+    def put(self, chrome_version, driver_path):
+        """Pin driver_path for chrome_version (written atomically)."""
+        entries = self.load()
+        entries[chrome_version] = driver_path
+        entries[_major(chrome_version)] = driver_path
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def _major(chrome_version):
+    return chrome_version.split(".")[0] if chrome_version else None
+
+
+def resolve_chromedriver(cache=None, offline=None):
+    """
+    Return a chromedriver path for the installed Chrome.
+    Order: CHROMEDRIVER_PATH, the version cache, webdriver-manager (skipped when
+    offline), then a chromedriver on PATH. The cache is only used when Chrome's
+    version is known, so a driver pinned for an older Chrome is never reused.
+    :param cache: DriverCache instance (default cache file if omitted)
+    :param offline: Never touch the network (default: CHROMEDRIVER_OFFLINE env)
+    """
+    explicit = os.getenv("CHROMEDRIVER_PATH")
+    if explicit:
+        return explicit
+    if offline is None:
+        offline = os.getenv("CHROMEDRIVER_OFFLINE", "").lower() in ("1", "true", "yes")
+    cache = cache or DriverCache()
+    chrome_version = detect_chrome_version()
+    cached = cache.get(chrome_version) if chrome_version else None
+    if cached:
+        logger.info(f"[resolve_chromedriver] Using cached driver: {cached}")
+        return cached
+    if not offline:
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            path = ChromeDriverManager().install()
+            if chrome_version:
+                cache.put(chrome_version, path)
+            logger.info(f"[resolve_chromedriver] Installed driver: {path}")
+            return path
+        except Exception as e:
+            logger.warning(f"[resolve_chromedriver] webdriver-manager failed: {e}")
+    path = shutil.which("chromedriver")
+    if path:
+        logger.info(f"[resolve_chromedriver] Using chromedriver from PATH: {path}")
+        return path
+    raise RuntimeError(
+        f"No chromedriver found for Chrome {chrome_version or '(version unknown)'}: "
+        "cache is empty, download is unavailable and none is on PATH"
+    )
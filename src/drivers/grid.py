@@ -0,0 +1,110 @@
+"""
+Selenium Grid execution for SauceDemo automation.
+Sizes a pool of reusable remote sessions from the Grid's Chrome slots and
+re-queues new-session requests that fail because the Grid or a node did.
+"""
+
+import json
+import logging
+import time
+import urllib.request
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+from .driver_pool import DriverPool
+
+logger = logging.getLogger(__name__)
+
+NEW_SESSION_ATTEMPTS = 3
+# Seconds before the first retry; doubled for each further one.
+RETRY_BACKOFF = 2.0
+# The Grid kills sessions idle for longer than its session timeout (300s by
+# default), so anything idle this long is health checked before reuse.
+REMOTE_IDLE_CHECK = 30
+
+
+def grid_status(url, timeout=5):
+    """Return the 'value' of the remote end's /status response."""
+    with urllib.request.urlopen(url.rstrip("/") + "/status", timeout=timeout) as f:
+        return json.load(f)["value"]
+
+
+def browser_slots(status, browser_name="chrome"):
+    """Return (total, free) slots for browser_name on nodes that are UP."""
+    total = free = 0
+    for node in status.get("nodes", ()):
+        if node.get("availability", "UP") != "UP":
+            continue
+        for slot in node.get("slots", ()):
+            if slot.get("stereotype", {}).get("browserName") != browser_name:
+                continue
+            total += 1
+            if not slot.get("session"):
+                free += 1
+    return total, free
+
+
+class RetryingFactory:
+    """Session factory that re-queues a failed new-session request with backoff."""
+
+    def __init__(self, factory, attempts=NEW_SESSION_ATTEMPTS, backoff=RETRY_BACKOFF):
+        self._factory = factory
+        self.attempts = attempts
+        self.backoff = backoff
+        self.retries = 0
+
+    def __call__(self):
+        delay = self.backoff
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return self._factory()
+            except (WebDriverException, HTTPError, OSError) as e:
+                if attempt == self.attempts:
+                    raise
+                self.retries += 1
+                logger.warning(
+                    f"[GridPool] New session failed ({type(e).__name__}), "
+                    f"retrying in {delay:.0f}s"
+                )
+                time.sleep(delay)
+                delay *= 2
+
+
+class GridPool(DriverPool):
+    """DriverPool of remote sessions, one per Grid slot this worker may use."""
+
+    def __init__(
+        self,
+        url,
+        factory,
+        workers=1,
+        max_uses=50,
+        idle_check=REMOTE_IDLE_CHECK,
+        origins=(),
+    ):
+        """
+        Initialize the pool from the Grid's current slots.
+        Raises RuntimeError if no node offers a Chrome slot.
+        :param url: Grid or standalone server URL
+        :param factory: Callable starting one remote session (e.g. create_remote_driver)
+        :param workers: Processes sharing the Grid; each gets an equal share of slots
+        :param max_uses: Recycle a session after this many tests
+        :param idle_check: Health check sessions idle for longer than this on acquire
+        :param origins: App URLs whose storage is cleared between tests
+        """
+        total, free = browser_slots(grid_status(url))
+        if not total:
+            raise RuntimeError(f"No Chrome slots on the Grid at {url}")
+        self.url = url
+        self.slots = total
+        self.new_session = RetryingFactory(factory)
+        super().__init__(
+            self.new_session,
+            size=max(1, total // workers),
+            max_uses=max_uses,
+            idle_check=idle_check,
+            origins=origins,
+        )
+        logger.info(
+            f"[GridPool] {total} Chrome slots ({free} free) at {url}; "
+            f"pool size {self.size}"
+        )
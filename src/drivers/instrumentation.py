@@ -0,0 +1,131 @@
+"""
+WebDriver command instrumentation for SauceDemo automation.
+Records every remote command (name, locator, latency, inside-a-wait) issued
+through a driver and summarises where a test's remote time went.
+"""
+
+import time
+from contextlib import contextmanager
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+FIND_COMMANDS = ("findElement", "findElements", "findChildElement", "findChildElements")
+
+
+class CommandRecord:
+    """One remote WebDriver command."""
+
+    __slots__ = ("name", "locator", "latency", "in_wait", "failed")
+
+    def __init__(self, name, locator, latency, in_wait, failed):
+        self.name = name
+        self.locator = locator
+        self.latency = latency
+        self.in_wait = in_wait
+        self.failed = failed
+
+    def as_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class CommandRecorder:
+    """Wraps driver.execute to time each command; attach one per test."""
+
+    def __init__(self):
+        self.records = []
+        self._wait_depth = 0
+        self._element_locators = {}
+        self._driver = None
+
+    def attach(self, driver):
+        """Start recording commands sent through driver."""
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            started = time.perf_counter()
+            failed = True
+            try:
+                response = original(driver_command, params)
+                failed = False
+                return response
+            finally:
+                latency = time.perf_counter() - started
+                locator = self._locator_for(driver_command, params)
+                self.records.append(
+                    CommandRecord(
+                        driver_command, locator, latency, self._wait_depth > 0, failed
+                    )
+                )
+                if not failed and driver_command in FIND_COMMANDS:
+                    self._remember_elements(locator, response)
+
+        driver.execute = execute
+        driver.command_recorder = self
+        self._driver = driver
+        return self
+
+    def detach(self):
+        """Stop recording and restore the driver's own execute method."""
+        if self._driver is not None:
+            self._driver.__dict__.pop("execute", None)
+            self._driver.__dict__.pop("command_recorder", None)
+            self._driver = None
+
+    @contextmanager
+    def wait_scope(self):
+        """Mark commands issued inside the block as part of a wait."""
+        self._wait_depth += 1
+        try:
+            yield
+        finally:
+            self._wait_depth -= 1
+
+    def _locator_for(self, name, params):
+        if not params:
+            return None
+        if "using" in params and "value" in params:
+            return f"{params['using']}={params['value']}"
+        if "script" in params:
+            first_line = (
+                params["script"].strip().splitlines()[0] if params["script"] else ""
+            )
+            return f"script:{first_line[:60]}"
+        element_id = params.get("id")
+        if element_id is not None:
+            return self._element_locators.get(element_id)
+        return None
+
+    def _remember_elements(self, locator, response):
+        value = (response or {}).get("value")
+        for element in value if isinstance(value, list) else [value]:
+            if isinstance(element, dict) and ELEMENT_KEY in element:
+                self._element_locators[element[ELEMENT_KEY]] = locator
+
+    def summary(self, top=5):
+        """Return a JSON-serialisable summary of the recorded commands."""
+        wait_time = sum(r.latency for r in self.records if r.in_wait)
+        total_time = sum(r.latency for r in self.records)
+        commands, locators = {}, {}
+        for record in self.records:
+            entry = commands.setdefault(record.name, {"count": 0, "time": 0.0})
+            entry["count"] += 1
+            entry["time"] += record.latency
+            if record.locator:
+                entry = locators.setdefault(record.locator, {"count": 0, "time": 0.0})
+                entry["count"] += 1
+                entry["time"] += record.latency
+        top_locators = sorted(locators.items(), key=lambda kv: -kv[1]["time"])[:top]
+        return {
+            "command_count": len(self.records),
+            "failed_count": sum(1 for r in self.records if r.failed),
+            "remote_time": round(total_time, 6),
+            "wait_time": round(wait_time, 6),
+            "action_time": round(total_time - wait_time, 6),
+            "commands": {
+                name: {"count": v["count"], "time": round(v["time"], 6)}
+                for name, v in sorted(commands.items(), key=lambda kv: -kv[1]["time"])
+            },
+            "top_locators": [
+                {"locator": name, "count": v["count"], "time": round(v["time"], 6)}
+                for name, v in top_locators
+            ],
+        }
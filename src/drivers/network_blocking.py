@@ -0,0 +1,112 @@
+"""
+Network resource blocking for SauceDemo automation.
+Blocks images, fonts and third-party scripts over the Chrome DevTools
+Protocol and reads Chrome's performance log to count what was blocked.
+"""
+
+import json
+from selenium.common.exceptions import WebDriverException
+
+# Resources no assertion in the suite depends on.
+DEFAULT_BLOCKLIST = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.webp",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*backtrace.io*",
+)
+
+# Blocking state per browser session: {"enabled": bool, "patterns": tuple}.
+# Keyed by session id, since several client objects may drive one session.
+# A session this process has not blocked on yet may still carry another
+# process's blocklist (e.g. a daemon session), so its patterns start unknown.
+_network_states = {}
+
+
+class ResourceBlocker:
+    """Applies a blocklist (and stub scripts) to a driver for one test."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._stub_ids = []
+
+    def block(self, patterns=DEFAULT_BLOCKLIST, stubs=None):
+        """
+        Block requests whose URL matches any wildcard pattern, replacing the
+        driver's previous blocklist (pass () to unblock everything).
+        :param patterns: URL patterns, '*' matches any run of characters
+        :param stubs: Optional {pattern: JavaScript source}; each pattern is
+            blocked and its source runs in every new document instead, so
+            pages relying on a third-party script still find its globals
+        """
+        stubs = stubs or {}
+        self._set_blocked(tuple(dict.fromkeys((*patterns, *stubs))))
+        for source in stubs.values():
+            result = self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": source}
+            )
+            self._stub_ids.append(result["identifier"])
+
+    def clear_stubs(self):
+        """Remove stub scripts added by block(); the blocklist stays in place."""
+        for identifier in self._stub_ids:
+            self.driver.execute_cdp_cmd(
+                "Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier}
+            )
+        self._stub_ids = []
+
+    def _set_blocked(self, patterns):
+        state = _network_states.setdefault(
+            self.driver.session_id, {"enabled": False, "patterns": None}
+        )
+        if state["patterns"] == patterns:
+            return
+        if not state["enabled"]:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            state["enabled"] = True
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        state["patterns"] = patterns
+
+
+def forget_network_state(driver):
+    """
+    Drop driver's blocking state, e.g. once its session moves to a new tab,
+    is reset or is quit.
+    """
+    _network_states.pop(driver.session_id, None)
+
+
+def read_network_log(driver):
+    """
+    Drain Chrome's performance log and summarise network activity since the
+    last read: {"requests": n, "transferred": bytes, "blocked": [urls]}.
+    Requires a session started with the performance log enabled.
+    """
+    try:
+        entries = driver.get_log("performance")
+    except WebDriverException:
+        return None
+    urls, blocked, transferred = {}, [], 0
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        method, params = message.get("method"), message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            urls[params["requestId"]] = params["request"]["url"]
+        elif method == "Network.loadingFinished":
+            transferred += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            blocked.append(urls.get(params["requestId"], "?"))
+    return {
+        "requests": len(urls),
+        "transferred": transferred,
+        "blocked": blocked,
+    }
@@ -0,0 +1,227 @@
+"""
+Pre-warmed Chrome profile template for SauceDemo automation.
+Builds a tuned user-data directory once, then starts every session from a
+cheap copy-on-write (or tmpfs) clone of it instead of an empty profile.
+"""
+
+import logging
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of each session's disk cache (it lives in the clone).
+DISK_CACHE_BYTES = 32 * 2**20
+TMPFS = "/dev/shm"
+# Clone and template directory names carry the owning process id, so ones
+# left behind by a crashed worker can be recognised and removed.
+PROFILE_DIR = re.compile(r"^chrome-(?:profile|template)-(\d+)-")
+
+# Skip first-run work, background services and component downloads.
+FAST_START_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--disable-breakpad",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication",
+    "--metrics-recording-only",
+    "--password-store=basic",
+    "--use-mock-keychain",
+    "--mute-audio",
+    f"--disk-cache-size={DISK_CACHE_BYTES}",
+)
+
+# Profile files that belong to one running browser and must not be cloned.
+VOLATILE_ENTRIES = (
+    "SingletonLock",
+    "SingletonSocket",
+    "SingletonCookie",
+    "lockfile",
+    "Crashpad",
+    "BrowserMetrics",
+    os.path.join("Default", "Sessions"),
+    os.path.join("Default", "Current Session"),
+    os.path.join("Default", "Current Tabs"),
+)
+
+
+def clone_root(needed=None):
+    """
+    Directory for profile clones: PROFILE_CLONE_DIR if set, else tmpfs when
+    its free space covers needed bytes, else the temp directory. Chrome runs
+    with --disable-dev-shm-usage because /dev/shm is often tiny (64 MB in
+    Docker), so it is never filled without room to spare.
+    """
+    configured = os.getenv("PROFILE_CLONE_DIR")
+    if configured:
+        return configured
+    if needed is not None and os.path.isdir(TMPFS) and os.access(TMPFS, os.W_OK):
+        if shutil.disk_usage(TMPFS).free > 2 * needed:
+            return TMPFS
+    return tempfile.gettempdir()
+
+
+def tree_size(path):
+    """Total size in bytes of the files under path."""
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(directory, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def remove_stale_profiles(root):
+    """Delete template and clone directories in root whose process has exited."""
+    if os.name != "posix" or not os.path.isdir(root):
+        return 0
+    removed = 0
+    for entry in os.listdir(root):
+        match = PROFILE_DIR.match(entry)
+        if match and not _pid_alive(int(match.group(1))):
+            shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+            removed += 1
+    if removed:
+        logger.info(f"[ProfileTemplate] Removed {removed} stale profiles from {root}")
+    return removed
+
+
+def copy_tree(src, dst):
+    """Copy a directory, sharing blocks copy-on-write where the filesystem can."""
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        result = subprocess.run(
+            ["cp", "-a", "--reflink=auto", src, dst], capture_output=True
+        )
+        if result.returncode == 0:
+            return
+    shutil.copytree(src, dst, symlinks=True)
+
+
+class ProfileTemplate:
+    """Callable driver factory that launches Chrome from template clones."""
+
+    def __init__(
+        self, factory, args=FAST_START_ARGS, warm_url=None, root=None, clones=1
+    ):
+        """
+        Initialize the template (built lazily on first launch).
+        :param factory: create_chrome_driver-like callable accepting
+            user_data_dir and extra_args keywords
+        :param args: Chrome flags used to build and launch from the template
+        :param warm_url: Page loaded while building, to prime the disk cache
+        :param root: Directory for the template and its clones (default:
+            chosen by clone_root once the template's size is known)
+        :param clones: Clones expected to exist at once (on this machine)
+        """
+        self._factory = factory
+        self.args = tuple(args)
+        self.warm_url = warm_url
+        self.root = root
+        self.clones = clones
+        self.path = None
+        self._clones = {}
+        self.build_time = None
+        self.clone_times = []
+        self.startup_times = []
+
+    def build(self):
+        """Launch Chrome once on a fresh profile so first-run work is done."""
+        started = time.perf_counter()
+        build_root = self.root or tempfile.gettempdir()
+        for root in {build_root, clone_root(), TMPFS}:
+            remove_stale_profiles(root)
+        self.path = tempfile.mkdtemp(prefix=self._prefix("template"), dir=build_root)
+        driver = self._factory(user_data_dir=self.path, extra_args=self.args)
+        try:
+            if self.warm_url:
+                driver.get(self.warm_url)
+        finally:
+            driver.quit()
+        for entry in VOLATILE_ENTRIES:
+            target = os.path.join(self.path, entry)
+            if os.path.isdir(target) and not os.path.islink(target):
+                shutil.rmtree(target, ignore_errors=True)
+            elif os.path.lexists(target):
+                os.remove(target)
+        if self.root is None:
+            needed = (tree_size(self.path) + DISK_CACHE_BYTES) * self.clones
+            self.root = clone_root(needed)
+        self.build_time = time.perf_counter() - started
+        logger.info(f"[ProfileTemplate] Built {self.path} in {self.build_time:.2f}s")
+
+    def __call__(self):
+        """Clone the template and start a session on the clone."""
+        if self.path is None:
+            self.build()
+        started = time.perf_counter()
+        clone = tempfile.mkdtemp(prefix=self._prefix("profile"), dir=self.root)
+        os.rmdir(clone)
+        copy_tree(self.path, clone)
+        cloned = time.perf_counter()
+        try:
+            driver = self._factory(user_data_dir=clone, extra_args=self.args)
+        except Exception:
+            shutil.rmtree(clone, ignore_errors=True)
+            raise
+        self.clone_times.append(cloned - started)
+        self.startup_times.append(time.perf_counter() - cloned)
+        self._clones[id(driver)] = clone
+        # Pools call release(); this only catches sessions quit elsewhere.
+        weakref.finalize(driver, shutil.rmtree, clone, True)
+        return driver
+
+    def release(self, driver):
+        """Delete the profile clone of a driver that has been quit."""
+        clone = self._clones.pop(id(driver), None)
+        if clone is not None:
+            shutil.rmtree(clone, ignore_errors=True)
+
+    def close(self):
+        """Delete the template directory and any clones still left."""
+        clones, self._clones = list(self._clones.values()), {}
+        for clone in clones:
+            shutil.rmtree(clone, ignore_errors=True)
+        if self.path is not None:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.path = None
+
+    def _prefix(self, kind):
+        return f"chrome-{kind}-{os.getpid()}-"
+
+    def summary(self):
+        """Return build, clone and startup timings in seconds."""
+        return {
+            "build_time": self.build_time,
+            "launches": len(self.startup_times),
+            "clone_median": (
+                statistics.median(self.clone_times) if self.clone_times else None
+            ),
+            "startup_median": (
+                statistics.median(self.startup_times) if self.startup_times else None
+            ),
+        }
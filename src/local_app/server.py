@@ -0,0 +1,138 @@
+"""
+Local SauceDemo stand-in server for SauceDemo automation.
+Serves the bundled login/inventory/cart/checkout app from memory on
+127.0.0.1, so the suite can run offline with deterministic timings.
+"""
+
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+PAGE_ROUTES = (
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+)
+IMAGE_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="320" height="320">'
+    '<rect width="320" height="320" fill="#e8e8e8"/>'
+    '<text x="160" y="165" font-size="18" text-anchor="middle">{name}</text></svg>'
+)
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".svg": "image/svg+xml",
+}
+
+
+def _load_assets():
+    """Read the static app into memory as {path: (content type, bytes)}."""
+    assets = {}
+    for name in os.listdir(STATIC_DIR):
+        with open(os.path.join(STATIC_DIR, name), "rb") as f:
+            body = f.read()
+        content_type = CONTENT_TYPES[os.path.splitext(name)[1]]
+        assets[f"/static/{name}"] = (content_type, body)
+    shell = assets.pop("/static/app.html")
+    for route in PAGE_ROUTES:
+        assets[route] = shell
+    return assets
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    assets = {}
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].split("#", 1)[0]
+        asset = self.assets.get(path)
+        if asset is None and path.startswith("/static/media/"):
+            name = os.path.splitext(os.path.basename(path))[0]
+            asset = (CONTENT_TYPES[".svg"], IMAGE_SVG.format(name=name).encode())
+        if asset is None:
+            self._send(404, "text/plain; charset=utf-8", b"Not Found")
+            return
+        self._send(200, *asset)
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/static/"):
+            self.send_header("Cache-Control", "max-age=3600")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("[LocalSauceDemo] " + format, *args)
+
+
+class LocalSauceDemo:
+    """In-process HTTP server hosting the SauceDemo stand-in."""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        """
+        Initialize the server (not started).
+        :param host: Interface to bind
+        :param port: Port to bind (0 picks a free port)
+        """
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """Root URL of the running app, e.g. 'http://127.0.0.1:53127'."""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """Start serving in a background thread and return the base URL."""
+        handler = type("Handler", (_Handler,), {"assets": _load_assets()})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-saucedemo", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[LocalSauceDemo] Serving on {self.base_url}")
+        return self.base_url
+
+    def stop(self):
+        """Stop the server and release the port."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Serve the SauceDemo stand-in")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    with LocalSauceDemo(port=args.port):
+        while True:
+            time.sleep(3600)
@@ -0,0 +1,431 @@
+/*
+ * Local stand-in for the SauceDemo (Swag Labs) storefront.
+ * Mirrors the element ids, classes and data-test attributes used by the page
+ * objects so the suite can run offline against 127.0.0.1.
+ */
+(function () {
+    "use strict";
+
+    var PASSWORD = "secret_sauce";
+    var USERS = [
+        "standard_user",
+        "locked_out_user",
+        "problem_user",
+        "performance_glitch_user",
+        "error_user",
+        "visual_user"
+    ];
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var PROTECTED = [
+        "/inventory.html",
+        "/cart.html",
+        "/checkout-step-one.html",
+        "/checkout-step-two.html",
+        "/checkout-complete.html"
+    ];
+    // Listed in the default (name A-Z) order, with SauceDemo's item ids.
+    var ITEMS = [
+        {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+         desc: "Carry all the things with the sleek, streamlined Sly Pack."},
+        {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night."},
+        {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+         desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt."},
+        {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket."},
+        {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+         desc: "Rib snap infant onesie for the junior automation engineer in development."},
+        {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+         desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard."}
+    ];
+
+    function el(tag, attrs, children) {
+        var node = document.createElement(tag);
+        Object.keys(attrs || {}).forEach(function (key) {
+            if (key === "text") {
+                node.textContent = attrs[key];
+            } else if (key.indexOf("on") === 0) {
+                node.addEventListener(key.slice(2), attrs[key]);
+            } else {
+                node.setAttribute(key, attrs[key]);
+            }
+        });
+        (children || []).forEach(function (child) { node.appendChild(child); });
+        return node;
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function itemById(id) {
+        return ITEMS.filter(function (item) { return item.id === id; })[0];
+    }
+
+    function getCookie(name) {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + name + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+        renderBadge();
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    function header() {
+        return el("div", {"class": "primary_header", "data-test": "primary-header"}, [
+            el("div", {"class": "app_logo", text: "Swag Labs"}),
+            el("div", {"class": "shopping_cart_container", id: "shopping_cart_container"}, [
+                el("a", {
+                    "class": "shopping_cart_link",
+                    "data-test": "shopping-cart-link",
+                    href: "/cart.html"
+                })
+            ])
+        ]);
+    }
+
+    function renderBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        if (!link) {
+            return;
+        }
+        var count = getCart().length;
+        var badge = link.querySelector(".shopping_cart_badge");
+        if (!count) {
+            if (badge) {
+                link.removeChild(badge);
+            }
+            return;
+        }
+        if (!badge) {
+            badge = el("span", {"class": "shopping_cart_badge", "data-test": "shopping-cart-badge"});
+            link.appendChild(badge);
+        }
+        badge.textContent = String(count);
+    }
+
+    function cartButton(item, inCart, extraClass) {
+        var prefix = inCart ? "remove-" : "add-to-cart-";
+        var id = prefix + slug(item.name);
+        return el("button", {
+            "class": "btn btn_small " + (inCart ? "btn_secondary " : "btn_primary ") + extraClass,
+            "data-test": id,
+            id: id,
+            name: id,
+            text: inCart ? "Remove" : "Add to cart",
+            onclick: function (event) {
+                var cart = getCart().filter(function (other) { return other !== item.id; });
+                if (!inCart) {
+                    cart.push(item.id);
+                }
+                setCart(cart);
+                if (extraClass === "cart_button") {
+                    var row = event.target.closest(".cart_item");
+                    row.parentNode.removeChild(row);
+                } else {
+                    event.target.parentNode.replaceChild(
+                        cartButton(item, !inCart, extraClass), event.target
+                    );
+                }
+            }
+        });
+    }
+
+    function titleLink(item) {
+        return el("a", {
+            id: "item_" + item.id + "_title_link",
+            "data-test": "item-" + item.id + "-title-link",
+            href: "#"
+        }, [
+            el("div", {
+                "class": "inventory_item_name",
+                "data-test": "inventory-item-name",
+                text: item.name
+            })
+        ]);
+    }
+
+    function price(item) {
+        return el("div", {
+            "class": "inventory_item_price",
+            "data-test": "inventory-item-price",
+            text: "$" + item.price.toFixed(2)
+        });
+    }
+
+    function renderLogin(root, message) {
+        var username = el("input", {
+            "class": "input_error form_input", id: "user-name", name: "user-name",
+            "data-test": "username", placeholder: "Username", type: "text"
+        });
+        var password = el("input", {
+            "class": "input_error form_input", id: "password", name: "password",
+            "data-test": "password", placeholder: "Password", type: "password"
+        });
+        var errorBox = el("div", {"class": "error-message-container"});
+
+        function showError(text) {
+            errorBox.className = "error-message-container error";
+            errorBox.innerHTML = "";
+            errorBox.appendChild(el("h3", {"data-test": "error", text: text}));
+        }
+
+        var form = el("form", {
+            onsubmit: function (event) {
+                event.preventDefault();
+                var user = username.value, pass = password.value;
+                if (!user) {
+                    showError("Epic sadface: Username is required");
+                } else if (!pass) {
+                    showError("Epic sadface: Password is required");
+                } else if (USERS.indexOf(user) === -1 || pass !== PASSWORD) {
+                    showError("Epic sadface: Username and password do not match any user in this service");
+                } else if (user === "locked_out_user") {
+                    showError("Epic sadface: Sorry, this user has been locked out.");
+                } else {
+                    var expires = new Date(Date.now() + 10 * 60 * 1000).toUTCString();
+                    document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(user) +
+                        "; expires=" + expires + "; path=/";
+                    go("/inventory.html");
+                }
+            }
+        }, [
+            el("div", {"class": "form_group"}, [username]),
+            el("div", {"class": "form_group"}, [password]),
+            errorBox,
+            el("input", {
+                type: "submit", "class": "submit-button btn_action",
+                "data-test": "login-button", id: "login-button", name: "login-button",
+                value: "Login"
+            })
+        ]);
+        root.appendChild(el("div", {"class": "login_container"}, [
+            el("div", {"class": "login_logo", text: "Swag Labs"}),
+            el("div", {"class": "login_wrapper"}, [form])
+        ]));
+        if (message) {
+            showError(message);
+        }
+    }
+
+    function renderInventory(root) {
+        var cart = getCart();
+        var list = el("div", {"class": "inventory_list", "data-test": "inventory-list"});
+        ITEMS.forEach(function (item) {
+            list.appendChild(el("div", {"class": "inventory_item", "data-test": "inventory-item"}, [
+                el("div", {"class": "inventory_item_img"}, [
+                    el("a", {id: "item_" + item.id + "_img_link", href: "#"}, [
+                        el("img", {
+                            "class": "inventory_item_img",
+                            alt: item.name,
+                            src: "/static/media/" + slug(item.name) + ".svg"
+                        })
+                    ])
+                ]),
+                el("div", {"class": "inventory_item_description"}, [
+                    el("div", {"class": "inventory_item_label"}, [
+                        titleLink(item),
+                        el("div", {"class": "inventory_item_desc", text: item.desc})
+                    ]),
+                    el("div", {"class": "pricebar"}, [
+                        price(item),
+                        cartButton(item, cart.indexOf(item.id) !== -1, "btn_inventory")
+                    ])
+                ])
+            ]));
+        });
+        root.appendChild(header());
+        root.appendChild(el("div", {"class": "inventory_container"}, [list]));
+    }
+
+    function renderCart(root) {
+        var list = el("div", {"class": "cart_list", "data-test": "cart-list"}, [
+            el("div", {"class": "cart_quantity_label", text: "QTY"}),
+            el("div", {"class": "cart_desc_label", text: "Description"})
+        ]);
+        getCart().forEach(function (id) {
+            var item = itemById(id);
+            if (!item) {
+                return;
+            }
+            list.appendChild(el("div", {"class": "cart_item", "data-test": "inventory-item"}, [
+                el("div", {"class": "cart_quantity", "data-test": "item-quantity", text: "1"}),
+                el("div", {"class": "cart_item_label"}, [
+                    titleLink(item),
+                    el("div", {"class": "inventory_item_desc", text: item.desc}),
+                    el("div", {"class": "item_pricebar"}, [
+                        price(item),
+                        cartButton(item, true, "cart_button")
+                    ])
+                ])
+            ]));
+        });
+        root.appendChild(header());
+        root.appendChild(el("div", {"class": "cart_contents_container"}, [
+            list,
+            el("div", {"class": "cart_footer"}, [
+                el("button", {
+                    "class": "btn btn_secondary back btn_medium", id: "continue-shopping",
+                    "data-test": "continue-shopping", name: "continue-shopping",
+                    text: "Continue Shopping",
+                    onclick: function () { go("/inventory.html"); }
+                }),
+                el("button", {
+                    "class": "btn btn_action btn_medium checkout_button", id: "checkout",
+                    "data-test": "checkout", name: "checkout", text: "Checkout",
+                    onclick: function () { go("/checkout-step-one.html"); }
+                })
+            ])
+        ]));
+    }
+
+    function renderCheckoutInfo(root) {
+        var fields = [
+            ["first-name", "firstName", "First Name"],
+            ["last-name", "lastName", "Last Name"],
+            ["postal-code", "postalCode", "Zip/Postal Code"]
+        ].map(function (spec) {
+            return el("input", {
+                "class": "input_error form_input", id: spec[0], name: spec[0],
+                "data-test": spec[1], placeholder: spec[2], type: "text"
+            });
+        });
+        var errorBox = el("div", {"class": "error-message-container"});
+        var form = el("form", {
+            onsubmit: function (event) {
+                event.preventDefault();
+                var missing = ["First Name", "Last Name", "Postal Code"].filter(
+                    function (label, i) { return !fields[i].value; }
+                )[0];
+                if (missing) {
+                    errorBox.className = "error-message-container error";
+                    errorBox.innerHTML = "";
+                    errorBox.appendChild(el("h3", {
+                        "data-test": "error", text: "Error: " + missing + " is required"
+                    }));
+                    return;
+                }
+                go("/checkout-step-two.html");
+            }
+        }, fields.map(function (field) {
+            return el("div", {"class": "form_group"}, [field]);
+        }).concat([
+            errorBox,
+            el("button", {
+                type: "button", "class": "btn btn_secondary back btn_medium cart_cancel_link",
+                id: "cancel", "data-test": "cancel", name: "cancel", text: "Cancel",
+                onclick: function () { go("/cart.html"); }
+            }),
+            el("input", {
+                type: "submit", "class": "submit-button btn btn_primary cart_button btn_action",
+                id: "continue", "data-test": "continue", name: "continue", value: "Continue"
+            })
+        ]));
+        root.appendChild(header());
+        root.appendChild(el("div", {"class": "checkout_info_container"}, [form]));
+    }
+
+    function renderCheckoutOverview(root) {
+        var items = getCart().map(itemById).filter(Boolean);
+        var subtotal = items.reduce(function (sum, item) { return sum + item.price; }, 0);
+        var tax = Math.round(subtotal * 8) / 100;
+        var list = el("div", {"class": "cart_list", "data-test": "cart-list"});
+        items.forEach(function (item) {
+            list.appendChild(el("div", {"class": "cart_item", "data-test": "inventory-item"}, [
+                el("div", {"class": "cart_quantity", "data-test": "item-quantity", text: "1"}),
+                el("div", {"class": "cart_item_label"}, [titleLink(item), price(item)])
+            ]));
+        });
+        root.appendChild(header());
+        root.appendChild(el("div", {"class": "checkout_summary_container"}, [
+            list,
+            el("div", {
+                "class": "summary_subtotal_label", "data-test": "subtotal-label",
+                text: "Item total: $" + subtotal.toFixed(2)
+            }),
+            el("div", {
+                "class": "summary_tax_label", "data-test": "tax-label",
+                text: "Tax: $" + tax.toFixed(2)
+            }),
+            el("div", {
+                "class": "summary_total_label", "data-test": "total-label",
+                text: "Total: $" + (subtotal + tax).toFixed(2)
+            }),
+            el("button", {
+                "class": "btn btn_secondary back btn_medium cart_cancel_link", id: "cancel",
+                "data-test": "cancel", name: "cancel", text: "Cancel",
+                onclick: function () { go("/inventory.html"); }
+            }),
+            el("button", {
+                "class": "btn btn_action btn_medium cart_button", id: "finish",
+                "data-test": "finish", name: "finish", text: "Finish",
+                onclick: function () {
+                    setCart([]);
+                    go("/checkout-complete.html");
+                }
+            })
+        ]));
+    }
+
+    function renderCheckoutComplete(root) {
+        root.appendChild(header());
+        root.appendChild(el("div", {
+            "class": "checkout_complete_container", id: "checkout_complete_container",
+            "data-test": "checkout-complete-container"
+        }, [
+            el("h2", {
+                "class": "complete-header", "data-test": "complete-header",
+                text: "Thank you for your order!"
+            }),
+            el("button", {
+                "class": "btn btn_primary btn_small", id: "back-to-products",
+                "data-test": "back-to-products", name: "back-to-products",
+                text: "Back Home",
+                onclick: function () { go("/inventory.html"); }
+            })
+        ]));
+    }
+
+    var ROUTES = {
+        "/": renderLogin,
+        "/inventory.html": renderInventory,
+        "/cart.html": renderCart,
+        "/checkout-step-one.html": renderCheckoutInfo,
+        "/checkout-step-two.html": renderCheckoutOverview,
+        "/checkout-complete.html": renderCheckoutComplete
+    };
+
+    function render() {
+        var path = window.location.pathname;
+        var root = document.getElementById("root");
+        root.innerHTML = "";
+        if (PROTECTED.indexOf(path) !== -1 && !getCookie(SESSION_COOKIE)) {
+            window.history.replaceState(null, "", "/");
+            renderLogin(root, "Epic sadface: You can only access '" + path +
+                "' when you are logged in.");
+            return;
+        }
+        (ROUTES[path] || renderLogin)(root);
+        renderBadge();
+    }
+
+    render();
+})();
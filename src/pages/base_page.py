@@ -3,45 +3,366 @@ Base page object for all pages in the SauceDemo automation project.
 Provides common Selenium utility methods for element interaction and waiting.
 """
 
+import hashlib
+import logging
+import os
+import time
+import weakref
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY
 from selenium.webdriver.support import expected_conditions as EC
+from . import events
+from .browser_state import BrowserState
+
+DEFAULT_BASE_URL = "https://www.saucedemo.com"
+
+# Chrome's default script timeout; async waits longer than this raise it first.
+DEFAULT_SCRIPT_TIMEOUT = 30
+_script_timeouts = weakref.WeakKeyDictionary()
+
+# Resolves once the predicate returns a truthy value, re-checking it on every
+# DOM mutation instead of polling. The predicate body replaces PREDICATE_SLOT
+# and sees the caller's arguments as arguments[0..n].
+WAIT_FOR_SCRIPT = """
+var args = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var predicate = function () { /*predicate*/ };
+function check() {
+    try { return predicate.apply(null, args); } catch (e) { return null; }
+}
+var value = check();
+if (value) { done({ok: true, value: value}); return; }
+var finished = false, timer = null;
+var observer = new MutationObserver(function () {
+    if (finished) { return; }
+    var result = check();
+    if (result) { finish({ok: true, value: result}); }
+});
+function finish(result) {
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(result);
+}
+timer = setTimeout(function () { finish({ok: false}); }, timeoutMs);
+observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+"""
+PREDICATE_SLOT = "/*predicate*/"
+# How chromedriver reports an async script cut off by the page navigating.
+NAVIGATION_ERRORS = (
+    "document unloaded",
+    "Execution context was destroyed",
+    "Cannot find context",
+)
+
+# Page is usable once its DOM is parsed; subclasses declare something stricter.
+DEFAULT_READY_PREDICATE = "return document.readyState !== 'loading';"
+
+# With the 'none' load strategy get() returns before the new document exists,
+# so the outgoing document is tagged and the readiness check skips it.
+MARK_UNLOADING_SCRIPT = "window.__pageObjectUnloading = true;"
 
 
 class BasePage:
     """Base class for all page objects. Handles driver and common actions."""
 
-    def __init__(self, driver, timeout=10):
+    base_url = os.getenv("SAUCE_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+    PATH = "/"
+    # JavaScript function body that is truthy once the page can be used.
+    READY_PREDICATE = DEFAULT_READY_PREDICATE
+    # Reuse element handles found by find() until they go stale or the page navigates.
+    CACHE_ELEMENTS = False
+    # WaitHistory shared by every page; when set, waits learn their deadlines.
+    wait_history = None
+
+    def __init__(self, driver, timeout=10, base_url=None, cache_elements=None):
         """
         Initialize the page object.
         :param driver: Selenium WebDriver instance
         :param timeout: Default wait timeout for element actions
+        :param base_url: App root URL (default: BasePage.base_url)
+        :param cache_elements: Cache element handles by locator (default: CACHE_ELEMENTS)
         """
         self.driver = driver
         self.timeout = timeout
+        if base_url is not None:
+            self.base_url = base_url.rstrip("/")
+        if cache_elements is None:
+            cache_elements = self.CACHE_ELEMENTS
+        self._elements = {} if cache_elements else None
+
+    @classmethod
+    def set_base_url(cls, base_url):
+        """Point every page object at another app root (e.g. a local stand-in)."""
+        BasePage.base_url = base_url.rstrip("/")
+
+    @classmethod
+    def set_wait_history(cls, history):
+        """Learn wait deadlines from a WaitHistory (None turns learning off)."""
+        BasePage.wait_history = history
+
+    @property
+    def url(self):
+        """Absolute URL of this page."""
+        return self.base_url + self.PATH
+
+    def load(self):
+        """
+        Navigate to this page and return as soon as it is ready to use.
+        Raises TimeoutException if READY_PREDICATE does not hold in time.
+        """
+        self.invalidate_elements()
+        self._mark_unloading()
+        self._log_event("load", url=self.url)
+        self.driver.get(self.url)
+        self._require_ready()
+
+    def refresh(self):
+        """
+        Reload the current document and return once this page is ready again.
+        Raises TimeoutException if READY_PREDICATE does not hold in time.
+        """
+        self.invalidate_elements()
+        self._mark_unloading()
+        self._log_event("refresh")
+        self.driver.refresh()
+        self._require_ready()
+
+    def snapshot_state(self):
+        """Capture cookies, localStorage and sessionStorage for the app origin."""
+        return BrowserState.capture(self.driver)
+
+    def restore_state(self, state):
+        """
+        Apply a BrowserState and load this page with it, in one navigation.
+        Raises TimeoutException if the page is not ready in time.
+        """
+        self.invalidate_elements()
+        self._mark_unloading()
+        self._log_event("restore_state", url=self.url, cookies=len(state.cookies))
+        state.apply(self.driver, self.url)
+        self._require_ready()
+
+    def wait_until_ready(self, timeout=None):
+        """Wait for READY_PREDICATE on the current document. Returns True if ready."""
+        predicate = (
+            "if (window.__pageObjectUnloading) { return null; }\n"
+            + self.READY_PREDICATE
+        )
+        return bool(
+            self.wait_for_condition(
+                predicate, timeout=timeout, key=f"ready:{type(self).__name__}"
+            )
+        )
+
+    def _mark_unloading(self):
+        if self.driver.caps.get("pageLoadStrategy") == "none":
+            self.driver.execute_script(MARK_UNLOADING_SCRIPT)
+
+    def _require_ready(self):
+        if not self.wait_until_ready():
+            self._log_event("not_ready", logging.WARNING, url=self.url)
+            raise TimeoutException(
+                f"{type(self).__name__} not ready after {self.timeout}s at {self.url}"
+            )
+
+    def _log_event(self, event, level=logging.INFO, **fields):
+        """Record a structured event for this page (formatted only if emitted)."""
+        events.emit(type(self).__name__, event, level, **fields)
 
-    def find(self, by, value):
-        """Wait for and return a visible element by locator."""
-        return WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_element_located((by, value))
+    def wait_for_condition(self, predicate, *args, timeout=None, key=None):
+        """
+        Block until a JavaScript predicate is truthy, in one remote call.
+        The browser re-evaluates the predicate on each DOM mutation, so there
+        is no polling loop. Returns the predicate's value, or None on timeout.
+        :param predicate: JavaScript function body, e.g. "return !!document.title;"
+        :param args: JSON-serialisable values passed to the predicate as arguments
+        :param timeout: Seconds to wait at most (default: the page timeout)
+        :param key: Name the wait is learned under (default: a predicate hash)
+        """
+        if key is None:
+            key = "js:" + hashlib.sha1(predicate.encode()).hexdigest()[:12]
+        timeout, _ = self._wait_budget(key, timeout)
+        started = time.monotonic()
+        deadline = started + timeout
+        script = WAIT_FOR_SCRIPT.replace(PREDICATE_SLOT, predicate)
+        if timeout + 1 > _script_timeouts.get(self.driver, DEFAULT_SCRIPT_TIMEOUT):
+            self.driver.set_script_timeout(timeout + 1)
+            _script_timeouts[self.driver] = timeout + 1
+        with self._wait_scope():
+            while True:
+                remaining = max(deadline - time.monotonic(), 0)
+                try:
+                    result = self.driver.execute_async_script(
+                        script, list(args), int(remaining * 1000)
+                    )
+                except JavascriptException as e:
+                    # The document unloaded mid-wait (navigation): watch the new
+                    # one. Anything else (e.g. a predicate syntax error) is real.
+                    if not any(text in (e.msg or "") for text in NAVIGATION_ERRORS):
+                        raise
+                    if time.monotonic() >= deadline:
+                        break
+                    continue
+                if result["ok"]:
+                    self._record_wait(key, time.monotonic() - started)
+                    return result["value"]
+                break
+        self._record_timeout(key, time.monotonic() - started)
+        return None
+
+    def _wait_budget(self, key, timeout):
+        """Return (deadline seconds, poll interval) for a wait on key."""
+        timeout = self.timeout if timeout is None else timeout
+        if self.wait_history is None or key is None:
+            return timeout, POLL_FREQUENCY
+        key = self._history_key(key)
+        return (
+            self.wait_history.deadline(key, timeout),
+            self.wait_history.poll_interval(key),
+        )
+
+    def _record_wait(self, key, seconds):
+        if self.wait_history is not None and key is not None:
+            self.wait_history.record(self._history_key(key), seconds)
+
+    def _record_timeout(self, key, seconds):
+        if self.wait_history is not None and key is not None:
+            self.wait_history.record_timeout(self._history_key(key), seconds)
+
+    def _history_key(self, key):
+        # Latencies differ per app host (the local stand-in answers in well
+        # under a millisecond), so each host learns its own deadlines.
+        return f"{urlsplit(self.base_url).hostname}/{key}"
+
+    @contextmanager
+    def _wait_scope(self):
+        """Tag commands issued in the block as wait time when instrumented."""
+        recorder = getattr(self.driver, "command_recorder", None)
+        if recorder is None:
+            yield
+            return
+        with recorder.wait_scope():
+            yield
+
+    def _until(self, condition, timeout=None, key=None):
+        """
+        Run an explicit wait for condition. Raises TimeoutException.
+        With a key and a wait history, the deadline and poll interval are learned.
+        """
+        timeout, poll = self._wait_budget(key, timeout)
+        started = time.monotonic()
+        try:
+            with self._wait_scope():
+                result = WebDriverWait(self.driver, timeout, poll).until(condition)
+        except TimeoutException:
+            self._record_timeout(key, time.monotonic() - started)
+            raise
+        self._record_wait(key, time.monotonic() - started)
+        return result
+
+    def find(self, by, value, timeout=None):
+        """
+        Wait for and return an element present in the DOM by locator.
+        With element caching on, a handle found earlier on this page is
+        checked with one cheap call and looked up again if it has gone stale,
+        so callers may use the element directly.
+        """
+        element = self._cached(by, value)
+        if element is not None:
+            try:
+                element.is_enabled()
+                return element
+            except StaleElementReferenceException:
+                self._drop_stale(by, value)
+        return self._lookup(by, value, timeout)
+
+    def _cached(self, by, value):
+        if self._elements is None:
+            return None
+        return self._elements.get((by, value))
+
+    def _drop_stale(self, by, value):
+        del self._elements[(by, value)]
+        self._log_event("stale_element", logging.DEBUG, by=by, value=value)
+
+    def _lookup(self, by, value, timeout=None):
+        element = self._until(
+            EC.presence_of_element_located((by, value)),
+            timeout,
+            f"present:{by}={value}",
         )
+        if self._elements is not None:
+            self._elements[(by, value)] = element
+        return element
+
+    def invalidate_elements(self):
+        """Forget cached element handles (call after this page navigates)."""
+        if self._elements is not None:
+            self._elements.clear()
+
+    def _on_element(self, by, value, action):
+        # Here a cached handle is only validated by using it: if it has gone
+        # stale, drop it, look the locator up again and retry the action once.
+        element = self._cached(by, value)
+        if element is None:
+            return action(self._lookup(by, value))
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self._drop_stale(by, value)
+            return action(self._lookup(by, value))
 
     def click(self, by, value):
         """Click an element by locator."""
-        element = self.find(by, value)
-        element.click()
+        self._on_element(by, value, lambda element: element.click())
 
     def type(self, by, value, text):
         """Type text into an input element by locator."""
-        element = self.find(by, value)
-        element.clear()
-        element.send_keys(text)
 
-    def is_visible(self, by, value):
-        """Check if an element is visible on the page."""
+        def fill(element):
+            element.clear()
+            element.send_keys(text)
+
+        self._on_element(by, value, fill)
+
+    def is_present(self, by, value):
+        """Return True if the element is in the DOM right now (never waits)."""
+        return len(self.driver.find_elements(by, value)) > 0
+
+    def wait_until_visible(self, by, value, timeout=None):
+        """Wait for an element to be visible. Returns it, or None on timeout."""
         try:
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.visibility_of_element_located((by, value))
+            return self._until(
+                EC.visibility_of_element_located((by, value)),
+                timeout,
+                f"visible:{by}={value}",
             )
-            return True
-        except Exception:
+        except TimeoutException:
+            return None
+
+    def wait_until_absent(self, by, value, timeout=None):
+        """Wait for an element to be hidden or removed. Returns True if it is."""
+        try:
+            return bool(
+                self._until(
+                    EC.invisibility_of_element_located((by, value)),
+                    timeout,
+                    f"absent:{by}={value}",
+                )
+            )
+        except TimeoutException:
             return False
+
+    def is_visible(self, by, value, timeout=None):
+        """Check if an element is visible on the page, waiting up to timeout."""
+        return self.wait_until_visible(by, value, timeout) is not None
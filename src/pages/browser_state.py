@@ -0,0 +1,143 @@
+"""
+Browser state capture and injection for SauceDemo automation.
+Snapshots cookies and web storage for the app origin and re-applies them
+without driving the UI (e.g. to start a test already logged in).
+"""
+
+import json
+import time
+
+# localStorage key SauceDemo keeps the cart in (a JSON array of item ids).
+CART_KEY = "cart-contents"
+
+CAPTURE_SCRIPT = """
+function dump(storage) {
+    var out = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        out[key] = storage.getItem(key);
+    }
+    return out;
+}
+return {
+    origin: window.location.origin,
+    local: dump(window.localStorage),
+    session: dump(window.sessionStorage)
+};
+"""
+
+SEED_SCRIPT = """
+(function (origin, local, session) {
+    if (window.location.origin !== origin) { return; }
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+    Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });
+    Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });
+})(%s, %s, %s);
+"""
+
+
+class BrowserState:
+    """Cookies plus localStorage/sessionStorage captured from one origin."""
+
+    def __init__(self, origin, cookies=(), local_storage=None, session_storage=None):
+        """
+        Initialize the state.
+        :param origin: Origin the storage belongs to (e.g. 'https://www.saucedemo.com')
+        :param cookies: Cookie dicts as returned by driver.get_cookies()
+        :param local_storage: Mapping of localStorage keys to string values
+        :param session_storage: Mapping of sessionStorage keys to string values
+        """
+        self.origin = origin
+        self.cookies = [dict(cookie) for cookie in cookies]
+        self.local_storage = dict(local_storage or {})
+        self.session_storage = dict(session_storage or {})
+
+    def is_expired(self, margin=30):
+        """Return True if any captured cookie expires within margin seconds."""
+        expiries = [cookie["expiry"] for cookie in self.cookies if "expiry" in cookie]
+        return bool(expiries) and min(expiries) - margin <= time.time()
+
+    def with_cart(self, item_ids):
+        """Return a copy of this state whose cart holds exactly item_ids."""
+        local_storage = dict(
+            self.local_storage, **{CART_KEY: json.dumps(list(item_ids))}
+        )
+        return BrowserState(
+            self.origin, self.cookies, local_storage, self.session_storage
+        )
+
+    @classmethod
+    def capture(cls, driver):
+        """Capture the state of the page currently loaded in driver."""
+        storage = driver.execute_script(CAPTURE_SCRIPT)
+        return cls(
+            storage["origin"],
+            driver.get_cookies(),
+            storage["local"],
+            storage["session"],
+        )
+
+    def apply(self, driver, url):
+        """
+        Replace the origin's cookies and storage with this state and navigate
+        to url (which must be on the same origin). Anything set since the
+        snapshot, such as a cart filled later, is cleared.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            self._apply_cdp(driver, url)
+        else:
+            self._apply_webdriver(driver, url)
+
+    def _seed_script(self):
+        return SEED_SCRIPT % (
+            json.dumps(self.origin),
+            json.dumps(self.local_storage),
+            json.dumps(self.session_storage),
+        )
+
+    def _apply_cdp(self, driver, url):
+        # Cookies go straight into the cookie jar and storage is seeded by a
+        # one-shot document script, so only the final navigation loads a page.
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        if self.cookies:
+            driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [self._cdp_cookie(cookie) for cookie in self.cookies]},
+            )
+        script = driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": self._seed_script()}
+        )
+        try:
+            driver.get(url)
+        finally:
+            driver.execute_cdp_cmd(
+                "Page.removeScriptToEvaluateOnNewDocument",
+                {"identifier": script["identifier"]},
+            )
+
+    def _apply_webdriver(self, driver, url):
+        driver.get(self.origin + "/")
+        driver.delete_all_cookies()
+        for cookie in self.cookies:
+            driver.add_cookie(cookie)
+        driver.execute_script(self._seed_script())
+        driver.get(url)
+
+    def _cdp_cookie(self, cookie):
+        converted = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if cookie.get("domain"):
+            converted["domain"] = cookie["domain"]
+        else:
+            converted["url"] = self.origin
+        if "expiry" in cookie:
+            converted["expires"] = cookie["expiry"]
+        if cookie.get("sameSite"):
+            converted["sameSite"] = cookie["sameSite"]
+        return converted
@@ -4,66 +4,138 @@ Handles cart item listing, removal, and cart state checks.
 """
 
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from typing import NamedTuple
 from .base_page import BasePage
 import re
+import time
+
+CART_SNAPSHOT_SCRIPT = """
+if (!document.querySelector(".cart_list")) {
+    return null;
+}
+var rows = Array.prototype.map.call(
+    document.querySelectorAll(".cart_item"),
+    function (row) {
+        var name = row.querySelector('[data-test="inventory-item-name"]');
+        var quantity = row.querySelector(".cart_quantity");
+        var price = row.querySelector(".inventory_item_price");
+        var button = row.querySelector("button[data-test^='remove']");
+        return {
+            name: name ? name.textContent.trim() : null,
+            quantity: quantity ? quantity.textContent.trim() : null,
+            price: price ? price.textContent.trim() : null,
+            remove_id: button ? button.getAttribute("data-test") : null
+        };
+    }
+);
+return {rows: rows};
+"""
+
+# The cart list and its checkout button are rendered (checkout step two also
+# has a .cart_list, but no #checkout).
+CART_READY_PREDICATE = """
+return !!(document.querySelector(".cart_list") && document.getElementById("checkout"));
+"""
+
+
+class CartItem(NamedTuple):
+    """One row of the cart page."""
+
+    name: str
+    quantity: int
+    price: str
+    remove_id: str
+
+
+class CartSnapshot(NamedTuple):
+    """Immutable view of the cart contents at the time it was read."""
+
+    items: tuple
+
+    @property
+    def names(self):
+        return [item.name for item in self.items]
+
+    @property
+    def is_empty(self):
+        return not self.items
+
+    def find(self, item_name):
+        """Return the CartItem named item_name, or None."""
+        for item in self.items:
+            if item.name == item_name:
+                return item
+        return None
 
 
 class CartPage(BasePage):
     """Page object for the SauceDemo cart page."""
 
-    URL = "https://www.saucedemo.com/cart.html"
+    PATH = "/cart.html"
     CART_ITEMS = (By.CLASS_NAME, "cart_item")
     ITEM_NAMES = (By.CLASS_NAME, "inventory_item_name")
     REMOVE_BUTTON = (By.XPATH, "//button[contains(@id, 'remove')]")
     CONTINUE_SHOPPING = (By.ID, "continue-shopping")
     CHECKOUT_BUTTON = (By.ID, "checkout")
     EMPTY_CART_MSG = (By.CSS_SELECTOR, ".cart_item")  # No items means cart is empty
+    READY_PREDICATE = CART_READY_PREDICATE
 
-    def load(self):
-        """Navigate to the cart page."""
-        self.driver.get(self.URL)
+    def get_cart_snapshot(self):
+        """
+        Read the whole cart in one script call and return a CartSnapshot.
+        Retries until the cart list has rendered (one call once it is there).
+        """
+        timeout, poll = self._wait_budget("js:cart-snapshot", None)
+        started = time.monotonic()
+        with self._wait_scope():
+            rows = WebDriverWait(self.driver, timeout, poll).until(
+                lambda d: d.execute_script(CART_SNAPSHOT_SCRIPT)
+            )["rows"]
+        self._record_wait("js:cart-snapshot", time.monotonic() - started)
+        return CartSnapshot(
+            tuple(
+                CartItem(
+                    row["name"],
+                    int(row["quantity"] or 1),
+                    row["price"],
+                    row["remove_id"],
+                )
+                for row in rows
+                if row["name"]
+            )
+        )
 
-    def get_cart_items(self):
+    def get_cart_items(self, snapshot=None):
         """Return a list of item names currently in the cart."""
-        import logging
-
-        logger = logging.getLogger(__name__)
-        cart_items = self.driver.find_elements(By.CSS_SELECTOR, ".cart_item")
-        names = []
-        for cart_item in cart_items:
-            try:
-                name_elem = cart_item.find_element(
-                    By.CSS_SELECTOR, '[data-test="inventory-item-name"]'
-                )
-                names.append(name_elem.text)
-            except Exception as e:
-                logger.warning(
-                    f"[get_cart_items] Could not find item name in cart_item: {e}"
-                )
-        logger.info(f"[get_cart_items] Found {len(names)} items in cart: {names}")
+        snapshot = snapshot or self.get_cart_snapshot()
+        names = snapshot.names
+        self._log_event("cart_items", items=names)
         return names
 
-    def _data_test_value(self, prefix, item_name):
-        """Generate the data-test attribute value for remove buttons."""
-        return f"{prefix}{item_name.lower().replace(' ', '-')}"
-
-    def remove_item_by_name(self, item_name):
-        """Remove an item from the cart by its name. Returns True if successful."""
-        items = self.driver.find_elements(*self.ITEM_NAMES)
-        for item in items:
-            if item.text == item_name:
-                parent = item.find_element(By.XPATH, "../../..")
-                data_test = self._data_test_value("remove-", item_name)
-                try:
-                    remove_btn = parent.find_element(
-                        By.XPATH, f".//button[@data-test='{data_test}']"
-                    )
-                    remove_btn.click()
-                    return True
-                except Exception:
-                    return False
-        return False
-
-    def is_cart_empty(self):
+    def remove_item_by_name(self, item_name, snapshot=None):
+        """
+        Remove an item from the cart by its name. Returns True if successful.
+        :param snapshot: CartSnapshot to look the item up in (read fresh if omitted)
+        """
+        snapshot = snapshot or self.get_cart_snapshot()
+        item = snapshot.find(item_name)
+        if item is None or not item.remove_id:
+            return False
+        try:
+            self.driver.find_element(
+                By.CSS_SELECTOR, f'button[data-test="{item.remove_id}"]'
+            ).click()
+            return True
+        except Exception:
+            return False
+
+    def is_cart_empty(self, snapshot=None):
         """Return True if the cart is empty, else False."""
-        return len(self.driver.find_elements(*self.CART_ITEMS)) == 0
+        return (snapshot or self.get_cart_snapshot()).is_empty
+
+    def continue_shopping(self):
+        """Return to the products page."""
+        self._log_event("continue_shopping")
+        self.click(*self.CONTINUE_SHOPPING)
+        self.invalidate_elements()
@@ -0,0 +1,46 @@
+"""
+Structured page-object events for SauceDemo automation.
+Page objects record what they did as an event name plus fields. Nothing is
+formatted until a handler asks for the message, and nothing is read from the
+browser just to describe an event.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+# When set, every event goes straight to this handler instead of the logger.
+_handler = None
+
+
+class PageEvent:
+    """Log message holding an event and its fields; str() formats it."""
+
+    __slots__ = ("source", "event", "fields")
+
+    def __init__(self, source, event, fields):
+        self.source = source
+        self.event = event
+        self.fields = fields
+
+    def __str__(self):
+        details = " ".join(f"{key}={value!r}" for key, value in self.fields.items())
+        return f"[{self.source}] {self.event} {details}".rstrip()
+
+
+def route_to(handler):
+    """Send events of every level to handler (None: back to the logger)."""
+    global _handler
+    _handler = handler
+
+
+def emit(source, event, level=logging.INFO, **fields):
+    """
+    Record an event if anything listens at level (a cheap no-op otherwise).
+    Field values should be values the caller already has, not fresh reads.
+    """
+    handler = _handler
+    if handler is not None:
+        message = PageEvent(source, event, fields)
+        handler.handle(logger.makeRecord(logger.name, level, "", 0, message, (), None))
+    elif logger.isEnabledFor(level):
+        logger.log(level, PageEvent(source, event, fields))
@@ -6,28 +6,37 @@ Handles login actions and error message retrieval.
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
 
+# The form is usable once the login button is rendered, visible and enabled.
+LOGIN_READY_PREDICATE = """
+var button = document.getElementById("login-button");
+return !!(document.getElementById("user-name") && button && !button.disabled &&
+    button.offsetParent !== null);
+"""
+
 
 class LoginPage(BasePage):
     """Page object for the SauceDemo login page."""
 
-    URL = "https://www.saucedemo.com/"
+    PATH = "/"
     USERNAME_INPUT = (By.ID, "user-name")
     PASSWORD_INPUT = (By.ID, "password")
     LOGIN_BUTTON = (By.ID, "login-button")
     ERROR_MESSAGE = (By.CSS_SELECTOR, "h3[data-test='error']")
-
-    def load(self):
-        """Navigate to the login page."""
-        self.driver.get(self.URL)
+    READY_PREDICATE = LOGIN_READY_PREDICATE
 
     def login(self, username, password):
         """Fill in credentials and submit the login form."""
+        self._log_event("login", username=username)
         self.type(*self.USERNAME_INPUT, text=username)
         self.type(*self.PASSWORD_INPUT, text=password)
         self.click(*self.LOGIN_BUTTON)
+        self.invalidate_elements()
 
     def get_error_message(self):
-        """Return the error message text if present, else None."""
-        if self.is_visible(*self.ERROR_MESSAGE):
-            return self.find(*self.ERROR_MESSAGE).text
-        return None
+        """
+        Return the error message text if present, else None.
+        The error renders with the failed submit, so this never waits for it.
+        """
+        if not self.is_present(*self.ERROR_MESSAGE):
+            return None
+        return self.find(*self.ERROR_MESSAGE).text
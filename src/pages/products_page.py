@@ -3,124 +3,326 @@ Products page object for SauceDemo automation.
 Handles adding/removing items to/from the cart and cart navigation.
 """
 
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
-import re
 import logging
+import re
+
+CATALOG_SCRIPT = """
+var token = String(Date.now()) + ":" + Math.random();
+var items = [];
+document.querySelectorAll(".inventory_item").forEach(function (node) {
+    var name = node.querySelector(".inventory_item_name");
+    var price = node.querySelector(".inventory_item_price");
+    var link = node.querySelector("a[id$='_title_link']");
+    var button = node.querySelector("button[data-test]");
+    items.push({
+        name: name ? name.textContent.trim() : null,
+        link: link ? link.id : null,
+        price: price ? price.textContent.trim() : null,
+        button: button ? button.getAttribute("data-test") : null
+    });
+});
+var list = document.querySelector(".inventory_list");
+if (!window.__catalogObserver) {
+    window.__catalogObserver = new MutationObserver(function () {
+        window.__catalogDirty = true;
+    });
+}
+if (list && window.__catalogList !== list) {
+    window.__catalogObserver.disconnect();
+    window.__catalogObserver.observe(list, {childList: true});
+}
+window.__catalogList = list;
+window.__catalogToken = token;
+window.__catalogDirty = false;
+return {token: token, items: items};
+"""
+
+# Inventory rows (with their cart buttons) and the cart link are rendered.
+INVENTORY_READY_PREDICATE = """
+var list = document.querySelector(".inventory_list");
+return !!(list && list.querySelector(".inventory_item button[data-test]") &&
+    document.querySelector(".shopping_cart_link"));
+"""
+
+CART_COUNT_PREDICATE = """
+if (!document.querySelector(".shopping_cart_link")) { return false; }
+var badge = document.querySelector(".shopping_cart_badge");
+return (badge ? parseInt(badge.textContent, 10) : 0) === arguments[0];
+"""
+
+CART_COUNT_SCRIPT = """
+var link = document.querySelector(".shopping_cart_link");
+if (link) {
+    var text = link.textContent.trim();
+    return {count: /^[0-9]+$/.test(text) ? parseInt(text, 10) : 0};
+}
+return document.querySelector("#login-button") ? {count: 0} : null;
+"""
+
+RESOLVE_BUTTONS_SCRIPT = """
+var token = arguments[0], dataTests = arguments[1];
+var list = document.querySelector(".inventory_list");
+if (window.__catalogToken !== token || window.__catalogDirty ||
+        window.__catalogList !== list) {
+    return {stale: true};
+}
+var byDataTest = {};
+document.querySelectorAll("button[data-test]").forEach(function (b) {
+    byDataTest[b.getAttribute("data-test")] = b;
+});
+var badge = document.querySelector(".shopping_cart_badge");
+return {
+    stale: false,
+    count: badge ? parseInt(badge.textContent, 10) : 0,
+    buttons: dataTests.map(function (d) { return byDataTest[d] || null; })
+};
+"""
+
+
+class CatalogItem:
+    """One inventory item as read from the products page."""
+
+    __slots__ = ("name", "item_id", "price", "add_id", "remove_id", "in_cart")
+
+    def __init__(self, name, item_id, price, add_id, remove_id, in_cart):
+        self.name = name
+        self.item_id = item_id
+        self.price = price
+        self.add_id = add_id
+        self.remove_id = remove_id
+        self.in_cart = in_cart
+
+    def __repr__(self):
+        return f"CatalogItem({self.name!r}, id={self.item_id}, in_cart={self.in_cart})"
+
+
+class Catalog:
+    """Name-indexed snapshot of the inventory, tied to one rendered page."""
+
+    __slots__ = ("token", "items")
+
+    def __init__(self, token, items):
+        self.token = token
+        self.items = items
+
+    @classmethod
+    def snapshot(cls, driver):
+        """Read every inventory item in a single execute_script call."""
+        raw = driver.execute_script(CATALOG_SCRIPT)
+        items = {}
+        for entry in raw["items"]:
+            if not entry["name"] or not entry["button"]:
+                continue
+            in_cart = entry["button"].startswith("remove-")
+            slug = re.sub(r"^(add-to-cart-|remove-)", "", entry["button"])
+            match = re.search(r"item_(\d+)_title_link", entry["link"] or "")
+            items[entry["name"]] = CatalogItem(
+                entry["name"],
+                int(match.group(1)) if match else None,
+                entry["price"],
+                f"add-to-cart-{slug}",
+                f"remove-{slug}",
+                in_cart,
+            )
+        return cls(raw["token"], items)
 
 
 class ProductsPage(BasePage):
     """Page object for the SauceDemo products (inventory) page."""
 
-    URL = "https://www.saucedemo.com/inventory.html"
+    # SauceDemo's fixed inventory ids, as stored in the cart's localStorage entry.
+    ITEM_IDS = {
+        "Sauce Labs Backpack": 4,
+        "Sauce Labs Bike Light": 0,
+        "Sauce Labs Bolt T-Shirt": 1,
+        "Sauce Labs Fleece Jacket": 5,
+        "Sauce Labs Onesie": 2,
+        "Test.allTheThings() T-Shirt (Red)": 3,
+    }
+
+    PATH = "/inventory.html"
     CART_BADGE = (By.CLASS_NAME, "shopping_cart_badge")
     CART_LINK = (By.CLASS_NAME, "shopping_cart_link")
     ADD_TO_CART_BUTTON = (By.XPATH, "//button[contains(@id, 'add-to-cart')]")
     REMOVE_BUTTON = (By.XPATH, "//button[contains(@id, 'remove')]")
     ITEM_NAMES = (By.CLASS_NAME, "inventory_item_name")
+    READY_PREDICATE = INVENTORY_READY_PREDICATE
+
+    def __init__(self, driver, timeout=10, base_url=None, cache_elements=None):
+        super().__init__(driver, timeout, base_url, cache_elements)
+        self._catalog = None
 
     def load(self):
-        """Navigate to the products page."""
-        self.driver.get(self.URL)
+        """Navigate to the products page and wait for the inventory to render."""
+        self.invalidate_catalog()
+        super().load()
+
+    def refresh(self):
+        """Reload the products page and wait for the inventory to render."""
+        self.invalidate_catalog()
+        super().refresh()
+
+    def restore_state(self, state):
+        """Apply a BrowserState and load the products page with it."""
+        self.invalidate_catalog()
+        super().restore_state(state)
+
+    @classmethod
+    def item_ids(cls, item_names):
+        """Return the inventory ids for item_names. Raises ValueError if unknown."""
+        unknown = [name for name in item_names if name not in cls.ITEM_IDS]
+        if unknown:
+            raise ValueError(f"Unknown inventory items: {unknown}")
+        return [cls.ITEM_IDS[name] for name in item_names]
 
-    def _data_test_value(self, prefix, item_name):
-        """Generate the data-test attribute value for add/remove buttons."""
-        return f"{prefix}{item_name.lower().replace(' ', '-')}"
+    def seed_cart(self, item_names, state=None):
+        """
+        Put exactly item_names in the cart by writing browser storage, then
+        reload the products page, instead of clicking each add button.
+        :param item_names: Names of the items the cart should hold
+        :param state: BrowserState to seed from (default: snapshot of the current one)
+        """
+        state = state if state is not None else self.snapshot_state()
+        self.restore_state(state.with_cart(self.item_ids(item_names)))
+
+    @property
+    def catalog(self):
+        """Return the catalog snapshot, building it with one script call if needed."""
+        if self._catalog is None:
+            self._catalog = Catalog.snapshot(self.driver)
+        return self._catalog
+
+    def invalidate_catalog(self):
+        """Drop the catalog snapshot so the next lookup re-reads the page."""
+        self._catalog = None
+
+    def get_item(self, item_name):
+        """Return the CatalogItem for item_name, or None if it is not listed."""
+        return self.catalog.items.get(item_name)
 
     def add_item_by_name(self, item_name):
         """Add an item to the cart by its name. Returns True if successful."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        import selenium.common.exceptions
-
-        logger = logging.getLogger(__name__)
-        items = self.driver.find_elements(*self.ITEM_NAMES)
-        for item in items:
-            if item.text == item_name:
-                parent = item.find_element(By.XPATH, "../../..")
-                data_test = self._data_test_value("add-to-cart-", item_name)
-                logger.info(
-                    f"[add_item_by_name] Looking for button with data-test='{data_test}' for item '{item_name}'"
-                )
-                try:
-                    add_btn = parent.find_element(
-                        By.XPATH, f".//button[@data-test='{data_test}']"
-                    )
-                    prev_count = self.get_cart_count()
-                    add_btn.click()
-                    logger.info(
-                        f"[add_item_by_name] Clicked add button for '{item_name}'"
-                    )
-                    try:
-                        WebDriverWait(self.driver, 5).until(
-                            lambda d: self.get_cart_count() == prev_count + 1
-                        )
-                        logger.info(
-                            f"[add_item_by_name] Cart count updated to {self.get_cart_count()} after add."
-                        )
-                        return True
-                    except selenium.common.exceptions.TimeoutException:
-                        logger.warning(
-                            f"[add_item_by_name] Cart count did not update after adding '{item_name}'."
-                        )
-                        return False
-                except Exception as e:
-                    logger.warning(
-                        f"[add_item_by_name] Could not find/click add button for '{item_name}': {e}"
-                    )
-                    return False
-        logger.warning(f"[add_item_by_name] Item '{item_name}' not found on page")
-        return False
+        return self.add_items([item_name])[item_name]
 
     def remove_item_by_name(self, item_name):
         """Remove an item from the cart by its name. Returns True if successful."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        import selenium.common.exceptions
-
-        logger = logging.getLogger(__name__)
-        items = self.driver.find_elements(*self.ITEM_NAMES)
-        for item in items:
-            if item.text == item_name:
-                parent = item.find_element(By.XPATH, "../../..")
-                data_test = self._data_test_value("remove-", item_name)
-                logger.info(
-                    f"[remove_item_by_name] Looking for button with data-test='{data_test}' for item '{item_name}'"
+        return self.remove_items([item_name])[item_name]
+
+    def add_items(self, item_names):
+        """Add several items in one pass. Returns a dict of item name -> success."""
+        return self._toggle_items(item_names, add=True)
+
+    def remove_items(self, item_names):
+        """Remove several items in one pass. Returns a dict of item name -> success."""
+        return self._toggle_items(item_names, add=False)
+
+    def _toggle_items(self, item_names, add):
+        """
+        Resolve every add/remove button in one script call, click them in order
+        and wait once for the badge to reach the final count.
+        """
+        action = "add_items" if add else "remove_items"
+        results = {name: False for name in item_names}
+        items, buttons, prev_count = self._resolve_buttons(list(results), add)
+        clicked = []
+        for name in results:
+            item, button = items.get(name), buttons.get(name)
+            if item is None:
+                self._log_event(
+                    "item_not_found", logging.WARNING, action=action, item=name
                 )
+            elif button is None:
+                item.in_cart = add
+                self._log_event("no_button", logging.WARNING, action=action, item=name)
+            else:
                 try:
-                    remove_btn = parent.find_element(
-                        By.XPATH, f".//button[@data-test='{data_test}']"
-                    )
-                    prev_count = self.get_cart_count()
-                    remove_btn.click()
-                    logger.info(
-                        f"[remove_item_by_name] Clicked remove button for '{item_name}'"
-                    )
-                    try:
-                        WebDriverWait(self.driver, 5).until(
-                            lambda d: self.get_cart_count() == max(prev_count - 1, 0)
-                        )
-                        logger.info(
-                            f"[remove_item_by_name] Cart count updated to {self.get_cart_count()} after remove."
-                        )
-                        return True
-                    except selenium.common.exceptions.TimeoutException:
-                        logger.warning(
-                            f"[remove_item_by_name] Cart count did not update after removing '{item_name}'."
-                        )
-                        return False
-                except Exception as e:
-                    logger.warning(
-                        f"[remove_item_by_name] Could not find/click remove button for '{item_name}': {e}"
+                    button.click()
+                    clicked.append(item)
+                except WebDriverException as e:
+                    self._log_event(
+                        "click_failed",
+                        logging.WARNING,
+                        action=action,
+                        item=name,
+                        error=e,
                     )
-                    return False
-        logger.warning(f"[remove_item_by_name] Item '{item_name}' not found on page")
-        return False
+        if not clicked:
+            return results
+        delta = len(clicked) if add else -len(clicked)
+        expected = max(prev_count + delta, 0)
+        if not self.wait_for_cart_count(expected):
+            self._log_event(
+                "cart_count_mismatch", logging.WARNING, action=action, expected=expected
+            )
+            self.invalidate_catalog()
+            for item in clicked:
+                fresh = self.get_item(item.name)
+                results[item.name] = fresh is not None and fresh.in_cart == add
+            return results
+        for item in clicked:
+            item.in_cart = add
+            results[item.name] = True
+        self._log_event(action, count=expected, items=tuple(results))
+        return results
+
+    def _resolve_buttons(self, item_names, add):
+        """
+        Look up the add/remove buttons for item_names in one script call.
+        Returns (items by name, buttons by name, cart count). The snapshot is
+        rebuilt once if the page navigated or re-rendered; raises
+        StaleElementReferenceException if it is still stale after that.
+        """
+        for _ in range(2):
+            fresh = self._catalog is None
+            items = {}
+            for name in item_names:
+                item = self.get_item(name)
+                if item is not None:
+                    items[name] = item
+            if len(items) < len(item_names) and not fresh:
+                self.invalidate_catalog()
+                continue
+            data_tests = [
+                item.add_id if add else item.remove_id for item in items.values()
+            ]
+            state = self.driver.execute_script(
+                RESOLVE_BUTTONS_SCRIPT, self.catalog.token, data_tests
+            )
+            if not state["stale"]:
+                buttons = dict(zip(items, state["buttons"]))
+                return items, buttons, state["count"]
+            self.invalidate_catalog()
+        self._log_event("catalog_stale", logging.WARNING, items=tuple(item_names))
+        raise StaleElementReferenceException(
+            "Products page re-rendered while resolving its buttons twice in a row"
+        )
 
     def get_cart_count(self):
-        """Return the number of items in the cart badge."""
-        if self.is_visible(*self.CART_BADGE):
-            return int(self.find(*self.CART_BADGE).text)
-        return 0
+        """
+        Return the number of items in the cart badge.
+        Reads the cart link (the badge lives inside it) as soon as the header or
+        the login form has rendered, so an empty cart returns immediately.
+        """
+        result = self.wait_for_condition(CART_COUNT_SCRIPT, key="js:cart-count")
+        return result["count"] if result else 0
+
+    def wait_for_cart_count(self, count, timeout=5):
+        """Wait until the cart badge shows count (no badge means 0). Returns bool."""
+        return bool(
+            self.wait_for_condition(
+                CART_COUNT_PREDICATE, count, timeout=timeout, key="js:cart-count-equals"
+            )
+        )
 
     def go_to_cart(self):
         """Navigate to the cart page."""
+        self.invalidate_catalog()
+        self._log_event("go_to_cart")
         self.click(*self.CART_LINK)
+        self.invalidate_elements()
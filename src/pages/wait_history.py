@@ -0,0 +1,108 @@
+"""
+Learned wait timeouts for SauceDemo automation.
+Keeps the observed latency of each locator/condition across runs and turns
+it into a deadline (p99 x safety factor, capped) and a poll interval.
+"""
+
+import json
+import math
+import os
+import statistics
+import tempfile
+
+DEFAULT_HISTORY_FILE = ".wait_history.json"
+# Most recent waits kept per key.
+MAX_SAMPLES = 100
+# Fewer samples than this and the caller's timeout is used unchanged.
+MIN_SAMPLES = 10
+SAFETY_FACTOR = 3.0
+MIN_DEADLINE = 1.0
+MAX_DEADLINE = 30.0
+MIN_POLL = 0.05
+MAX_POLL = 0.5
+
+
+class WaitHistory:
+    """JSON file of wait key -> recent wait latencies in seconds."""
+
+    def __init__(self, path=DEFAULT_HISTORY_FILE):
+        self.path = path
+        self.samples = self._load()
+        self._new = {}
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return {k: list(v) for k, v in json.load(f)["waits"].items()}
+        except (OSError, ValueError, KeyError, AttributeError):
+            return {}
+
+    def record(self, key, seconds):
+        """Record a wait that succeeded after seconds."""
+        self.extend({key: [round(seconds, 4)]})
+
+    def record_timeout(self, key, seconds):
+        """
+        Record a wait that gave up after seconds. Its latency is at least that,
+        so it is kept as a sample: the p99 rises to cover it and the next
+        deadline is SAFETY_FACTOR times longer, instead of timing out again.
+        """
+        self.record(key, seconds)
+
+    def extend(self, new_samples):
+        """Add {key: [seconds, ...]} recorded elsewhere (e.g. by an xdist worker)."""
+        for key, values in new_samples.items():
+            for store in (self.samples, self._new):
+                samples = store.setdefault(key, [])
+                samples.extend(values)
+                del samples[:-MAX_SAMPLES]
+
+    def take_new(self):
+        """Return and forget the samples recorded since the last call or save."""
+        new, self._new = self._new, {}
+        return new
+
+    def p99(self, key):
+        """Nearest-rank 99th percentile of the key's latencies, or None if unknown."""
+        samples = self.samples.get(key, ())
+        if len(samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[math.ceil(0.99 * len(ordered)) - 1]
+
+    def deadline(self, key, timeout):
+        """
+        Return the seconds to wait for key: p99 x SAFETY_FACTOR (at least
+        MIN_DEADLINE) once enough history exists, never more than timeout or
+        MAX_DEADLINE.
+        """
+        p99 = self.p99(key)
+        if p99 is None:
+            return min(timeout, MAX_DEADLINE)
+        return min(timeout, MAX_DEADLINE, max(MIN_DEADLINE, p99 * SAFETY_FACTOR))
+
+    def poll_interval(self, key):
+        """Poll about four times per typical wait, between MIN_POLL and MAX_POLL."""
+        samples = self.samples.get(key)
+        if not samples or len(samples) < MIN_SAMPLES:
+            return MAX_POLL
+        return min(MAX_POLL, max(MIN_POLL, statistics.median(samples) / 4))
+
+    def save(self):
+        """
+        Merge this run's samples into the file (another run may have written).
+        Only one process per run may save: xdist workers hand their samples
+        to the controller instead.
+        """
+        if not self._new:
+            return
+        merged = self._load()
+        for key, samples in self._new.items():
+            merged[key] = (merged.get(key, []) + samples)[-MAX_SAMPLES:]
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"waits": merged}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.samples = merged
+        self._new = {}
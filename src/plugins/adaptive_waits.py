@@ -0,0 +1,66 @@
+"""
+Learned wait deadlines for SauceDemo automation.
+Loads the wait history before the run, lets the page objects learn from
+every wait, and merges the new samples back into the file afterwards. Under
+xdist, workers pass their samples to the controller on each test's teardown
+report, so only the controller writes the file.
+"""
+
+import pytest
+from src.pages.base_page import BasePage
+from src.pages.wait_history import DEFAULT_HISTORY_FILE, WaitHistory
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("adaptive-waits", "Learned wait timeouts")
+    group.addoption(
+        "--wait-history",
+        metavar="PATH",
+        default=DEFAULT_HISTORY_FILE,
+        help=f"Per-locator wait latencies kept across runs (default: {DEFAULT_HISTORY_FILE})",
+    )
+    group.addoption(
+        "--no-adaptive-waits",
+        action="store_true",
+        default=False,
+        help="Use the fixed page timeouts and do not record wait latencies",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if config.getoption("--no-adaptive-waits"):
+        return
+    history = WaitHistory(config.getoption("--wait-history"))
+    BasePage.set_wait_history(history)
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(WaitSampleCollector(history), "wait_samples")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    history = BasePage.wait_history
+    if call.when == "teardown" and history is not None:
+        if hasattr(item.config, "workerinput"):
+            outcome.get_result().wait_samples = history.take_new()
+
+
+def pytest_unconfigure(config):
+    history = BasePage.wait_history
+    if history is not None:
+        if not hasattr(config, "workerinput"):
+            history.save()
+        BasePage.set_wait_history(None)
+
+
+class WaitSampleCollector:
+    """Controller-side merge of the wait samples reported by xdist workers."""
+
+    def __init__(self, history):
+        self.history = history
+
+    def pytest_runtest_logreport(self, report):
+        samples = getattr(report, "wait_samples", None)
+        if samples:
+            self.history.extend(samples)
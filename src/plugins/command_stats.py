@@ -0,0 +1,105 @@
+"""
+Per-test WebDriver command accounting for SauceDemo automation.
+Attaches a CommandRecorder to each test's driver and publishes the summary
+to the JUnit XML properties, the pytest-html report and a JSON file.
+"""
+
+import html
+import json
+import pytest
+from src.drivers.instrumentation import CommandRecorder
+
+STASH_KEY = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("command-stats", "WebDriver command accounting")
+    group.addoption(
+        "--command-stats",
+        metavar="PATH",
+        default=None,
+        help="Write per-test WebDriver command summaries to this JSON file",
+    )
+    group.addoption(
+        "--no-command-stats",
+        action="store_true",
+        default=False,
+        help="Do not instrument WebDriver commands",
+    )
+
+
+def pytest_configure(config):
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            CommandStatsWriter(config), "command_stats_writer"
+        )
+
+
+@pytest.fixture(scope="function")
+def command_recorder(request):
+    """A fresh CommandRecorder for this test, or None if disabled."""
+    if request.config.getoption("--no-command-stats"):
+        return None
+    recorder = CommandRecorder()
+    request.node.stash[STASH_KEY] = recorder
+    return recorder
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    recorder = item.stash.get(STASH_KEY, None)
+    summary = None
+    if recorder is not None and call.when == "call":
+        summary = recorder.summary()
+        item.user_properties.extend(
+            [
+                ("webdriver_commands", summary["command_count"]),
+                ("webdriver_remote_time", summary["remote_time"]),
+                ("webdriver_wait_time", summary["wait_time"]),
+                ("webdriver_action_time", summary["action_time"]),
+            ]
+        )
+    outcome = yield
+    if summary is None:
+        return
+    report = outcome.get_result()
+    report.command_stats = summary
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if pytest_html is not None:
+        extras = getattr(report, "extras", [])
+        extras.append(pytest_html.extras.html(_html_summary(summary)))
+        report.extras = extras
+
+
+def _html_summary(summary):
+    rows = "".join(
+        f"<tr><td>{html.escape(entry['locator'])}</td><td>{entry['count']}</td>"
+        f"<td>{entry['time'] * 1000:.1f} ms</td></tr>"
+        for entry in summary["top_locators"]
+    )
+    return (
+        f"<p>WebDriver: {summary['command_count']} commands, "
+        f"{summary['remote_time'] * 1000:.1f} ms remote "
+        f"({summary['wait_time'] * 1000:.1f} ms waiting, "
+        f"{summary['action_time'] * 1000:.1f} ms actions)</p>"
+        f"<table><tr><th>Locator</th><th>Commands</th><th>Time</th></tr>{rows}</table>"
+    )
+
+
+class CommandStatsWriter:
+    """Controller-side collector writing the --command-stats JSON file."""
+
+    def __init__(self, config):
+        self.path = config.getoption("--command-stats")
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        summary = getattr(report, "command_stats", None)
+        if summary is not None:
+            self.tests[report.nodeid] = dict(summary, outcome=report.outcome)
+
+    def pytest_sessionfinish(self):
+        if not self.path or not self.tests:
+            return
+        with open(self.path, "w") as f:
+            json.dump({"tests": self.tests}, f, indent=2, sort_keys=True)
@@ -0,0 +1,158 @@
+"""
+Duration-aware parallel scheduling for SauceDemo automation.
+Records per-test durations across runs and, under pytest-xdist, hands tests
+to workers longest-first (LPT) so slow tests spread evenly over the workers.
+"""
+
+import json
+import os
+import tempfile
+import pytest
+
+DEFAULT_DURATIONS_FILE = ".test_durations.json"
+# Weight of the newest run in the stored moving average.
+SMOOTHING = 0.5
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist is optional; serial runs still record
+    LoadScheduling = None
+
+
+class DurationStore:
+    """JSON file of node id -> smoothed duration in seconds."""
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path) as f:
+                self.durations = json.load(f)
+        except (OSError, ValueError):
+            self.durations = {}
+
+    def estimate(self, nodeid):
+        """Return the recorded duration, or the mean of known tests if unseen."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if not self.durations:
+            return 0.0
+        return sum(self.durations.values()) / len(self.durations)
+
+    def record(self, nodeid, seconds):
+        previous = self.durations.get(nodeid)
+        if previous is None:
+            self.durations[nodeid] = seconds
+        else:
+            self.durations[nodeid] = SMOOTHING * seconds + (1 - SMOOTHING) * previous
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+if LoadScheduling is not None:
+
+    class DurationScheduling(LoadScheduling):
+        """
+        Longest-processing-time-first scheduling on top of xdist's load mode.
+        Pending tests are ordered by recorded duration and each worker is kept
+        two tests deep, so whichever worker frees up next takes the longest
+        remaining test.
+        """
+
+        def __init__(self, config, log, store):
+            super().__init__(config, log)
+            self.store = store
+
+        def schedule(self):
+            assert self.collection_is_completed
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = next(iter(self.node2collection.values()))
+            self.pending[:] = sorted(
+                range(len(self.collection)),
+                key=lambda index: -self.store.estimate(self.collection[index]),
+            )
+            # Deal the two longest tests per worker round-robin; a worker only
+            # starts a test once it knows the next one.
+            for _ in range(2):
+                for node in self.nodes:
+                    self._send_tests(node, 1)
+            if not self.pending:
+                for node in self.nodes:
+                    node.shutdown()
+
+        def check_schedule(self, node, duration=0):
+            if node.shutting_down:
+                return
+            if self.pending:
+                missing = 2 - len(self.node2pending[node])
+                if missing > 0:
+                    self._send_tests(node, missing)
+            else:
+                node.shutdown()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sharding", "Duration-aware parallel scheduling")
+    group.addoption(
+        "--durations-file",
+        default=DEFAULT_DURATIONS_FILE,
+        help=f"Where per-test durations are recorded (default: {DEFAULT_DURATIONS_FILE})",
+    )
+    group.addoption(
+        "--no-lpt",
+        action="store_true",
+        default=False,
+        help="Use xdist's default load scheduling instead of longest-first",
+    )
+
+
+class DurationRecorder:
+    """Controller-side plugin summing each test's phase durations."""
+
+    def __init__(self, store):
+        self.store = store
+        self.totals = {}
+
+    def pytest_runtest_logreport(self, report):
+        # Under xdist this receives the reports forwarded by every worker.
+        self.totals[report.nodeid] = self.totals.get(report.nodeid, 0.0) + (
+            report.duration
+        )
+
+    def pytest_sessionfinish(self):
+        if not self.totals:
+            return
+        for nodeid, seconds in self.totals.items():
+            self.store.record(nodeid, seconds)
+        self.store.save()
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        return
+    path = os.path.join(str(config.rootpath), config.getoption("--durations-file"))
+    recorder = DurationRecorder(DurationStore(path))
+    config.pluginmanager.register(recorder, "duration_recorder")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    recorder = config.pluginmanager.get_plugin("duration_recorder")
+    if (
+        LoadScheduling is None
+        or recorder is None
+        or config.getoption("--no-lpt")
+        or config.getvalue("dist") != "load"
+    ):
+        return None
+    return DurationScheduling(config, log, recorder.store)
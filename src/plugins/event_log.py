@@ -0,0 +1,138 @@
+"""
+Failure-only page-object event log for SauceDemo automation.
+Page-object events are queued unformatted to a background thread that keeps
+the most recent ones for each running test in a ring buffer. A failing test
+gets its whole buffer written into its report; a passing test's is dropped.
+"""
+
+import collections
+import logging
+import logging.handlers
+import queue
+import pytest
+from src.pages import events
+
+LOG_KEY = pytest.StashKey()
+DEFAULT_CAPACITY = 500
+EVENT_FORMAT = "%(asctime)s.%(msecs)03d %(levelname)-7s %(message)s"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("event-log", "Page-object event log")
+    group.addoption(
+        "--event-buffer",
+        type=int,
+        default=DEFAULT_CAPACITY,
+        metavar="N",
+        help=f"Page-object events kept per test for failure reports (default: {DEFAULT_CAPACITY})",
+    )
+    group.addoption(
+        "--no-event-log",
+        action="store_true",
+        default=False,
+        help="Do not record page-object events",
+    )
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records as they are; they are only formatted on a failure."""
+
+    def __init__(self, event_log):
+        super().__init__(event_log.queue)
+        self.event_log = event_log
+
+    def prepare(self, record):
+        record.test_id = self.event_log.current
+        return record
+
+
+class _RingBufferHandler(logging.Handler):
+    """Runs on the listener thread and files records under their test."""
+
+    def __init__(self, event_log):
+        super().__init__()
+        self.event_log = event_log
+
+    def emit(self, record):
+        buffer = self.event_log.buffers.get(getattr(record, "test_id", None))
+        if buffer is not None:
+            buffer.append(record)
+
+
+class EventLog:
+    """Per-test ring buffers of page-object events fed by a QueueListener."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.queue = queue.Queue()
+        self.buffers = {}
+        self.current = None
+        self.formatter = logging.Formatter(EVENT_FORMAT, datefmt="%H:%M:%S")
+        self._handler = _DeferredQueueHandler(self)
+        self._listener = logging.handlers.QueueListener(
+            self.queue, _RingBufferHandler(self)
+        )
+
+    def start(self):
+        """Route every page-object event, DEBUG and up, into the buffers only."""
+        self._listener.start()
+        events.route_to(self._handler)
+
+    def stop(self):
+        events.route_to(None)
+        self._listener.stop()
+
+    def begin(self, test_id):
+        self.buffers[test_id] = collections.deque(maxlen=self.capacity)
+        self.current = test_id
+
+    def end(self, test_id):
+        self.current = None
+        self.buffers.pop(test_id, None)
+
+    def dump(self, test_id):
+        """Wait for queued events, then return the test's buffer as text."""
+        self.queue.join()
+        return "\n".join(
+            self.formatter.format(record) for record in self.buffers.get(test_id, ())
+        )
+
+
+def pytest_configure(config):
+    if config.getoption("--no-event-log"):
+        return
+    event_log = EventLog(config.getoption("--event-buffer"))
+    event_log.start()
+    config.stash[LOG_KEY] = event_log
+
+
+def pytest_unconfigure(config):
+    event_log = config.stash.get(LOG_KEY, None)
+    if event_log is not None:
+        event_log.stop()
+        del config.stash[LOG_KEY]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    event_log = item.config.stash.get(LOG_KEY, None)
+    if event_log is None:
+        yield
+        return
+    event_log.begin(item.nodeid)
+    try:
+        yield
+    finally:
+        event_log.end(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    event_log = item.config.stash.get(LOG_KEY, None)
+    if event_log is None or not report.failed:
+        return
+    text = event_log.dump(item.nodeid)
+    if text:
+        report.sections.append((f"Captured page event log {report.when}", text))
@@ -0,0 +1,126 @@
+"""
+Failure-only diagnostics for SauceDemo automation.
+When a test fails, captures its driver's screenshot, page source, console log,
+cookies and storage before the browser is reset, and hands them to a
+background ArtifactWriter. Passing tests cost nothing.
+"""
+
+import base64
+import os
+import re
+import pytest
+from src.drivers.diagnostics import ArtifactWriter, capture
+
+WRITER_KEY = pytest.StashKey()
+DEFAULT_DIR = "test-diagnostics"
+DEFAULT_MAX_MB = 100.0
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("diagnostics", "Failure diagnostics")
+    group.addoption(
+        "--diagnostics-dir",
+        metavar="PATH",
+        default=DEFAULT_DIR,
+        help=f"Where failure artifacts are written (default: {DEFAULT_DIR})",
+    )
+    group.addoption(
+        "--diagnostics-max-mb",
+        type=float,
+        default=DEFAULT_MAX_MB,
+        help=f"Total failure artifact size per run (default: {DEFAULT_MAX_MB:g})",
+    )
+    group.addoption(
+        "--no-diagnostics",
+        action="store_true",
+        default=False,
+        help="Do not capture anything from failing tests",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--no-diagnostics"):
+        return
+    # Every xdist worker writes on its own, so each gets an equal share of the cap.
+    workers = getattr(config, "workerinput", {}).get("workercount", 1)
+    max_bytes = config.getoption("--diagnostics-max-mb") * 1024 * 1024 / workers
+    config.stash[WRITER_KEY] = ArtifactWriter(
+        config.getoption("--diagnostics-dir"), max_bytes
+    )
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DiagnosticsReport(config), "diagnostics_report")
+
+
+def pytest_unconfigure(config):
+    writer = config.stash.get(WRITER_KEY, None)
+    if writer is not None:
+        writer.close()
+        del config.stash[WRITER_KEY]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    writer = item.config.stash.get(WRITER_KEY, None)
+    # After teardown the browser has already been reset for the next test.
+    if writer is None or not report.failed or call.when == "teardown":
+        return
+    driver = item.funcargs.get("driver")
+    if driver is None:
+        return
+    artifacts = capture(driver)
+    name = re.sub(r"[^\w.-]+", "_", item.nodeid).strip("_")[-150:]
+    accepted = writer.submit(f"{name}-{call.when}", artifacts)
+    report.diagnostics = {
+        "files": sorted(accepted.values()),
+        "dropped": sorted(
+            filename
+            for filename in artifacts
+            if filename not in accepted and filename + ".gz" not in accepted
+        ),
+    }
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if pytest_html is None or not accepted:
+        return
+    html_path = item.config.getoption("htmlpath", None)
+    report_dir = os.path.dirname(os.path.abspath(html_path or "."))
+    extras = getattr(report, "extras", [])
+    for filename, path in accepted.items():
+        if filename == "screenshot.png":
+            content = base64.b64encode(artifacts[filename]).decode()
+            extras.append(pytest_html.extras.png(content, "Screenshot"))
+        else:
+            link = os.path.relpath(os.path.abspath(path), report_dir)
+            extras.append(pytest_html.extras.url(link, filename))
+    report.extras = extras
+
+
+class DiagnosticsReport:
+    """Controller-side summary of the artifacts written for failing tests."""
+
+    def __init__(self, config):
+        self.root = config.getoption("--diagnostics-dir")
+        self.max_mb = config.getoption("--diagnostics-max-mb")
+        self.tests = 0
+        self.dropped = 0
+
+    def pytest_runtest_logreport(self, report):
+        diagnostics = getattr(report, "diagnostics", None)
+        if diagnostics is None:
+            return
+        self.tests += 1
+        self.dropped += len(diagnostics["dropped"])
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        terminalreporter.write_sep("-", "failure diagnostics")
+        terminalreporter.write_line(
+            f"artifacts for {self.tests} failed tests written under {self.root}"
+        )
+        if self.dropped:
+            terminalreporter.write_line(
+                f"{self.dropped} artifacts skipped to stay under "
+                f"--diagnostics-max-mb={self.max_mb:g}"
+            )
@@ -0,0 +1,538 @@
+"""
+Change-based test selection for SauceDemo automation.
+Records which page-object methods and locator constants each test touches
+(e.g. ProductsPage.add_items, CartPage.CONTINUE_SHOPPING) into an index that
+is refreshed on every run, and with --impact-diff REF runs only the tests
+whose recorded symbols a git diff against REF changed. Symbols used while
+setting up a fixture are credited to every test that requests the fixture,
+so work done once per session is not pinned on whichever test ran first.
+"""
+
+import ast
+import functools
+import inspect
+import json
+import os
+import re
+import subprocess
+import tempfile
+from contextlib import contextmanager
+import pytest
+from src.pages.base_page import BasePage
+
+# Imported for their page classes.
+import src.pages.cart_page  # noqa: F401
+import src.pages.login_page  # noqa: F401
+import src.pages.products_page  # noqa: F401
+
+DEFAULT_INDEX_FILE = ".test_impact.json"
+# Changes to these never affect a test outcome.
+IGNORED_PATHS = re.compile(r"(\.md|^\.gitignore|^LICENSE)$")
+HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+# With --no-renames both sides name the same path.
+DIFF_HEADER = re.compile(r"^diff --git a/(.*) b/\1$")
+INDEX_KEY = pytest.StashKey()
+TRACER_KEY = pytest.StashKey()
+REASON_KEY = pytest.StashKey()
+
+# Symbols touched by the running test (or fixture), or None between tests.
+_active = None
+# Fixture name -> symbols used while setting it up (or on its behalf).
+_fixture_symbols = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "Change-based test selection")
+    group.addoption(
+        "--impact-index",
+        metavar="PATH",
+        default=DEFAULT_INDEX_FILE,
+        help=f"Test -> page-object symbol index (default: {DEFAULT_INDEX_FILE})",
+    )
+    group.addoption(
+        "--impact-diff",
+        metavar="REF",
+        default=None,
+        help="Only run tests affected by the changes since git REF (e.g. origin/main)",
+    )
+    group.addoption(
+        "--no-impact-index",
+        action="store_true",
+        default=False,
+        help="Do not record which page-object symbols each test uses",
+    )
+
+
+def page_classes():
+    """BasePage and every page object class derived from it."""
+    classes, pending = [], [BasePage]
+    while pending:
+        cls = pending.pop()
+        classes.append(cls)
+        pending.extend(cls.__subclasses__())
+    return classes
+
+
+def _definer(cls, name):
+    for base in cls.__mro__:
+        if name in vars(base):
+            return base
+    return None
+
+
+def _is_locator(value):
+    return (
+        isinstance(value, tuple)
+        and len(value) == 2
+        and all(isinstance(part, str) for part in value)
+    )
+
+
+def _is_traced(value):
+    """True if PageTracer records value itself when it is used."""
+    return isinstance(value, (property, classmethod)) or _is_locator(value)
+
+
+class PageTracer:
+    """Wraps page-object methods to record receiver-qualified symbols."""
+
+    def __init__(self, classes):
+        self.classes = classes
+        # (by, value) -> {"Class.CONSTANT", ...} for every class that has it.
+        self.locators = {}
+        for cls in classes:
+            for name in dir(cls):
+                value = getattr(cls, name, None)
+                if name.isupper() and _is_locator(value):
+                    self.locators.setdefault(value, set()).add(f"{cls.__name__}.{name}")
+        self._originals = []
+
+    def install(self):
+        for cls in self.classes:
+            for name, member in list(vars(cls).items()):
+                if name.startswith("__"):
+                    continue
+                if isinstance(member, property) and member.fget is not None:
+                    traced = property(
+                        self._trace(member.fget, name),
+                        member.fset,
+                        member.fdel,
+                        member.__doc__,
+                    )
+                elif isinstance(member, classmethod):
+                    traced = classmethod(self._trace(member.__func__, name))
+                elif inspect.isfunction(member):
+                    traced = self._trace(member, name)
+                else:
+                    continue
+                self._originals.append((cls, name, member))
+                setattr(cls, name, traced)
+
+    def uninstall(self):
+        for cls, name, member in reversed(self._originals):
+            setattr(cls, name, member)
+        self._originals = []
+
+    def _trace(self, func, name):
+        locators = self.locators
+
+        @functools.wraps(func)
+        def traced(owner, *args, **kwargs):
+            symbols = _active
+            if symbols is not None:
+                cls = owner if isinstance(owner, type) else type(owner)
+                symbols.add(f"{cls.__name__}.{name}")
+                if len(args) >= 2 and isinstance(args[0], str):
+                    symbols.update(locators.get(args[:2], ()))
+            return func(owner, *args, **kwargs)
+
+        return traced
+
+
+class _Member:
+    """A class member or module constant in a page module, with its line range."""
+
+    def __init__(self, owner, name, node):
+        self.owner = owner
+        self.name = name
+        decorators = getattr(node, "decorator_list", ())
+        self.start = min([node.lineno] + [d.lineno for d in decorators])
+        self.end = node.end_lineno
+        self.names = set()
+        self.attrs = set()
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                self.names.add(child.id)
+            elif isinstance(child, ast.Attribute):
+                self.attrs.add(child.attr)
+
+
+class ChangeMapper:
+    """Maps changed lines of page modules to the receiver-qualified symbols they affect."""
+
+    def __init__(self, classes):
+        self.classes = classes
+        self._modules = {}
+
+    def _module(self, path):
+        if path not in self._modules:
+            self._modules[path] = self._parse(path)
+        return self._modules[path]
+
+    def _parse(self, path):
+        classes = {
+            cls.__name__: cls
+            for cls in self.classes
+            if os.path.abspath(inspect.getsourcefile(cls)) == path
+        }
+        if not classes:
+            return None
+        with open(path) as f:
+            source = f.read()
+        tree = ast.parse(source)
+        members, constants, class_spans, ignorable = [], [], {}, set()
+        # Names read outside the page classes (helper classes, functions),
+        # which the tracer never sees.
+        untraced = set()
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name in classes:
+                class_spans[node.name] = (node.lineno, node.end_lineno)
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        members.append(_Member(classes[node.name], item.name, item))
+                    elif isinstance(item, ast.Assign):
+                        for target in item.targets:
+                            if isinstance(target, ast.Name):
+                                members.append(
+                                    _Member(classes[node.name], target.id, item)
+                                )
+                    elif isinstance(item, ast.Expr):
+                        ignorable.update(range(item.lineno, item.end_lineno + 1))
+            elif isinstance(node, ast.Assign) and all(
+                isinstance(target, ast.Name) for target in node.targets
+            ):
+                for target in node.targets:
+                    constants.append(_Member(None, target.id, node))
+            elif isinstance(node, ast.Expr) and node is tree.body[0]:
+                ignorable.update(range(node.lineno, node.end_lineno + 1))
+            elif not isinstance(node, (ast.Import, ast.ImportFrom)):
+                untraced.update(_Member(None, None, node).names)
+        lines = source.splitlines()
+        for number, line in enumerate(lines, 1):
+            if not line.strip() or line.strip().startswith("#"):
+                ignorable.add(number)
+        return {
+            "members": members,
+            "constants": constants,
+            "class_spans": class_spans,
+            "ignorable": ignorable,
+            "untraced": untraced,
+            "classes": classes,
+        }
+
+    def _expand(self, definer, name):
+        """Symbols of every class that inherits name from definer."""
+        return {
+            f"{cls.__name__}.{name}"
+            for cls in self.classes
+            if _definer(cls, name) is definer
+        }
+
+    def _all_members(self):
+        paths = {os.path.abspath(inspect.getsourcefile(cls)) for cls in self.classes}
+        return [m for path in sorted(paths) for m in self._module(path)["members"]]
+
+    def _users_of_attr(self, definer, name):
+        """
+        Methods (of classes inheriting name from definer) that read self.name,
+        wherever they are defined (e.g. BasePage methods reading a subclass's
+        READY_PREDICATE).
+        """
+        symbols = set()
+        members = self._all_members()
+        for cls in self.classes:
+            if _definer(cls, name) is not definer:
+                continue
+            for member in members:
+                if name in member.attrs and issubclass(cls, member.owner):
+                    if _definer(cls, member.name) is member.owner:
+                        symbols.add(f"{cls.__name__}.{member.name}")
+        return symbols
+
+    def symbols(self, path, lines):
+        """
+        Return the symbols affected by changing lines of path, or None if the
+        change cannot be attributed (callers then run everything).
+        """
+        module = self._module(path)
+        if module is None:
+            return None
+        members = module["members"]
+        changed, pending = set(), []
+        for line in lines:
+            if line in module["ignorable"]:
+                continue
+            hit = [m for m in members + module["constants"] if m.start <= line <= m.end]
+            if hit:
+                pending.extend(hit)
+                continue
+            spans = [
+                name
+                for name, (start, end) in module["class_spans"].items()
+                if start <= line <= end
+            ]
+            if not spans:
+                return None
+            # A class header or other class-level line: the whole class.
+            pending.extend(m for m in members if m.owner.__name__ in spans)
+        seen = set()
+        while pending:
+            member = pending.pop()
+            if (member.owner, member.name) in seen:
+                continue
+            seen.add((member.owner, member.name))
+            if member.owner is None:
+                # Module constant: methods, class constants and other module
+                # constants using it. One read by untraced code, or by nothing
+                # here, cannot be attributed.
+                if member.name in module["untraced"]:
+                    return None
+                readers = [
+                    m
+                    for m in members + module["constants"]
+                    if m is not member and member.name in m.names
+                ]
+                if not readers:
+                    return None
+                pending.extend(readers)
+                continue
+            changed |= self._expand(member.owner, member.name)
+            value = vars(member.owner).get(member.name)
+            if not inspect.isfunction(value):
+                users = self._users_of_attr(member.owner, member.name)
+                # A plain class constant is only recorded through its readers.
+                if not users and not _is_traced(value):
+                    return None
+                changed |= users
+        return changed
+
+
+@contextmanager
+def attribute_to_fixture(name):
+    """
+    Credit the page-object symbols used in the block to fixture name (and so
+    to every test requesting it) rather than to the running test. For
+    session helpers doing lazy one-off work, such as a login captured on
+    first use.
+    """
+    global _active
+    outer, _active = _active, set()
+    try:
+        yield
+    finally:
+        used, _active = _active, outer
+        _fixture_symbols.setdefault(name, set()).update(used)
+
+
+def changed_lines(ref, cwd):
+    """
+    Return {path: set of changed line numbers (new side)} for git diff ref.
+    A deleted file maps to None. A file changed without a text hunk, such as
+    a binary or a mode change, maps to an empty set.
+    """
+    output = subprocess.run(
+        ["git", "diff", "--unified=0", "--no-color", "--no-renames", ref, "--"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    changes, path, in_header = {}, None, False
+    for line in output.splitlines():
+        if line.startswith("diff --git "):
+            header = DIFF_HEADER.match(line)
+            # A quoted (unusual) path is kept verbatim; it matches nothing
+            # in the index, so it runs everything.
+            path = header.group(1) if header else line[len("diff --git ") :]
+            changes.setdefault(path, set())
+            in_header = True
+        elif in_header and line == "+++ /dev/null":
+            changes[path] = None
+        else:
+            match = HUNK.match(line)
+            if match is None:
+                continue
+            in_header = False
+            if changes[path] is None:
+                continue
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            # A pure deletion touches the lines either side of it.
+            touched = range(start, start + count) if count else (start, start + 1)
+            changes[path].update(touched)
+    return changes
+
+
+class ImpactIndex:
+    """JSON file of node id -> page-object symbols the test used."""
+
+    def __init__(self, path):
+        self.path = path
+        self.tests = self._load()
+        self._new = {}
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return {k: set(v) for k, v in json.load(f)["tests"].items()}
+        except (OSError, ValueError, KeyError, AttributeError):
+            return {}
+
+    def record(self, nodeid, symbols):
+        self.tests[nodeid] = self._new[nodeid] = set(symbols)
+
+    def save(self):
+        """Merge this run's tests into the file, replacing their old entries."""
+        if not self._new:
+            return
+        merged = dict(self._load(), **self._new)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {"tests": {k: sorted(v) for k, v in merged.items()}},
+                f,
+                indent=1,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, self.path)
+        self.tests = merged
+        self._new = {}
+
+
+def select(items, index, changes, mapper, rootdir):
+    """
+    Split items into (selected, deselected, reason) for the changed lines.
+    Everything is selected when a change cannot be attributed to symbols.
+    """
+    symbols, test_files = set(), set()
+    for path, lines in changes.items():
+        if IGNORED_PATHS.search(path):
+            continue
+        if os.path.basename(path).startswith("test_") and path.startswith("tests/"):
+            test_files.add(path)
+            continue
+        if lines is None:
+            return items, [], f"{path} was deleted"
+        affected = None
+        if path.startswith("src/pages/") and path.endswith(".py"):
+            affected = mapper.symbols(os.path.join(rootdir, path), lines)
+        if affected is None:
+            return items, [], f"{path} changed outside the page-object index"
+        symbols |= affected
+    selected, deselected = [], []
+    for item in items:
+        used = index.tests.get(item.nodeid)
+        if used is None or item.nodeid.split("::")[0] in test_files or used & symbols:
+            selected.append(item)
+        else:
+            deselected.append(item)
+    reason = f"changed: {', '.join(sorted(symbols)) or 'no page-object symbols'}"
+    return selected, deselected, reason
+
+
+def pytest_configure(config):
+    path = os.path.join(str(config.rootpath), config.getoption("--impact-index"))
+    config.stash[INDEX_KEY] = ImpactIndex(path)
+    if not config.getoption("--no-impact-index"):
+        tracer = PageTracer(page_classes())
+        tracer.install()
+        config.stash[TRACER_KEY] = tracer
+        if not hasattr(config, "workerinput"):
+            config.pluginmanager.register(
+                IndexWriter(config.stash[INDEX_KEY]), "impact_index_writer"
+            )
+
+
+def pytest_unconfigure(config):
+    tracer = config.stash.get(TRACER_KEY, None)
+    if tracer is not None:
+        tracer.uninstall()
+        del config.stash[TRACER_KEY]
+    _fixture_symbols.clear()
+
+
+def pytest_collection_modifyitems(config, items):
+    ref = config.getoption("--impact-diff")
+    if not ref:
+        return
+    index = config.stash[INDEX_KEY]
+    rootdir = str(config.rootpath)
+    if not index.tests:
+        config.stash[REASON_KEY] = "no impact index yet; running everything"
+        return
+    try:
+        changes = changed_lines(ref, rootdir)
+    except (OSError, subprocess.CalledProcessError) as e:
+        config.stash[REASON_KEY] = f"git diff {ref} failed ({e}); running everything"
+        return
+    selected, deselected, reason = select(
+        items, index, changes, ChangeMapper(page_classes()), rootdir
+    )
+    config.stash[REASON_KEY] = reason
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    global _active
+    if item.config.stash.get(TRACER_KEY, None) is None:
+        yield
+        return
+    _active = set()
+    try:
+        yield
+    finally:
+        _active = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    if request.config.stash.get(TRACER_KEY, None) is None:
+        yield
+        return
+    with attribute_to_fixture(fixturedef.argname):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when == "teardown" and _active is not None:
+        symbols = set(_active)
+        for name in item.fixturenames:
+            symbols |= _fixture_symbols.get(name, set())
+        outcome.get_result().impact_symbols = sorted(symbols)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    reason = config.stash.get(REASON_KEY, None)
+    if reason is not None:
+        terminalreporter.write_sep("-", "test impact")
+        terminalreporter.write_line(reason)
+
+
+class IndexWriter:
+    """Controller-side collector refreshing the index from this run's tests."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def pytest_runtest_logreport(self, report):
+        symbols = getattr(report, "impact_symbols", None)
+        if symbols is not None:
+            self.index.record(report.nodeid, symbols)
+
+    def pytest_sessionfinish(self):
+        self.index.save()
@@ -0,0 +1,141 @@
+"""
+Per-test network resource blocking for SauceDemo automation.
+Selects a CDP blocklist for each test from its markers, and with
+--network-report counts the requests the blocking saved.
+"""
+
+import pytest
+from src.drivers.network_blocking import (
+    DEFAULT_BLOCKLIST,
+    ResourceBlocker,
+    read_network_log,
+)
+
+STASH_KEY = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("resource-blocking", "Network resource blocking")
+    group.addoption(
+        "--block-resources",
+        action="store_true",
+        default=False,
+        help="Block images, fonts and third-party scripts in every test, "
+        "not only those marked block_resources",
+    )
+    group.addoption(
+        "--no-block-resources",
+        action="store_true",
+        default=False,
+        help="Ignore block_resources markers and load every resource",
+    )
+    group.addoption(
+        "--network-report",
+        action="store_true",
+        default=False,
+        help="Record network traffic and report the requests blocked",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--network-report") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(NetworkReport(), "network_report")
+
+
+class NetworkPolicy:
+    """Blocking settings for one test, applied to its driver."""
+
+    def __init__(self, patterns=(), stubs=None, report=False):
+        self.patterns = tuple(patterns)
+        self.stubs = stubs or {}
+        self.report = report
+        self._blocker = None
+
+    def attach(self, driver):
+        """Apply this test's blocklist to driver."""
+        if self.report:
+            read_network_log(driver)  # discard traffic from before the test
+        self._blocker = ResourceBlocker(driver)
+        self._blocker.block(self.patterns, self.stubs)
+
+    def detach(self):
+        """Remove this test's stub scripts."""
+        if self._blocker is not None:
+            self._blocker.clear_stubs()
+            self._blocker = None
+
+    def collect(self):
+        """
+        Return {requests, transferred, blocked} for the test so far.
+        A blocked request never gets a response, so only its URL is known.
+        """
+        if not self.report or self._blocker is None:
+            return None
+        return read_network_log(self._blocker.driver)
+
+
+@pytest.fixture(scope="function")
+def resource_blocking(request):
+    """The NetworkPolicy for this test, built from its markers and options."""
+    config = request.config
+    patterns, stubs = (), {}
+    marker = request.node.get_closest_marker("block_resources")
+    blocked = config.getoption("--block-resources") or marker is not None
+    if request.node.get_closest_marker("allow_resources"):
+        blocked = False
+    if config.getoption("--no-block-resources"):
+        blocked = False
+    if blocked:
+        extra = marker.args if marker is not None else ()
+        stubs = marker.kwargs.get("stubs", {}) if marker is not None else {}
+        patterns = DEFAULT_BLOCKLIST + tuple(extra)
+    network = NetworkPolicy(patterns, stubs, config.getoption("--network-report"))
+    request.node.stash[STASH_KEY] = network
+    return network
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    network = item.stash.get(STASH_KEY, None)
+    stats = None
+    if network is not None and call.when == "call":
+        stats = network.collect()
+        if stats is not None:
+            item.user_properties.append(("blocked_requests", len(stats["blocked"])))
+    outcome = yield
+    if stats is not None:
+        report = outcome.get_result()
+        report.network_stats = {
+            "requests": stats["requests"],
+            "transferred": stats["transferred"],
+            "blocked": len(stats["blocked"]),
+        }
+
+
+class NetworkReport:
+    """Controller-side totals for --network-report."""
+
+    def __init__(self):
+        self.tests = 0
+        self.requests = 0
+        self.transferred = 0
+        self.blocked = 0
+
+    def pytest_runtest_logreport(self, report):
+        stats = getattr(report, "network_stats", None)
+        if stats is None:
+            return
+        self.tests += 1
+        self.requests += stats["requests"]
+        self.transferred += stats["transferred"]
+        self.blocked += stats["blocked"]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        terminalreporter.write_sep("-", "network resources")
+        terminalreporter.write_line(
+            f"{self.tests} tests made {self.requests} requests "
+            f"({self.transferred / 1024:.1f} KiB transferred)"
+        )
+        terminalreporter.write_line(f"blocked {self.blocked} requests")
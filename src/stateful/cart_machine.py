@@ -0,0 +1,246 @@
+"""
+Model-based cart testing for SauceDemo automation.
+Drives ProductsPage and CartPage through random sequences of cart actions in
+one logged-in session, checks the badge and the cart contents against an
+in-memory model after every step, and shrinks a failing sequence to a
+minimal reproduction.
+"""
+
+import random
+import time
+from typing import NamedTuple, Optional
+from selenium.common.exceptions import WebDriverException
+from src.pages.cart_page import CartPage
+from src.pages.products_page import ProductsPage
+
+# Tries (one reset + replay each) the shrinker may spend on a failure.
+MAX_SHRINK_RUNS = 200
+
+
+class Step(NamedTuple):
+    """One action; item is set for add and remove."""
+
+    action: str
+    item: Optional[str] = None
+
+    def __str__(self):
+        return f"{self.action}({self.item!r})" if self.item else self.action
+
+
+class CartModel:
+    """What the app should show: the items in the cart and the current page."""
+
+    def __init__(self):
+        self.items = set()
+        self.page = "products"
+
+    def enabled(self, step):
+        """Return True if step can be taken from the current page."""
+        if step.action == "add":
+            return self.page == "products"
+        if step.action == "go_to_cart":
+            return self.page == "products"
+        if step.action == "continue_shopping":
+            return self.page == "cart"
+        return True
+
+    def apply(self, step):
+        """Update the model for step and return the expected action result."""
+        if step.action == "add":
+            added = step.item not in self.items
+            self.items.add(step.item)
+            return added
+        if step.action == "remove":
+            removed = step.item in self.items
+            self.items.discard(step.item)
+            return removed
+        if step.action == "go_to_cart":
+            self.page = "cart"
+        elif step.action == "continue_shopping":
+            self.page = "products"
+        return None
+
+
+class SequenceFailure(AssertionError):
+    """The app disagreed with the model (or errored) at steps[index]."""
+
+    def __init__(self, steps, index, message):
+        self.steps = list(steps)
+        self.index = index
+        self.message = message
+        super().__init__(self.describe())
+
+    def describe(self):
+        lines = [f"step {self.index + 1} of {len(self.steps)}: {self.message}"]
+        lines += [
+            f"{'>' if i == self.index else ' '} {i + 1:3d}. {step}"
+            for i, step in enumerate(self.steps)
+        ]
+        return "\n".join(lines)
+
+
+class CartMachine:
+    """Runs cart action sequences against the app and the model side by side."""
+
+    ACTIONS = ("add", "remove", "refresh", "go_to_cart", "continue_shopping")
+    # Relative odds of each action; cart changes dominate.
+    WEIGHTS = (4, 3, 1, 1, 1)
+
+    def __init__(self, products_page, items=None):
+        """
+        Initialize the machine on a logged-in products page.
+        :param products_page: ProductsPage of the session to drive
+        :param items: Item names the sequences use (default: the whole catalog)
+        """
+        self.products = products_page
+        self.cart = CartPage(
+            products_page.driver, products_page.timeout, products_page.base_url
+        )
+        self.items = list(items or ProductsPage.ITEM_IDS)
+        self._state = None
+        self.sequences_run = 0
+        self.steps_run = 0
+
+    def generate(self, rng, length):
+        """Return length random steps, each one enabled where it is taken."""
+        model = CartModel()
+        steps = []
+        while len(steps) < length:
+            action = rng.choices(self.ACTIONS, self.WEIGHTS)[0]
+            item = rng.choice(self.items) if action in ("add", "remove") else None
+            step = Step(action, item)
+            if model.enabled(step):
+                model.apply(step)
+                steps.append(step)
+        return steps
+
+    def reset(self):
+        """Empty the cart and reload the products page in one navigation."""
+        if self._state is None:
+            self._state = self.products.snapshot_state().with_cart([])
+        self.products.restore_state(self._state)
+        self.cart.invalidate_elements()
+
+    def run(self, steps):
+        """
+        Reset, then take steps, checking the app after each one. Steps that are
+        not enabled (as left behind by shrinking) are skipped.
+        Raises SequenceFailure at the first disagreement.
+        """
+        self.reset()
+        self.sequences_run += 1
+        model = CartModel()
+        for index, step in enumerate(steps):
+            if not model.enabled(step):
+                continue
+            expected = model.apply(step)
+            try:
+                result = self._perform(step, model)
+                if expected is not None and result != expected:
+                    raise SequenceFailure(
+                        steps, index, f"{step} returned {result}, model says {expected}"
+                    )
+                self._check(model, steps, index)
+            except WebDriverException as e:
+                raise SequenceFailure(steps, index, f"{type(e).__name__}: {e.msg}")
+            self.steps_run += 1
+
+    def _perform(self, step, model):
+        if step.action == "add":
+            return self.products.add_item_by_name(step.item)
+        if step.action == "remove":
+            if model.page == "cart":
+                return self.cart.remove_item_by_name(step.item)
+            return self.products.remove_item_by_name(step.item)
+        if step.action == "refresh":
+            page = self.cart if model.page == "cart" else self.products
+            page.refresh()
+        elif step.action == "go_to_cart":
+            self.products.go_to_cart()
+            self.cart.wait_until_ready()
+        elif step.action == "continue_shopping":
+            self.cart.continue_shopping()
+            self.products.invalidate_catalog()
+            self.products.invalidate_elements()
+            self.products.wait_until_ready()
+        return None
+
+    def _check(self, model, steps, index):
+        count = self.products.get_cart_count()
+        if count != len(model.items):
+            raise SequenceFailure(
+                steps, index, f"badge shows {count}, model has {len(model.items)}"
+            )
+        if model.page == "cart":
+            shown = set(self.cart.get_cart_items())
+        else:
+            self.products.invalidate_catalog()
+            shown = {
+                name
+                for name, item in self.products.catalog.items.items()
+                if item.in_cart
+            }
+        if shown != model.items:
+            raise SequenceFailure(
+                steps,
+                index,
+                f"cart shows {sorted(shown)}, model has {sorted(model.items)}",
+            )
+
+    def _fails(self, steps):
+        try:
+            self.run(steps)
+        except SequenceFailure as failure:
+            return failure
+        return None
+
+    def shrink(self, failure, max_runs=MAX_SHRINK_RUNS):
+        """
+        Return the smallest failing sequence found by dropping ever smaller
+        chunks of steps from failure.steps (within max_runs replays).
+        """
+        best = failure
+        steps = failure.steps[: failure.index + 1]
+        runs = 0
+        chunk = max(len(steps) // 2, 1)
+        while runs < max_runs:
+            start = 0
+            removed_any = False
+            while start < len(steps) and runs < max_runs:
+                candidate = steps[:start] + steps[start + chunk :]
+                runs += 1
+                smaller = self._fails(candidate) if candidate else None
+                if smaller is not None:
+                    best = smaller
+                    steps = candidate[: smaller.index + 1]
+                    removed_any = True
+                else:
+                    start += chunk
+            if chunk == 1 and not removed_any:
+                break
+            chunk = max(chunk // 2, 1)
+        return best
+
+    def explore(self, sequences, length, seed=None):
+        """
+        Run sequences random sequences of length steps. On a failure, shrink it
+        and raise the minimal SequenceFailure (its message includes the seed).
+        Returns a summary dict.
+        """
+        seed = seed if seed is not None else random.randrange(2**32)
+        rng = random.Random(seed)
+        started = time.perf_counter()
+        for _ in range(sequences):
+            steps = self.generate(rng, length)
+            failure = self._fails(steps)
+            if failure is not None:
+                minimal = self.shrink(failure)
+                minimal.message = f"{minimal.message} (seed {seed})"
+                minimal.args = (minimal.describe(),)
+                raise minimal
+        return {
+            "seed": seed,
+            "sequences": self.sequences_run,
+            "steps": self.steps_run,
+            "seconds": time.perf_counter() - started,
+        }
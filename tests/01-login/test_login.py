@@ -6,9 +6,11 @@ import pytest
 import logging
 from src.pages.login_page import LoginPage
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Images, fonts and analytics play no part in these assertions.
+pytestmark = pytest.mark.block_resources
+
 # Credentials are loaded from environment variables
 SAUCE_USERNAME = os.getenv("SAUCE_USERNAME")
 SAUCE_PASSWORD = os.getenv("SAUCE_PASSWORD")
@@ -1,16 +1,34 @@
+import functools
 import os
 import pytest
 from src.pages.login_page import LoginPage
 from src.pages.products_page import ProductsPage
 
 
-@pytest.fixture(scope="function")
-def login_and_go_to_products(driver):
-    username = os.getenv("SAUCE_USERNAME")
-    password = os.getenv("SAUCE_PASSWORD")
-    login_page = LoginPage(driver)
-    login_page.load()
-    login_page.login(username, password)
+def _start_on_products(driver, injected_login, item_names=()):
     products_page = ProductsPage(driver)
+    if injected_login is not None:
+        cart = ProductsPage.item_ids(item_names) if item_names else None
+        injected_login.login(driver, products_page.url, cart=cart)
+    else:
+        username = os.getenv("SAUCE_USERNAME")
+        password = os.getenv("SAUCE_PASSWORD")
+        login_page = LoginPage(driver)
+        login_page.load()
+        login_page.login(username, password)
+        if item_names:
+            products_page.seed_cart(item_names)
+    assert products_page.wait_until_ready()
     assert "inventory" in driver.current_url
     return products_page
+
+
+@pytest.fixture(scope="function")
+def login_and_go_to_products(driver, injected_login):
+    return _start_on_products(driver, injected_login)
+
+
+@pytest.fixture(scope="function")
+def products_with_cart(driver, injected_login):
+    """Call with item names to start on the products page with them already in the cart."""
+    return functools.partial(_start_on_products, driver, injected_login)
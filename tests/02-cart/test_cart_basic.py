@@ -5,11 +5,13 @@ import pytest
 import logging
 from src.pages.cart_page import CartPage
 from src.pages.products_page import ProductsPage
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 logger = logging.getLogger(__name__)
 
+# Images, fonts and analytics play no part in these assertions.
+pytestmark = pytest.mark.block_resources
+
 # List of product names used in cart tests
 ITEMS = [
     "Sauce Labs Backpack",
@@ -102,16 +104,12 @@ def test_add_same_item_multiple_times(login_and_go_to_products):
     item = ITEMS[0]
     logger.info(f"[test_add_same_item_multiple_times] Adding item: {item}")
     assert products_page.add_item_by_name(item), f"Failed to add item: {item}"
-    WebDriverWait(products_page.driver, 5).until(
-        lambda d: products_page.get_cart_count() == 1
-    )
+    assert products_page.wait_for_cart_count(1)
     logger.info(f"[test_add_same_item_multiple_times] Adding item again: {item}")
     assert not products_page.add_item_by_name(
         item
     ), f"Second add should fail for item: {item}"
-    WebDriverWait(products_page.driver, 5).until(
-        lambda d: products_page.get_cart_count() == 1
-    )
+    assert products_page.wait_for_cart_count(1)
     assert products_page.get_cart_count() == 1
     logger.info(
         "[test_add_same_item_multiple_times] Cart count is 1 after duplicate adds"
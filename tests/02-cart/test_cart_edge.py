@@ -4,11 +4,13 @@ import random
 from src.pages.cart_page import CartPage
 from src.pages.products_page import ProductsPage
 from src.pages.login_page import LoginPage
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 logger = logging.getLogger(__name__)
 
+# Images, fonts and analytics play no part in these assertions.
+pytestmark = pytest.mark.block_resources
+
 ITEMS = [
     "Sauce Labs Backpack",
     "Sauce Labs Bike Light",
@@ -49,31 +51,26 @@ def test_add_all_items_and_remove_all(login_and_go_to_products):
         "[test_add_all_items_and_remove_all] Starting test: add all and remove all"
     )
     products_page = login_and_go_to_products
-    for idx, item in enumerate(ITEMS):
-        logger.info(f"[test_add_all_items_and_remove_all] Adding item: {item}")
-        assert products_page.add_item_by_name(item), f"Failed to add item: {item}"
-        WebDriverWait(products_page.driver, 5).until(
-            lambda d: products_page.get_cart_count() == idx + 1
-        )
+    logger.info(f"[test_add_all_items_and_remove_all] Adding items: {ITEMS}")
+    added = products_page.add_items(ITEMS)
+    assert all(added.values()), f"Failed to add items: {added}"
     assert products_page.get_cart_count() == len(ITEMS)
     logger.info(
-        f"[test_add_all_items_and_remove_all] Cart count after adds: {products_page.get_cart_count()}"
+        f"[test_add_all_items_and_remove_all] Cart count after adds: {len(ITEMS)}"
     )
-    for idx, item in enumerate(ITEMS[::-1]):
-        logger.info(f"[test_add_all_items_and_remove_all] Removing item: {item}")
-        assert products_page.remove_item_by_name(item), f"Failed to remove item: {item}"
-        WebDriverWait(products_page.driver, 5).until(
-            lambda d: products_page.get_cart_count() == len(ITEMS) - (idx + 1)
-        )
+    logger.info(f"[test_add_all_items_and_remove_all] Removing items: {ITEMS[::-1]}")
+    removed = products_page.remove_items(ITEMS[::-1])
+    assert all(removed.values()), f"Failed to remove items: {removed}"
     assert products_page.get_cart_count() == 0
     logger.info("[test_add_all_items_and_remove_all] Cart count is 0 after removes")
     products_page.go_to_cart()
     cart_page = CartPage(products_page.driver)
-    cart_items = cart_page.get_cart_items()
+    snapshot = cart_page.get_cart_snapshot()
+    cart_items = cart_page.get_cart_items(snapshot)
     logger.info(
         f"[test_add_all_items_and_remove_all] Cart items after removes: {cart_items}"
     )
-    assert cart_page.is_cart_empty()
+    assert cart_page.is_cart_empty(snapshot)
     logger.info("[test_add_all_items_and_remove_all] Cart is empty. Test passed.")
 
 
@@ -88,29 +85,41 @@ def test_add_remove_random_order(login_and_go_to_products):
     products_page = login_and_go_to_products
     items = ITEMS[:]
     random.shuffle(items)
-    for idx, item in enumerate(items):
-        logger.info(f"[test_add_remove_random_order] Adding item: {item}")
-        assert products_page.add_item_by_name(item), f"Failed to add item: {item}"
-        WebDriverWait(products_page.driver, 5).until(
-            lambda d: products_page.get_cart_count() == idx + 1
-        )
+    logger.info(f"[test_add_remove_random_order] Adding items: {items}")
+    added = products_page.add_items(items)
+    assert all(added.values()), f"Failed to add items: {added}"
     assert products_page.get_cart_count() == len(ITEMS)
-    logger.info(
-        f"[test_add_remove_random_order] Cart count after adds: {products_page.get_cart_count()}"
-    )
+    logger.info(f"[test_add_remove_random_order] Cart count after adds: {len(ITEMS)}")
     random.shuffle(items)
-    for idx, item in enumerate(items):
-        logger.info(f"[test_add_remove_random_order] Removing item: {item}")
-        assert products_page.remove_item_by_name(item), f"Failed to remove item: {item}"
-        WebDriverWait(products_page.driver, 5).until(
-            lambda d: products_page.get_cart_count() == len(ITEMS) - (idx + 1)
-        )
+    logger.info(f"[test_add_remove_random_order] Removing items: {items}")
+    removed = products_page.remove_items(items)
+    assert all(removed.values()), f"Failed to remove items: {removed}"
     assert products_page.get_cart_count() == 0
     logger.info(
         "[test_add_remove_random_order] Cart count is 0 after removes. Test passed."
     )
 
 
+@pytest.mark.cart
+def test_add_items_reports_per_item_results(login_and_go_to_products):
+    """
+    Description: Test batch-adding an item already in the cart, a new item and an unknown item.
+    Expected Result: Only the new item is reported as added and the cart count is 2.
+    """
+    logger.info(
+        "[test_add_items_reports_per_item_results] Starting test: batch add results"
+    )
+    products_page = login_and_go_to_products
+    assert products_page.add_item_by_name(ITEMS[0]), f"Failed to add item: {ITEMS[0]}"
+    results = products_page.add_items([ITEMS[0], ITEMS[1], "Nonexistent Item"])
+    logger.info(f"[test_add_items_reports_per_item_results] Results: {results}")
+    assert results == {ITEMS[0]: False, ITEMS[1]: True, "Nonexistent Item": False}
+    assert products_page.get_cart_count() == 2
+    logger.info(
+        "[test_add_items_reports_per_item_results] Cart count is 2. Test passed."
+    )
+
+
 @pytest.mark.cart
 def test_remove_item_twice(login_and_go_to_products):
     """
@@ -142,7 +151,7 @@ def test_cart_badge_not_visible_when_empty(login_and_go_to_products):
     products_page = login_and_go_to_products
     assert products_page.get_cart_count() == 0
     logger.info("[test_cart_badge_not_visible_when_empty] Cart count is 0")
-    visible = products_page.is_visible(*ProductsPage.CART_BADGE)
+    visible = not products_page.wait_until_absent(*ProductsPage.CART_BADGE)
     logger.info(f"[test_cart_badge_not_visible_when_empty] Badge visible: {visible}")
     assert not visible
     logger.info(
@@ -164,9 +173,7 @@ def test_cart_badge_updates_each_action(login_and_go_to_products):
     for i, item in enumerate(ITEMS[:3], 1):
         logger.info(f"[test_cart_badge_updates_each_action] Adding item: {item}")
         assert products_page.add_item_by_name(item), f"Failed to add item: {item}"
-        WebDriverWait(products_page.driver, 5).until(
-            lambda d: products_page.get_cart_count() == i
-        )
+        assert products_page.wait_for_cart_count(i)
         count = products_page.get_cart_count()
         logger.info(
             f"[test_cart_badge_updates_each_action] Cart count after add: {count}"
@@ -175,9 +182,7 @@ def test_cart_badge_updates_each_action(login_and_go_to_products):
     for i, item in enumerate(reversed(ITEMS[:3]), 1):
         logger.info(f"[test_cart_badge_updates_each_action] Removing item: {item}")
         assert products_page.remove_item_by_name(item), f"Failed to remove item: {item}"
-        WebDriverWait(products_page.driver, 5).until(
-            lambda d: products_page.get_cart_count() == 3 - i
-        )
+        assert products_page.wait_for_cart_count(3 - i)
         count = products_page.get_cart_count()
         logger.info(
             f"[test_cart_badge_updates_each_action] Cart count after remove: {count}"
@@ -186,3 +191,26 @@ def test_cart_badge_updates_each_action(login_and_go_to_products):
     logger.info(
         "[test_cart_badge_updates_each_action] Badge updated correctly. Test passed."
     )
+
+
+@pytest.mark.cart
+def test_cached_element_reresolved_after_refresh(login_and_go_to_products):
+    """
+    Description: Test that a cached element handle is re-resolved once the page is refreshed.
+    Expected Result: The cart link handle is reused, and clicking it after a refresh still opens the cart.
+    """
+    logger.info(
+        "[test_cached_element_reresolved_after_refresh] Starting test: cached handle after refresh"
+    )
+    driver = login_and_go_to_products.driver
+    products_page = ProductsPage(driver, cache_elements=True)
+    link = products_page.find(*ProductsPage.CART_LINK)
+    assert products_page.find(*ProductsPage.CART_LINK) is link
+    driver.refresh()
+    logger.info("[test_cached_element_reresolved_after_refresh] Page refreshed")
+    assert products_page.wait_until_ready()
+    products_page.go_to_cart()
+    url = driver.current_url
+    logger.info(f"[test_cached_element_reresolved_after_refresh] Current URL: {url}")
+    assert "cart" in url
+    logger.info("[test_cached_element_reresolved_after_refresh] Test passed.")
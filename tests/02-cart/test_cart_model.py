@@ -0,0 +1,28 @@
+import pytest
+import logging
+from src.stateful.cart_machine import CartMachine
+
+logger = logging.getLogger(__name__)
+
+# Images, fonts and analytics play no part in these assertions.
+pytestmark = pytest.mark.block_resources
+
+
+@pytest.mark.cart
+@pytest.mark.slow
+def test_cart_matches_model_over_random_sequences(login_and_go_to_products, request):
+    """
+    Description: Test random sequences of add, remove, refresh, go-to-cart and continue-shopping steps in one session.
+    Expected Result: After every step the badge and the cart contents match the in-memory model; a failing sequence is reported shrunk to a minimal reproduction.
+    """
+    machine = CartMachine(login_and_go_to_products)
+    summary = machine.explore(
+        sequences=request.config.getoption("--cart-model-sequences"),
+        length=request.config.getoption("--cart-model-steps"),
+        seed=request.config.getoption("--cart-model-seed"),
+    )
+    logger.info(
+        f"[test_cart_matches_model_over_random_sequences] {summary['steps']} steps "
+        f"in {summary['sequences']} sequences ({summary['seconds']:.1f}s, seed {summary['seed']})"
+    )
+    assert summary["sequences"] == request.config.getoption("--cart-model-sequences")
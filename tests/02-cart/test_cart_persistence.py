@@ -1,3 +1,4 @@
+import os
 import pytest
 import logging
 from src.pages.cart_page import CartPage
@@ -6,6 +7,9 @@ from src.pages.login_page import LoginPage
 
 logger = logging.getLogger(__name__)
 
+# Images, fonts and analytics play no part in these assertions.
+pytestmark = pytest.mark.block_resources
+
 ITEMS = [
     "Sauce Labs Backpack",
     "Sauce Labs Bike Light",
@@ -18,7 +22,7 @@ ITEMS = [
 
 @pytest.mark.cart
 @pytest.mark.slow
-def test_cart_persistence_after_refresh(login_and_go_to_products):
+def test_cart_persistence_after_refresh(products_with_cart):
     """
     Description: Test that the cart retains items after a page refresh.
     Expected Result: The item remains in the cart after refreshing the page.
@@ -26,9 +30,8 @@ def test_cart_persistence_after_refresh(login_and_go_to_products):
     logger.info(
         "[test_cart_persistence_after_refresh] Starting test: persistence after refresh"
     )
-    products_page = login_and_go_to_products
-    products_page.add_item_by_name(ITEMS[0])
-    logger.info(f"[test_cart_persistence_after_refresh] Added item: {ITEMS[0]}")
+    products_page = products_with_cart([ITEMS[0]])
+    logger.info(f"[test_cart_persistence_after_refresh] Seeded cart with: {ITEMS[0]}")
     products_page.driver.refresh()
     logger.info("[test_cart_persistence_after_refresh] Page refreshed")
     count = products_page.get_cart_count()
@@ -48,7 +51,7 @@ def test_cart_persistence_after_refresh(login_and_go_to_products):
 
 @pytest.mark.cart
 @pytest.mark.slow
-def test_cart_persistence_after_navigation(login_and_go_to_products):
+def test_cart_persistence_after_navigation(products_with_cart):
     """
     Description: Test that the cart retains items after navigating away and back to the products page.
     Expected Result: The item remains in the cart after navigation.
@@ -56,10 +59,11 @@ def test_cart_persistence_after_navigation(login_and_go_to_products):
     logger.info(
         "[test_cart_persistence_after_navigation] Starting test: persistence after navigation"
     )
-    products_page = login_and_go_to_products
-    products_page.add_item_by_name(ITEMS[1])
-    logger.info(f"[test_cart_persistence_after_navigation] Added item: {ITEMS[1]}")
-    products_page.driver.get("https://www.saucedemo.com/inventory.html")
+    products_page = products_with_cart([ITEMS[1]])
+    logger.info(
+        f"[test_cart_persistence_after_navigation] Seeded cart with: {ITEMS[1]}"
+    )
+    products_page.load()
     logger.info(
         "[test_cart_persistence_after_navigation] Navigated back to inventory page"
     )
@@ -80,7 +84,7 @@ def test_cart_persistence_after_navigation(login_and_go_to_products):
 
 @pytest.mark.cart
 @pytest.mark.slow
-def test_continue_shopping_from_cart(login_and_go_to_products):
+def test_continue_shopping_from_cart(products_with_cart):
     """
     Description: Test the 'Continue Shopping' button from the cart page.
     Expected Result: User is returned to the products page and the cart retains its items.
@@ -88,9 +92,8 @@ def test_continue_shopping_from_cart(login_and_go_to_products):
     logger.info(
         "[test_continue_shopping_from_cart] Starting test: continue shopping from cart"
     )
-    products_page = login_and_go_to_products
-    products_page.add_item_by_name(ITEMS[0])
-    logger.info(f"[test_continue_shopping_from_cart] Added item: {ITEMS[0]}")
+    products_page = products_with_cart([ITEMS[0]])
+    logger.info(f"[test_continue_shopping_from_cart] Seeded cart with: {ITEMS[0]}")
     products_page.go_to_cart()
     cart_page = CartPage(products_page.driver)
     cart_page.find(*CartPage.CONTINUE_SHOPPING).click()
@@ -108,7 +111,7 @@ def test_continue_shopping_from_cart(login_and_go_to_products):
 
 @pytest.mark.cart
 @pytest.mark.slow
-def test_checkout_and_return_to_cart(login_and_go_to_products):
+def test_checkout_and_return_to_cart(products_with_cart):
     """
     Description: Test that items remain in the cart after starting checkout and returning to the cart page.
     Expected Result: The item remains in the cart after visiting the checkout page and returning.
@@ -116,14 +119,13 @@ def test_checkout_and_return_to_cart(login_and_go_to_products):
     logger.info(
         "[test_checkout_and_return_to_cart] Starting test: checkout and return to cart"
     )
-    products_page = login_and_go_to_products
-    products_page.add_item_by_name(ITEMS[0])
-    logger.info(f"[test_checkout_and_return_to_cart] Added item: {ITEMS[0]}")
+    products_page = products_with_cart([ITEMS[0]])
+    logger.info(f"[test_checkout_and_return_to_cart] Seeded cart with: {ITEMS[0]}")
     products_page.go_to_cart()
     cart_page = CartPage(products_page.driver)
     cart_page.find(*CartPage.CHECKOUT_BUTTON).click()
     logger.info("[test_checkout_and_return_to_cart] Clicked checkout button")
-    products_page.driver.get(CartPage.URL)
+    cart_page.load()
     logger.info("[test_checkout_and_return_to_cart] Navigated back to cart page")
     cart_items = cart_page.get_cart_items()
     logger.info(f"[test_checkout_and_return_to_cart] Cart items: {cart_items}")
@@ -133,7 +135,7 @@ def test_checkout_and_return_to_cart(login_and_go_to_products):
 
 @pytest.mark.cart
 @pytest.mark.slow
-def test_cart_persistence_after_clearing_cookies(login_and_go_to_products):
+def test_cart_persistence_after_clearing_cookies(products_with_cart):
     """
     Description: Test cart behavior after clearing cookies and refreshing.
     Expected Result: The cart is emptied or the user is logged out after cookies are cleared and the page is refreshed.
@@ -141,10 +143,9 @@ def test_cart_persistence_after_clearing_cookies(login_and_go_to_products):
     logger.info(
         "[test_cart_persistence_after_clearing_cookies] Starting test: persistence after clearing cookies"
     )
-    products_page = login_and_go_to_products
-    products_page.add_item_by_name(ITEMS[0])
+    products_page = products_with_cart([ITEMS[0]])
     logger.info(
-        f"[test_cart_persistence_after_clearing_cookies] Added item: {ITEMS[0]}"
+        f"[test_cart_persistence_after_clearing_cookies] Seeded cart with: {ITEMS[0]}"
     )
     products_page.driver.delete_all_cookies()
     logger.info("[test_cart_persistence_after_clearing_cookies] Deleted all cookies")
@@ -157,3 +158,87 @@ def test_cart_persistence_after_clearing_cookies(login_and_go_to_products):
     )
     assert count == 0 or "login" in url
     logger.info("[test_cart_persistence_after_clearing_cookies] Test passed.")
+
+
+@pytest.mark.cart
+@pytest.mark.slow
+def test_cart_restored_from_snapshot(products_with_cart):
+    """
+    Description: Test that a captured browser state brings back the cart after it was emptied.
+    Expected Result: Restoring the snapshot shows the original items on the products and cart pages.
+    """
+    logger.info(
+        "[test_cart_restored_from_snapshot] Starting test: restore cart from snapshot"
+    )
+    products_page = products_with_cart(ITEMS[:2])
+    state = products_page.snapshot_state()
+    products_page.seed_cart([])
+    assert products_page.get_cart_count() == 0
+    logger.info("[test_cart_restored_from_snapshot] Cart emptied")
+    products_page.restore_state(state)
+    count = products_page.get_cart_count()
+    logger.info(f"[test_cart_restored_from_snapshot] Cart count after restore: {count}")
+    assert count == 2
+    cart_page = CartPage(products_page.driver)
+    cart_page.restore_state(state)
+    cart_items = cart_page.get_cart_items()
+    logger.info(f"[test_cart_restored_from_snapshot] Cart items: {cart_items}")
+    assert sorted(cart_items) == sorted(ITEMS[:2])
+    logger.info("[test_cart_restored_from_snapshot] Test passed.")
+
+
+@pytest.mark.cart
+def test_restoring_empty_snapshot_clears_cart(products_with_cart):
+    """
+    Description: Test that restoring a snapshot taken with an empty cart empties a cart filled later.
+    Expected Result: After the restore the cart badge is gone and the count is 0.
+    """
+    logger.info(
+        "[test_restoring_empty_snapshot_clears_cart] Starting test: restore empty cart"
+    )
+    products_page = products_with_cart()
+    state = products_page.snapshot_state()
+    products_page.add_items(ITEMS[:2])
+    assert products_page.get_cart_count() == 2
+    logger.info("[test_restoring_empty_snapshot_clears_cart] Cart filled")
+    products_page.restore_state(state)
+    assert products_page.wait_until_absent(*ProductsPage.CART_BADGE)
+    assert products_page.get_cart_count() == 0
+    logger.info("[test_restoring_empty_snapshot_clears_cart] Test passed.")
+
+
+def _ui_login(driver):
+    login_page = LoginPage(driver)
+    login_page.load()
+    login_page.login(os.getenv("SAUCE_USERNAME"), os.getenv("SAUCE_PASSWORD"))
+    products_page = ProductsPage(driver)
+    assert products_page.wait_until_ready()
+    return products_page
+
+
+@pytest.mark.cart
+def test_pool_reset_clears_cart_left_off_origin(driver_pool):
+    """
+    Description: Test that a pooled browser released while showing another origin does not hand its cart to the next borrower.
+    Expected Result: After logging in again on the recycled browser the cart is empty.
+    """
+    logger.info(
+        "[test_pool_reset_clears_cart_left_off_origin] Starting test: pool reset"
+    )
+    driver = driver_pool.acquire()
+    try:
+        products_page = _ui_login(driver)
+        products_page.add_items(ITEMS[:2])
+        assert products_page.get_cart_count() == 2
+        driver.get("about:blank")
+    finally:
+        driver_pool.release(driver)
+    driver = driver_pool.acquire()
+    try:
+        count = _ui_login(driver).get_cart_count()
+    finally:
+        driver_pool.release(driver)
+    logger.info(
+        f"[test_pool_reset_clears_cart_left_off_origin] Cart count after reuse: {count}"
+    )
+    assert count == 0
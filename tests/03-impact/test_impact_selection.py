@@ -0,0 +1,234 @@
+import inspect
+import os
+import subprocess
+import pytest
+from src.pages.base_page import BasePage
+from src.plugins.impact_selection import (
+    ChangeMapper,
+    ImpactIndex,
+    changed_lines,
+    page_classes,
+    select,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CART_PAGE = os.path.join(ROOT, "src", "pages", "cart_page.py")
+BASE_PAGE = os.path.join(ROOT, "src", "pages", "base_page.py")
+PRODUCTS_PAGE = os.path.join(ROOT, "src", "pages", "products_page.py")
+
+
+class Item:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _line_of(path, text):
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            if text in line:
+                return number
+    raise AssertionError(f"{text!r} not in {path}")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("one\ntwo\nthree\nfour\n")
+    (tmp_path / "src" / "gone.py").write_text("x = 1\n")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG\x00\x01")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-qm", "base")
+    return tmp_path
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ImpactIndex(str(tmp_path / "impact.json"))
+    index.record("tests/test_cart.py::test_continue", {"CartPage.continue_shopping"})
+    index.record("tests/test_login.py::test_login", {"LoginPage.login"})
+    index.record(
+        "tests/test_products.py::test_add",
+        {"ProductsPage.add_items", "ProductsPage.catalog"},
+    )
+    return index
+
+
+def test_changed_lines_reports_modified_lines(repo):
+    """
+    Description: Test that a modified line is reported on the new side of the diff.
+    Expected Result: The changed file maps to the number of the edited line.
+    """
+    (repo / "src" / "a.py").write_text("one\nTWO\nthree\nfour\n")
+    assert changed_lines("HEAD", str(repo)) == {"src/a.py": {2}}
+
+
+def test_changed_lines_reports_pure_deletions(repo):
+    """
+    Description: Test that removing lines without adding any is still a change.
+    Expected Result: The lines either side of the removed line are reported.
+    """
+    (repo / "src" / "a.py").write_text("one\nthree\nfour\n")
+    assert changed_lines("HEAD", str(repo)) == {"src/a.py": {1, 2}}
+
+
+def test_changed_lines_keeps_deleted_files(repo):
+    """
+    Description: Test that a deleted file is not dropped from the diff.
+    Expected Result: The deleted file maps to None.
+    """
+    (repo / "src" / "gone.py").unlink()
+    assert changed_lines("HEAD", str(repo)) == {"src/gone.py": None}
+
+
+def test_changed_lines_keeps_binary_files(repo):
+    """
+    Description: Test that a changed binary file (no text hunks) is reported.
+    Expected Result: The binary file maps to an empty set of lines.
+    """
+    (repo / "logo.png").write_bytes(b"\x89PNG\x00\x02")
+    assert changed_lines("HEAD", str(repo)) == {"logo.png": set()}
+
+
+def test_changed_locator_maps_to_constant_and_its_readers():
+    """
+    Description: Test that changing a locator constant maps to the methods reading it.
+    Expected Result: CartPage.CONTINUE_SHOPPING and CartPage.continue_shopping are affected.
+    """
+    mapper = ChangeMapper(page_classes())
+    line = _line_of(CART_PAGE, "CONTINUE_SHOPPING = ")
+    assert mapper.symbols(CART_PAGE, {line}) == {
+        "CartPage.CONTINUE_SHOPPING",
+        "CartPage.continue_shopping",
+    }
+
+
+def test_changed_base_method_maps_to_every_inheriting_class():
+    """
+    Description: Test that changing a BasePage method affects it on every page class.
+    Expected Result: find is reported for BasePage and each of its subclasses.
+    """
+    mapper = ChangeMapper(page_classes())
+    line = inspect.getsourcelines(BasePage.find)[1] + 1
+    assert mapper.symbols(BASE_PAGE, {line}) == {
+        f"{cls.__name__}.find" for cls in page_classes()
+    }
+
+
+def test_changed_import_cannot_be_attributed():
+    """
+    Description: Test that a module-level change outside any member is not guessed at.
+    Expected Result: symbols returns None, so everything runs.
+    """
+    mapper = ChangeMapper(page_classes())
+    line = _line_of(CART_PAGE, "import ")
+    assert mapper.symbols(CART_PAGE, {line}) is None
+
+
+def test_changed_predicate_maps_to_inherited_readers():
+    """
+    Description: Test that a page's READY_PREDICATE maps to the BasePage method reading it.
+    Expected Result: ProductsPage.wait_until_ready is affected, as the tracer records it.
+    """
+    mapper = ChangeMapper(page_classes())
+    line = _line_of(PRODUCTS_PAGE, "INVENTORY_READY_PREDICATE = ")
+    assert mapper.symbols(PRODUCTS_PAGE, {line}) == {
+        "ProductsPage.READY_PREDICATE",
+        "ProductsPage.wait_until_ready",
+    }
+
+
+def test_constant_read_by_helper_class_cannot_be_attributed():
+    """
+    Description: Test that a constant only an untraced helper (Catalog) reads is not guessed at.
+    Expected Result: symbols returns None, so everything runs.
+    """
+    mapper = ChangeMapper(page_classes())
+    line = _line_of(PRODUCTS_PAGE, "CATALOG_SCRIPT = ") + 1
+    assert mapper.symbols(PRODUCTS_PAGE, {line}) is None
+
+
+def test_select_runs_catalog_tests_for_catalog_script_change(index):
+    """
+    Description: Test that editing CATALOG_SCRIPT does not deselect the tests using the catalog.
+    Expected Result: Every test is selected, including the products test.
+    """
+    items = [Item(nodeid) for nodeid in index.tests]
+    line = _line_of(PRODUCTS_PAGE, "CATALOG_SCRIPT = ") + 1
+    selected, deselected, reason = select(
+        items,
+        index,
+        {"src/pages/products_page.py": {line}},
+        ChangeMapper(page_classes()),
+        ROOT,
+    )
+    assert "tests/test_products.py::test_add" in [item.nodeid for item in selected]
+    assert deselected == []
+    assert "products_page.py" in reason
+
+
+def test_select_runs_only_tests_using_changed_symbols(index):
+    """
+    Description: Test that only tests whose recorded symbols changed are selected.
+    Expected Result: The cart test and the unindexed test run; the login test is deselected.
+    """
+    items = [
+        Item("tests/test_cart.py::test_continue"),
+        Item("tests/test_login.py::test_login"),
+        Item("tests/test_new.py::test_new"),
+    ]
+    line = _line_of(CART_PAGE, "CONTINUE_SHOPPING = ")
+    selected, deselected, _ = select(
+        items,
+        index,
+        {"src/pages/cart_page.py": {line}, "README.md": {1}},
+        ChangeMapper(page_classes()),
+        ROOT,
+    )
+    assert [item.nodeid for item in selected] == [
+        "tests/test_cart.py::test_continue",
+        "tests/test_new.py::test_new",
+    ]
+    assert [item.nodeid for item in deselected] == ["tests/test_login.py::test_login"]
+
+
+def test_select_runs_everything_for_deleted_files(index):
+    """
+    Description: Test that deleting a file outside the page index deselects nothing.
+    Expected Result: Every test is selected and the reason names the deleted file.
+    """
+    items = [Item(nodeid) for nodeid in index.tests]
+    for changes in (
+        {"src/plugins/event_log.py": None},
+        {"src/pages/cart_page.py": None},
+    ):
+        selected, deselected, reason = select(
+            items, index, changes, ChangeMapper(page_classes()), ROOT
+        )
+        assert selected == items and deselected == []
+        assert "deleted" in reason
+
+
+def test_select_runs_tests_of_changed_test_files(index):
+    """
+    Description: Test that a changed test file selects its own tests.
+    Expected Result: The login test runs although no page-object symbol changed.
+    """
+    items = [Item(nodeid) for nodeid in index.tests]
+    selected, _, _ = select(
+        items,
+        index,
+        {"tests/test_login.py": {3}},
+        ChangeMapper(page_classes()),
+        ROOT,
+    )
+    assert [item.nodeid for item in selected] == ["tests/test_login.py::test_login"]
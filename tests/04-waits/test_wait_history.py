@@ -0,0 +1,42 @@
+import time
+import pytest
+from selenium.common.exceptions import TimeoutException
+from src.pages.base_page import BasePage
+from src.pages.wait_history import MIN_SAMPLES, WaitHistory
+
+
+class Driver:
+    """Stand-in driver: the waits below only poll Python conditions."""
+
+
+def _slow_condition(seconds):
+    """Condition that holds once seconds have passed since its wait began."""
+    started = time.monotonic()
+    return lambda driver: time.monotonic() - started >= seconds
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    history = WaitHistory(str(tmp_path / "waits.json"))
+    monkeypatch.setattr(BasePage, "wait_history", history)
+    return history
+
+
+def test_timed_out_wait_raises_the_learned_deadline(history):
+    """
+    Description: Test that a key learned at 0.1s which then needs 2s recovers.
+    Expected Result: The first 2s wait times out at the learned 1s deadline, the
+    miss is recorded, and the next deadline is long enough for the wait to pass.
+    """
+    page = BasePage(Driver(), timeout=10)
+    key = page._history_key("slow")
+    for _ in range(MIN_SAMPLES):
+        history.record(key, 0.1)
+    assert history.deadline(key, page.timeout) == 1.0
+
+    with pytest.raises(TimeoutException):
+        page._until(_slow_condition(2), key="slow")
+    assert history.deadline(key, page.timeout) >= 2
+
+    assert page._until(_slow_condition(2), key="slow")
+    assert max(history.take_new()[key]) >= 2
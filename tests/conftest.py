@@ -1,21 +1,301 @@
+import functools
+import logging
+import os
 import pytest
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
 from dotenv import load_dotenv
+from src.drivers.browser_contexts import ContextPool, browser_address
+from src.drivers.browser_daemon import DaemonPool, is_running
+from src.drivers.driver_factory import create_chrome_driver, create_remote_driver
+from src.drivers.driver_pool import DriverPool
+from src.drivers.driver_resolver import resolve_chromedriver
+from src.drivers.grid import GridPool
+from src.drivers.profile_template import ProfileTemplate
+from src.local_app.server import LocalSauceDemo
+from src.pages.base_page import BasePage
+from src.pages.browser_state import BrowserState
+from src.pages.login_page import LoginPage
+from src.plugins.impact_selection import attribute_to_fixture
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# The Chrome the xdist controller shares with every worker under --browser-contexts.
+SHARED_BROWSER = pytest.StashKey()
+
+pytest_plugins = [
+    "src.plugins.duration_sharding",
+    "src.plugins.command_stats",
+    "src.plugins.resource_blocking",
+    "src.plugins.adaptive_waits",
+    "src.plugins.event_log",
+    "src.plugins.failure_diagnostics",
+    "src.plugins.impact_selection",
+]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("driver", "WebDriver session management")
+    group.addoption(
+        "--driver-pool-size",
+        type=int,
+        default=1,
+        help="Maximum number of warm browsers kept per worker (default: 1)",
+    )
+    group.addoption(
+        "--driver-max-uses",
+        type=int,
+        default=50,
+        help="Relaunch a pooled browser after this many tests (default: 50)",
+    )
+    group.addoption(
+        "--no-profile-template",
+        action="store_true",
+        default=False,
+        help="Start every browser on an empty profile instead of a clone of the "
+        "pre-warmed template",
+    )
+    group.addoption(
+        "--browser-daemon",
+        action="store_true",
+        default=os.getenv("SAUCE_BROWSER_DAEMON", "").lower() in ("1", "true", "yes"),
+        help="Borrow warm browsers from a running 'python -m "
+        "src.drivers.browser_daemon serve' instead of launching them",
+    )
+    group.addoption(
+        "--browser-contexts",
+        action="store_true",
+        default=False,
+        help="Give each test a fresh isolated browser context inside one Chrome "
+        "shared by every worker (--driver-pool-size caps each worker's contexts)",
+    )
+    group.addoption(
+        "--grid-url",
+        default=os.getenv("SELENIUM_GRID_URL"),
+        help="Run browsers on this Selenium Grid or standalone server; the pool "
+        "size follows its Chrome slots (default: SELENIUM_GRID_URL)",
+    )
+    group.addoption(
+        "--page-load-strategy",
+        choices=("normal", "eager", "none"),
+        default="eager",
+        help="When driver.get() returns; page objects then wait for their own "
+        "readiness check (default: eager)",
+    )
+    group.addoption(
+        "--login-mode",
+        choices=("inject", "ui"),
+        default="inject",
+        help="How non-login suites get a logged-in session: 'inject' replays a "
+        "session captured once per worker, 'ui' fills the login form every test",
+    )
+    group = parser.getgroup("app", "Application under test")
+    group.addoption(
+        "--local-app",
+        action="store_true",
+        default=os.getenv("SAUCE_LOCAL_APP", "").lower() in ("1", "true", "yes"),
+        help="Run against the bundled SauceDemo stand-in served on 127.0.0.1",
+    )
+    group.addoption(
+        "--app-url",
+        default=None,
+        help="Root URL of the app under test (default: SAUCE_BASE_URL or saucedemo.com)",
+    )
+    group = parser.getgroup("cart-model", "Model-based cart sequences")
+    group.addoption(
+        "--cart-model-sequences",
+        type=int,
+        default=20,
+        help="Random cart sequences run in one session (default: 20)",
+    )
+    group.addoption(
+        "--cart-model-steps",
+        type=int,
+        default=25,
+        help="Steps per cart sequence (default: 25)",
+    )
+    group.addoption(
+        "--cart-model-seed",
+        type=int,
+        default=None,
+        help="Seed for the cart sequences (default: random, reported on failure)",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--local-app"):
+        # The stand-in accepts the public SauceDemo demo credentials.
+        os.environ.setdefault("SAUCE_USERNAME", "standard_user")
+        os.environ.setdefault("SAUCE_PASSWORD", "secret_sauce")
+
+
+def _launches_browsers(config):
+    """True unless the browsers come from a running daemon or a Grid."""
+    if config.getoption("--browser-daemon") and is_running():
+        return False
+    return not config.getoption("--grid-url")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Under --browser-contexts, point every xdist worker at one shared Chrome."""
+    config = node.config
+    if not config.getoption("--browser-contexts") or not _launches_browsers(config):
+        return
+    host = config.stash.get(SHARED_BROWSER, None)
+    if host is None:
+        host = create_chrome_driver(
+            driver_path=resolve_chromedriver(),
+            network_log=config.getoption("--network-report"),
+            page_load_strategy=config.getoption("--page-load-strategy"),
+        )
+        config.stash[SHARED_BROWSER] = host
+    node.workerinput["browser_address"] = browser_address(host)
+
+
+def pytest_unconfigure(config):
+    host = config.stash.get(SHARED_BROWSER, None)
+    if host is not None:
+        host.quit()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_base_url(request):
+    """Start the local stand-in if requested and point the page objects at the app."""
+    if request.config.getoption("--local-app"):
+        app = LocalSauceDemo()
+        BasePage.set_base_url(app.start())
+        yield BasePage.base_url
+        app.stop()
+        return
+    app_url = request.config.getoption("--app-url")
+    if app_url:
+        BasePage.set_base_url(app_url)
+    yield BasePage.base_url
+
+
+@pytest.fixture(scope="session")
+def chromedriver_path():
+    return resolve_chromedriver()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, app_base_url):
+    if request.config.getoption("--browser-daemon"):
+        if is_running():
+            pool = DaemonPool(origins=(app_base_url,))
+            yield pool
+            pool.close()
+            return
+        logger.warning("[BrowserDaemon] No daemon running; launching browsers locally")
+    grid_url = request.config.getoption("--grid-url")
+    if grid_url:
+        factory = functools.partial(
+            create_remote_driver,
+            grid_url,
+            network_log=request.config.getoption("--network-report"),
+            page_load_strategy=request.config.getoption("--page-load-strategy"),
+        )
+        workers = getattr(request.config, "workerinput", {}).get("workercount", 1)
+        pool = GridPool(
+            grid_url,
+            factory,
+            workers=workers,
+            max_uses=request.config.getoption("--driver-max-uses"),
+            origins=(app_base_url,),
+        )
+        yield pool
+        pool.close()
+        return
+    contexts = request.config.getoption("--browser-contexts")
+    address = getattr(request.config, "workerinput", {}).get("browser_address")
+    if contexts and address is not None:
+        # The controller launched the Chrome; this worker only opens contexts in it.
+        pool = ContextPool(
+            None, size=request.config.getoption("--driver-pool-size"), address=address
+        )
+        yield pool
+        pool.close()
+        logger.info(f"[ContextPool] Contexts and footprint: {pool.summary()}")
+        return
+    chromedriver_path = request.getfixturevalue("chromedriver_path")
+    factory = functools.partial(
+        create_chrome_driver,
+        driver_path=chromedriver_path,
+        network_log=request.config.getoption("--network-report"),
+        page_load_strategy=request.config.getoption("--page-load-strategy"),
+    )
+    template = None
+    if not request.config.getoption("--no-profile-template"):
+        workers = getattr(request.config, "workerinput", {}).get("workercount", 1)
+        clones = 1
+        if not contexts:
+            clones = request.config.getoption("--driver-pool-size") * workers
+        factory = template = ProfileTemplate(
+            factory, warm_url=app_base_url, clones=clones
+        )
+    if contexts:
+        pool = ContextPool(factory, size=request.config.getoption("--driver-pool-size"))
+    else:
+        pool = DriverPool(
+            factory,
+            size=request.config.getoption("--driver-pool-size"),
+            max_uses=request.config.getoption("--driver-max-uses"),
+            origins=(app_base_url,),
+        )
+    yield pool
+    pool.close()
+    if isinstance(pool, ContextPool):
+        logger.info(f"[ContextPool] Contexts and footprint: {pool.summary()}")
+    if template is not None:
+        logger.info(f"[ProfileTemplate] Startup timings: {template.summary()}")
+        template.close()
+
+
+class InjectedLogin:
+    """Logs in through the UI once, then replays the captured session state."""
+
+    def __init__(self, username, password):
+        self.username = username
+        self.password = password
+        self.state = None
+
+    def login(self, driver, url, cart=None):
+        """
+        Start driver logged in on url, re-capturing the session once it expires.
+        :param cart: Inventory ids to seed the cart with, in the same navigation
+        """
+        if self.state is None or self.state.is_expired():
+            # Every test using injected_login depends on this UI login.
+            with attribute_to_fixture("injected_login"):
+                login_page = LoginPage(driver)
+                login_page.load()
+                login_page.login(self.username, self.password)
+            self.state = BrowserState.capture(driver)
+            if cart is None:
+                if driver.current_url != url:
+                    driver.get(url)
+                return
+        state = self.state if cart is None else self.state.with_cart(cart)
+        state.apply(driver, url)
+
+
+@pytest.fixture(scope="session")
+def injected_login(request):
+    """Per-worker login replayer, or None when --login-mode=ui."""
+    if request.config.getoption("--login-mode") != "inject":
+        return None
+    return InjectedLogin(os.getenv("SAUCE_USERNAME"), os.getenv("SAUCE_PASSWORD"))
+
 
 @pytest.fixture(scope="function")
-def driver():
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    service = ChromeService(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.implicitly_wait(5)
+def driver(driver_pool, command_recorder, resource_blocking):
+    driver = driver_pool.acquire()
+    resource_blocking.attach(driver)
+    if command_recorder is not None:
+        command_recorder.attach(driver)
     yield driver
-    driver.quit()
+    if command_recorder is not None:
+        command_recorder.detach()
+    resource_blocking.detach()
+    driver_pool.release(driver)